@@ -0,0 +1,137 @@
+"""
+계정 삭제(정리) 작업 모듈
+
+이 파일의 역할:
+1. 삭제를 요청한 계정의 할일과 보관된 할일을 정해진 개수씩 나눠서 지웁니다
+2. 할일을 모두 지운 뒤 계정(users 행)을 삭제합니다
+3. 백그라운드 스레드에서 삭제 요청이 들어오면 바로, 그 외에는 주기적으로 실행합니다
+
+초보자를 위한 설명:
+- ORM으로 사용자를 삭제하면(db.delete(user)) 연결된 할일을 모두 메모리로 읽어 와
+  한 행씩 지우므로, 할일이 수십만 개인 계정은 메모리와 시간이 아주 많이 듭니다
+- 그래서 삭제 요청 시에는 계정을 비활성화(is_active=False)하고 요청 일시만 기록합니다
+  → 바로 로그인/토큰 사용이 막히고, 응답도 즉시 돌아갑니다
+- 실제 삭제는 이 작업이 batch_size개씩 "ID 조회 후 한 번에 삭제"로 나눠서 하고,
+  매번 커밋하므로 메모리 사용량과 잠금 시간이 일정하게 유지됩니다
+- 서버가 중간에 재시작되어도 deleted_at이 남아 있으므로 다음 실행에서 이어서 지웁니다
+"""
+
+import os
+import threading
+
+from sqlalchemy import select
+
+from . import models
+from .cache import todo_cache
+from .database import SessionLocal
+
+# ====== 계정 삭제 설정 ======
+
+# 한 트랜잭션에서 지울 최대 행 수
+ACCOUNT_PURGE_BATCH_SIZE = int(os.getenv("ACCOUNT_PURGE_BATCH_SIZE", "1000"))
+
+# 남은 삭제 요청을 확인하는 간격 (초) - 새 삭제 요청은 기다리지 않고 바로 처리합니다
+ACCOUNT_PURGE_INTERVAL_SEC = float(os.getenv("ACCOUNT_PURGE_INTERVAL_SEC", "300"))
+
+def _delete_owned_rows(db, model, user_id: int, batch_size: int) -> int:
+    """사용자의 행을 batch_size개씩 나눠서 지우고 지운 행 수를 반환합니다"""
+    deleted = 0
+    while True:
+        ids = db.execute(
+            select(model.id).where(model.owner_id == user_id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+
+        db.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        deleted += len(ids)
+
+        if len(ids) < batch_size:
+            break
+    return deleted
+
+def purge_account(db, user_id: int, batch_size: int = ACCOUNT_PURGE_BATCH_SIZE) -> int:
+    """
+    삭제를 요청한 계정의 할일과 보관된 할일을 나눠서 지운 뒤 계정을 삭제합니다
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 삭제할 사용자 ID
+        batch_size: 한 트랜잭션에서 지울 최대 행 수
+
+    Returns:
+        int: 지운 할일 수 (보관된 할일 포함)
+    """
+    deleted = _delete_owned_rows(db, models.Todo, user_id, batch_size)
+    deleted += _delete_owned_rows(db, models.ArchivedTodo, user_id, batch_size)
+    todo_cache.invalidate_owner(user_id)
+
+    # 할일을 모두 지웠으므로 계정 행만 지우면 됩니다 (삭제 요청이 있는 계정만)
+    db.query(models.User).filter(
+        models.User.id == user_id,
+        models.User.deleted_at.is_not(None)
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+class AccountPurgeWorker:
+    """
+    삭제 요청된 계정을 정리하는 백그라운드 스레드
+
+    request()를 호출하면 주기를 기다리지 않고 바로 실행합니다.
+    start()로 시작하고 stop()으로 멈춥니다. 서버 시작/종료 시 호출됩니다.
+    """
+
+    def __init__(self, interval: float = ACCOUNT_PURGE_INTERVAL_SEC):
+        self.interval = interval
+        self.purged_accounts = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def request(self):
+        """새 삭제 요청이 있음을 알려 바로 실행하게 합니다"""
+        self._wake.set()
+
+    def run_once(self) -> int:
+        """삭제 요청된 계정을 모두 정리하고 정리한 계정 수를 반환합니다"""
+        db = SessionLocal()
+        try:
+            user_ids = db.execute(
+                select(models.User.id).where(models.User.deleted_at.is_not(None))
+            ).scalars().all()
+            for user_id in user_ids:
+                purge_account(db, user_id)
+        finally:
+            db.close()
+        self.purged_accounts += len(user_ids)
+        return len(user_ids)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                purged = self.run_once()
+                if purged:
+                    print(f"🗑️ 삭제 요청된 계정 {purged}개를 정리했습니다")
+            except Exception as error:
+                # 한 번 실패해도 다음 주기에 다시 시도합니다
+                print(f"⚠️ 계정 정리 작업 실패: {error}")
+            self._wake.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="account-purger", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+# 애플리케이션 전체에서 공유하는 계정 정리 작업
+account_purge_worker = AccountPurgeWorker()
@@ -0,0 +1,207 @@
+"""
+요청 수용 제어(Admission Control) 모듈
+
+이 파일의 역할:
+1. 요청 종류(route class)별로 동시에 처리할 수 있는 요청 수를 제한합니다
+2. 한도를 넘는 요청은 정해진 길이의 대기열에서 정해진 시간까지만 기다립니다
+3. 대기열이 가득 찼거나 시간이 지나면 바로 503 + Retry-After로 응답합니다
+4. 대기열 길이 등 상태를 확인할 수 있는 통계를 제공합니다
+
+초보자를 위한 설명:
+- 데이터베이스 연결은 기본 15개(풀 5 + 추가 10)뿐입니다
+- 요청이 몰리면 연결을 기다리는 요청이 쌓여 30초 타임아웃까지 모두 느려집니다
+- 미리 처리 가능한 만큼만 받아들이고 나머지는 빨리 거절하면,
+  받아들인 요청은 여전히 빠르게 처리되고 클라이언트는 잠시 후 다시 시도할 수 있습니다
+- 로드 셰딩(load shedding): 과부하 시 일부 요청을 버려서 전체가 무너지는 것을 막는 기법
+"""
+
+import asyncio
+import math
+import os
+from typing import Optional
+
+from starlette.responses import JSONResponse
+
+# ====== 요청 종류별 한도 설정 ======
+# 동시 처리 수의 합이 DB 연결 수(기본 15)를 넘지 않도록 나눕니다
+
+ADMISSION_LIMITS = {
+    # 로그인/회원가입: bcrypt로 CPU를 많이 쓰므로 적게
+    # (가입 가능 여부 확인도 사용자명/이메일을 대량으로 알아내는 데 쓰이지 않도록 여기에 포함)
+    "auth": (
+        int(os.getenv("ADMISSION_AUTH_CONCURRENCY", "3")),
+        int(os.getenv("ADMISSION_AUTH_QUEUE", "10")),
+    ),
+    # 조회(GET) 요청
+    "read": (
+        int(os.getenv("ADMISSION_READ_CONCURRENCY", "8")),
+        int(os.getenv("ADMISSION_READ_QUEUE", "50")),
+    ),
+    # 생성/수정/삭제 요청
+    "write": (
+        int(os.getenv("ADMISSION_WRITE_CONCURRENCY", "4")),
+        int(os.getenv("ADMISSION_WRITE_QUEUE", "20")),
+    ),
+}
+
+# 대기열에서 기다릴 수 있는 최대 시간 (초) - 이 시간이 p99 지연의 상한이 됩니다
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "2"))
+
+# 수용 제어를 적용하지 않는 경로 (문서, 상태 확인 등)
+# /metrics/로 시작하는 통계 경로와 DB를 쓰지 않는 /app/ 정적 파일도 제외
+ADMISSION_EXEMPT_PATHS = ("/", "/docs", "/redoc", "/openapi.json")
+
+class ConcurrencyLimiter:
+    """
+    동시 처리 수 한도와 길이 제한이 있는 대기열을 가진 리미터
+
+    Args:
+        name: 요청 종류 이름 (통계 표시용)
+        limit: 동시에 처리할 수 있는 최대 요청 수
+        max_queue: 대기열에서 기다릴 수 있는 최대 요청 수
+        queue_timeout: 대기열에서 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(limit)
+
+        # 통계
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    async def acquire(self) -> bool:
+        """
+        처리 자리를 얻습니다
+
+        Returns:
+            bool: 자리를 얻었으면 True, 대기열이 가득 찼거나 시간 초과면 False
+        """
+        if self._semaphore.locked():
+            if self.queued >= self.max_queue:
+                self.rejected_queue_full += 1
+                return False
+
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected_timeout += 1
+                return False
+            finally:
+                self.queued -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self):
+        """처리가 끝난 요청의 자리를 반환합니다"""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def retry_after(self) -> int:
+        """클라이언트에게 안내할 재시도 대기 시간 (초)"""
+        return max(1, math.ceil(self.queue_timeout))
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+def classify_request(method: str, path: str) -> Optional[str]:
+    """
+    요청을 종류(route class)로 분류합니다
+
+    Args:
+        method: HTTP 메서드
+        path: 요청 경로
+
+    Returns:
+        Optional[str]: "auth", "read", "write" 중 하나, 제한하지 않을 요청이면 None
+    """
+    if method == "OPTIONS" or path in ADMISSION_EXEMPT_PATHS or path.startswith(("/metrics/", "/app/")):
+        return None
+    if path in ("/login", "/signup", "/users/available"):
+        return "auth"
+    if method in ("GET", "HEAD"):
+        return "read"
+    return "write"
+
+# 애플리케이션 전체에서 공유하는 요청 종류별 리미터
+limiters = {
+    name: ConcurrencyLimiter(name, limit, max_queue, ADMISSION_QUEUE_TIMEOUT)
+    for name, (limit, max_queue) in ADMISSION_LIMITS.items()
+}
+
+# 요청이 얻은 처리 자리(리미터)를 scope에 기록해 두는 키
+ADMISSION_SCOPE_KEY = "admission.limiter"
+
+def release_request_slot(scope: dict):
+    """
+    요청이 얻은 처리 자리를 미리 반환합니다 (이미 반환했으면 아무것도 하지 않음)
+
+    /batch처럼 하위 요청마다 자리를 따로 얻는 요청이, 자기 자리를 붙잡은 채
+    여러 하위 요청을 실행하지 않도록 처리 시작 전에 호출합니다.
+    """
+    limiter = scope.pop(ADMISSION_SCOPE_KEY, None)
+    if limiter is not None:
+        limiter.release()
+
+def admission_stats() -> dict:
+    """요청 종류별 수용 제어 통계를 반환합니다"""
+    return {name: limiter.stats() for name, limiter in limiters.items()}
+
+class AdmissionControlMiddleware:
+    """
+    요청 종류별로 동시 처리 수를 제한하는 ASGI 미들웨어
+
+    한도를 넘으면 대기열에서 기다리고, 대기열이 가득 찼거나
+    시간이 초과되면 라우트를 실행하지 않고 바로 503으로 응답합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify_request(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = limiters[route_class]
+        if not await limiter.acquire():
+            response = JSONResponse(
+                {"detail": "요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도해주세요"},
+                status_code=503,
+                headers={"Retry-After": str(limiter.retry_after())},
+            )
+            await response(scope, receive, send)
+            return
+
+        scope[ADMISSION_SCOPE_KEY] = limiter
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            release_request_slot(scope)
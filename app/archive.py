@@ -0,0 +1,181 @@
+"""
+완료된 할일 보관(Archival) 작업 모듈
+
+이 파일의 역할:
+1. 완료된 지 오래된 할일을 todos 테이블에서 archived_todos 테이블로 옮깁니다
+2. 한 번에 정해진 개수씩(batch) 옮겨서 DB 잠금 시간을 짧게 유지합니다
+3. 서버가 실행되는 동안 백그라운드에서 주기적으로 보관 작업을 실행합니다
+
+초보자를 위한 설명:
+- 완료된 할일이 todos 테이블에 계속 쌓이면, 목록 조회 때마다 정렬할 행이 늘어납니다
+- 오래된 완료 할일을 다른 테이블로 옮기면 자주 조회하는 테이블이 작게 유지되어
+  계정을 오래 사용해도 목록 조회 속도가 일정합니다
+- 옮긴 할일은 /todos/archived에서 볼 수 있고, 되돌릴 수도 있습니다
+- 워커가 여러 개여도 DB의 실행권(leases.py)을 얻은 워커 하나만 보관 작업을 실행합니다
+"""
+
+import os
+import threading
+from datetime import timedelta
+
+from sqlalchemy import insert, select
+
+from . import models
+from .cache import todo_cache
+from .database import SessionLocal
+from .leases import release_lease, try_acquire_lease
+
+# ====== 보관 설정 ======
+
+# 보관 작업 실행 여부 (false로 설정하면 백그라운드 작업을 시작하지 않음)
+ARCHIVE_ENABLED = os.getenv("ARCHIVE_ENABLED", "true").lower() == "true"
+
+# 완료 후 이 기간(일)이 지난 할일을 보관합니다
+ARCHIVE_AFTER_DAYS = float(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+
+# 한 트랜잭션에서 옮길 최대 할일 수
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+
+# 보관 작업 실행 간격 (초)
+ARCHIVE_INTERVAL_SEC = float(os.getenv("ARCHIVE_INTERVAL_SEC", "3600"))
+
+# 작업 실행권 이름과 유지 시간 (초) - 한 번의 보관 작업이 이 시간 안에 끝난다고 봅니다
+ARCHIVE_LEASE_NAME = "archive"
+ARCHIVE_LEASE_TTL_SEC = float(os.getenv("ARCHIVE_LEASE_TTL_SEC", "600"))
+
+def backfill_legacy_rows(db) -> int:
+    """
+    예전 버전에서 만든 행의 빈 컬럼을 채웁니다
+
+    - 완료 일시 기록 기능 이전에 완료된 할일은 completed_at이 비어 있어 보관 대상 조건
+      (completed_at < 기준 일시)에 걸리지 않으므로, 지금 시각으로 채워 보관 기간이 지금부터 시작되게 합니다
+    - 원래 ID를 그대로 보관 ID로 쓰던 시절의 보관 행은 original_id에 그 ID를 채웁니다
+
+    Returns:
+        int: completed_at을 채운 할일 수
+    """
+    Todo, ArchivedTodo = models.Todo, models.ArchivedTodo
+    filled = db.query(Todo).filter(
+        Todo.completed.is_(True), Todo.completed_at.is_(None)
+    ).update({Todo.completed_at: models.get_kst_now().replace(tzinfo=None)}, synchronize_session=False)
+    db.query(ArchivedTodo).filter(ArchivedTodo.original_id.is_(None)).update(
+        {ArchivedTodo.original_id: ArchivedTodo.id}, synchronize_session=False
+    )
+    db.commit()
+    return filled
+
+def archive_completed_todos(
+    db,
+    older_than: timedelta = timedelta(days=ARCHIVE_AFTER_DAYS),
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+) -> int:
+    """
+    완료된 지 older_than 이상 지난 할일을 보관 테이블로 옮깁니다
+
+    batch_size개씩 "복사 후 삭제"를 하나의 트랜잭션으로 처리하고 바로 커밋하므로,
+    옮길 할일이 많아도 한 번에 오래 잠그지 않습니다.
+    보관 테이블은 자체 ID를 새로 받고, 원래 ID는 original_id에 남깁니다.
+    
+    고른 할일은 행 잠금을 지원하는 DB에서 잠가 두고(사용자가 수정 중인 행은 건너뜀),
+    복사와 삭제에서도 "완료 + 오래됨" 조건을 다시 확인하므로
+    그사이 완료를 취소하거나 수정한 할일은 보관되지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        older_than: 완료 후 보관까지의 기간
+        batch_size: 한 트랜잭션에서 옮길 최대 할일 수
+
+    Returns:
+        int: 옮긴 할일 수
+    """
+    Todo = models.Todo
+    # DB에 저장된 일시와 같은 형식(시간대 없는 한국 시간)으로 비교합니다
+    cutoff = models.get_kst_now().replace(tzinfo=None) - older_than
+    archivable = (Todo.completed.is_(True), Todo.completed_at < cutoff)
+    moved = 0
+
+    while True:
+        rows = db.execute(
+            select(Todo.id, Todo.owner_id)
+            .where(*archivable)
+            .order_by(Todo.completed_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not rows:
+            break
+
+        ids = [row.id for row in rows]
+        db.execute(
+            insert(models.ArchivedTodo).from_select(
+                ["original_id", "title", "description", "priority", "created_at", "completed_at", "due_at", "owner_id"],
+                select(
+                    Todo.id, Todo.title, Todo.description, Todo.priority,
+                    Todo.created_at, Todo.completed_at, Todo.due_at, Todo.owner_id
+                ).where(Todo.id.in_(ids), *archivable)
+            )
+        )
+        moved += db.query(Todo).filter(Todo.id.in_(ids), *archivable).delete(synchronize_session=False)
+        db.commit()
+
+        for owner_id in {row.owner_id for row in rows}:
+            todo_cache.invalidate_owner(owner_id)
+
+        if len(ids) < batch_size:
+            break
+
+    return moved
+
+class ArchiveWorker:
+    """
+    보관 작업을 주기적으로 실행하는 백그라운드 스레드
+
+    start()로 시작하고 stop()으로 멈춥니다. 서버 시작/종료 시 호출됩니다.
+    """
+
+    def __init__(self, interval: float = ARCHIVE_INTERVAL_SEC):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self) -> int:
+        """
+        보관 작업을 한 번 실행하고 옮긴 할일 수를 반환합니다
+
+        다른 워커가 실행 중이면(실행권을 얻지 못하면) 건너뛰고 0을 반환합니다.
+        """
+        if not try_acquire_lease(ARCHIVE_LEASE_NAME, ARCHIVE_LEASE_TTL_SEC):
+            return 0
+        db = SessionLocal()
+        try:
+            backfill_legacy_rows(db)
+            return archive_completed_todos(db)
+        finally:
+            db.close()
+            release_lease(ARCHIVE_LEASE_NAME)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                moved = self.run_once()
+                if moved:
+                    print(f"📦 완료된 할일 {moved}개를 보관했습니다")
+            except Exception as error:
+                # 한 번 실패해도 다음 주기에 다시 시도합니다
+                print(f"⚠️ 할일 보관 작업 실패: {error}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="todo-archiver", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+# 애플리케이션 전체에서 공유하는 보관 작업
+archive_worker = ArchiveWorker()
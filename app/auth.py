@@ -10,24 +10,34 @@
 - JWT: JSON Web Token, 사용자 인증 정보를 안전하게 전달하는 토큰
 - 해시: 비밀번호를 암호화하여 저장하는 방법
 - 의존성 주입: FastAPI에서 자동으로 인증을 확인하는 방법
+- passlib(비밀번호 해싱)과 JWT 라이브러리는 처음 사용할 때 불러와서 서버 시작을 빠르게 합니다
 """
 
+import hmac
+import ipaddress
 import os
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from . import models
-from .database import get_db
+from .database import BATCH_SCOPE_KEY, SessionLocal, get_db
+from .jwt_backend import TokenError, get_jwt_backend
 
 # ====== 보안 설정 ======
 
-# 비밀번호 해싱을 위한 설정
-# bcrypt: 안전한 해시 알고리즘
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비밀번호 해싱 설정 (passlib CryptContext)
+# 라운드가 정해진 뒤에 만들어지며, 그 전에는 None입니다 (get_password_context() 참고)
+_pwd_context = None
+_pwd_context_lock = threading.Lock()
+
+# 자동 보정이 끝나기 전에 쓰는 하한선 라운드 설정 (요청이 보정을 기다리지 않게)
+_floor_pwd_context = None
+
+# 고정할 bcrypt 라운드 (비워두면 CPU에 맞춰 자동 보정)
+BCRYPT_ROUNDS = os.getenv("BCRYPT_ROUNDS")
 
 # HTTP Bearer 토큰 스키마 (Authorization: Bearer <token> 형식)
 security = HTTPBearer()
@@ -35,11 +45,50 @@ security = HTTPBearer()
 # JWT 토큰 설정
 # 환경변수에서 비밀키를 가져오거나 기본값 사용
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here-change-in-production")
-ALGORITHM = "HS256"  # JWT 서명 알고리즘
 ACCESS_TOKEN_EXPIRE_MINUTES = 30  # 토큰 만료 시간 (30분)
 
+# 통계(/metrics/*) 조회용 토큰 (X-Metrics-Token 헤더로 보냄)
+# 비워두면 서버 자신(localhost)에서 프록시를 거치지 않고 직접 보낸 요청만 허용합니다
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
 # ====== 비밀번호 관련 함수들 ======
 
+def _build_password_context(rounds: int):
+    """주어진 bcrypt 라운드로 비밀번호 해싱 설정을 만듭니다"""
+    from passlib.context import CryptContext
+
+    # bcrypt: 안전한 해시 알고리즘
+    return CryptContext(
+        schemes=["bcrypt"], deprecated="auto",
+        bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds
+    )
+
+def get_password_context():
+    """
+    비밀번호 해싱 설정을 반환합니다 (처음 호출할 때 한 번만 만듦)
+
+    passlib을 불러오는 데 시간이 걸리므로 서버 시작 시점이 아니라 처음 필요할 때 준비합니다.
+    BCRYPT_ROUNDS 환경변수가 있으면 그 값을 하한선~상한선 범위로 맞춰 사용합니다.
+    없으면 CPU 측정(약 1초)은 요청 처리 중에 하지 않고 configure_password_hashing()에 맡기며,
+    측정이 끝나기 전에는 하한선(BCRYPT_MIN_ROUNDS) 설정을 씁니다.
+    결정된 라운드보다 낮은 기존 해시는 needs_update()가 True가 되어
+    다음 로그인 때 새 라운드로 다시 해시됩니다.
+    """
+    global _pwd_context, _floor_pwd_context
+    if _pwd_context is not None:
+        return _pwd_context
+    with _pwd_context_lock:
+        if _pwd_context is not None:
+            return _pwd_context
+        from .bcrypt_calibration import BCRYPT_MIN_ROUNDS, clamp_rounds
+
+        if BCRYPT_ROUNDS:
+            _pwd_context = _build_password_context(clamp_rounds(int(BCRYPT_ROUNDS)))
+            return _pwd_context
+        if _floor_pwd_context is None:
+            _floor_pwd_context = _build_password_context(BCRYPT_MIN_ROUNDS)
+        return _floor_pwd_context
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     입력받은 비밀번호가 해시된 비밀번호와 일치하는지 확인
@@ -51,7 +100,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: 비밀번호가 일치하면 True, 아니면 False
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_password_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
@@ -63,7 +112,50 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: 해시화된 비밀번호
     """
-    return pwd_context.hash(password)
+    return get_password_context().hash(password)
+
+def configure_password_hashing() -> int:
+    """
+    비밀번호 해싱 설정을 미리 준비합니다
+
+    서버 시작 후 백그라운드에서 호출합니다. BCRYPT_ROUNDS가 없으면 여기서 CPU를 측정하여
+    라운드를 정하고, 측정하는 동안 들어온 로그인은 하한선 설정으로 바로 처리됩니다.
+
+    Returns:
+        int: 적용된 bcrypt 라운드
+    """
+    global _pwd_context
+    if _pwd_context is None and not BCRYPT_ROUNDS:
+        from .bcrypt_calibration import calibrate_rounds
+
+        rounds = calibrate_rounds()  # 잠금 밖에서 측정하므로 요청이 기다리지 않음
+        with _pwd_context_lock:
+            if _pwd_context is None:
+                _pwd_context = _build_password_context(rounds)
+    return get_password_context().handler("bcrypt").default_rounds
+
+def rehash_password(user_id: int, old_hash: str, password: str):
+    """
+    로그인 성공 후 백그라운드에서 비밀번호를 현재 설정으로 다시 해시합니다
+
+    응답이 이미 전송된 뒤에 실행되므로 요청의 세션 대신 새 세션을 엽니다.
+    그 사이 비밀번호가 바뀌었을 수 있으므로 기존 해시가 그대로일 때만 갱신합니다.
+
+    Args:
+        user_id: 사용자 ID
+        old_hash: 로그인 시점에 저장되어 있던 해시
+        password: 로그인에 성공한 평문 비밀번호
+    """
+    new_hash = get_password_hash(password)
+    db = SessionLocal()
+    try:
+        db.query(models.User).filter(
+            models.User.id == user_id,
+            models.User.hashed_password == old_hash
+        ).update({models.User.hashed_password: new_hash}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
 
 # ====== JWT 토큰 관련 함수들 ======
 
@@ -72,7 +164,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     JWT 액세스 토큰을 생성합니다
     
     Args:
-        data: 토큰에 포함할 데이터 (보통 사용자 ID)
+        data: 토큰에 포함할 데이터 ("sub"에 사용자 ID 문자열)
         expires_delta: 토큰 만료 시간 (기본값: 30분)
     
     Returns:
@@ -82,50 +174,74 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     
     # 만료 시간 설정
+    issued_at = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = issued_at + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = issued_at + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    # 만료 시간을 토큰 데이터에 추가
-    to_encode.update({"exp": expire})
+    # 만료 시간과 발급 시간을 토큰 데이터에 추가
+    # (발급 시간은 삭제된 계정의 토큰이 같은 ID로 새로 만든 계정에 쓰이지 않게 확인하는 데 사용)
+    to_encode.update({"exp": expire, "iat": issued_at})
     
-    # JWT 토큰 생성 및 반환
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    # JWT 토큰 생성 및 반환 (서명 키는 백엔드가 한 번만 준비해 재사용)
+    encoded_jwt = get_jwt_backend(SECRET_KEY).encode(to_encode)
     return encoded_jwt
 
-def verify_token(token: str) -> Optional[str]:
+def verify_token(token: str) -> Optional[dict]:
     """
-    JWT 토큰을 검증하고 사용자명을 추출합니다
+    JWT 토큰을 검증하고 사용자 ID와 발급 시간을 추출합니다
+    
+    사용자명은 계정이 삭제되면 다른 사람이 다시 가입할 수 있으므로
+    토큰의 주체("sub")에는 바뀌지 않는 사용자 ID를 넣습니다.
     
     Args:
         token: 검증할 JWT 토큰
     
     Returns:
-        Optional[str]: 토큰이 유효하면 사용자명, 아니면 None
+        Optional[dict]: 토큰이 유효하면 {"user_id": 사용자 ID, "issued_at": 발급 시각(유닉스 초)}, 아니면 None
     """
     try:
         # 토큰 디코딩 및 검증
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")  # "sub"는 주체(subject)를 의미
-        
-        if username is None:
-            return None
-        return username
-    except JWTError:
-        # 토큰이 유효하지 않거나 만료된 경우
+        payload = get_jwt_backend(SECRET_KEY).decode(token)
+        # "sub"는 주체(subject)를 의미 (사용자명을 넣던 예전 토큰은 숫자가 아니므로 거절)
+        return {"user_id": int(payload["sub"]), "issued_at": int(payload["iat"])}
+    except (TokenError, KeyError, TypeError, ValueError):
+        # 토큰이 유효하지 않거나 만료되었거나, 필요한 정보가 없는 경우
         return None
 
+def issued_before_account(issued_at: int, user: models.User) -> bool:
+    """
+    토큰이 이 계정이 만들어지기 전에 발급되었는지 확인합니다
+    
+    SQLite는 가장 큰 ID의 행이 삭제되면 그 ID를 다시 쓸 수 있으므로,
+    삭제된 계정의 토큰이 같은 ID를 받은 새 계정으로 인증되지 않게 합니다.
+    (created_at은 시간대 없는 한국 시간으로 저장되어 있습니다)
+    """
+    if user.created_at is None:
+        return False
+    created = user.created_at.replace(tzinfo=models.KST).timestamp()
+    return issued_at < int(created)
+
 # ====== 사용자 인증 관련 함수들 ======
 
-def authenticate_user(db: Session, username: str, password: str):
+def authenticate_user(
+    db: Session,
+    username: str,
+    password: str,
+    background_tasks: Optional[BackgroundTasks] = None
+):
     """
     사용자명과 비밀번호로 사용자를 인증합니다
     
+    저장된 해시가 현재 bcrypt 설정보다 약하면(needs_update)
+    응답 후 백그라운드에서 다시 해시하도록 예약합니다.
+    
     Args:
         db: 데이터베이스 세션
         username: 사용자명
         password: 비밀번호
+        background_tasks: 재해시 작업을 예약할 FastAPI 백그라운드 작업 (선택)
     
     Returns:
         User or False: 인증 성공시 사용자 객체, 실패시 False
@@ -135,14 +251,20 @@ def authenticate_user(db: Session, username: str, password: str):
     
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
-        return False
+    # 비활성 계정은 비용이 큰 bcrypt 검증 전에 바로 거절
     if not user.is_active:
         return False
+    if not verify_password(password, user.hashed_password):
+        return False
+    
+    # 예전 라운드로 만든 해시는 응답 지연 없이 백그라운드에서 교체
+    if background_tasks is not None and get_password_context().needs_update(user.hashed_password):
+        background_tasks.add_task(rehash_password, user.id, user.hashed_password, password)
     
     return user
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ):
@@ -157,7 +279,11 @@ def get_current_user(
         def protected_route(current_user: User = Depends(get_current_user)):
             return {"message": f"Hello {current_user.username}!"}
     
+    /batch의 하위 요청이면 /batch에서 이미 확인한 사용자를 그대로 사용하여
+    토큰 해석과 사용자 조회를 반복하지 않습니다.
+    
     Args:
+        request: HTTP 요청 (/batch 하위 요청인지 확인용)
         credentials: HTTP Bearer 토큰 (자동으로 추출됨)
         db: 데이터베이스 세션 (자동으로 주입됨)
     
@@ -167,6 +293,10 @@ def get_current_user(
     Raises:
         HTTPException: 토큰이 유효하지 않거나 사용자를 찾을 수 없는 경우
     """
+    batch = request.scope.get(BATCH_SCOPE_KEY)
+    if batch is not None:
+        return batch.user
+    
     # 401 Unauthorized 에러 템플릿
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -174,18 +304,50 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    # 토큰에서 사용자명 추출
-    username = verify_token(credentials.credentials)
-    if username is None:
+    # 토큰에서 사용자 ID와 발급 시간 추출
+    token = verify_token(credentials.credentials)
+    if token is None:
         raise credentials_exception
     
-    # 데이터베이스에서 사용자 찾기
-    user = db.query(models.User).filter(models.User.username == username).first()
-    if user is None:
+    # 데이터베이스에서 사용자 찾기 (계정이 만들어지기 전에 발급된 토큰은 거절)
+    user = db.query(models.User).filter(models.User.id == token["user_id"]).first()
+    if user is None or issued_before_account(token["issued_at"], user):
         raise credentials_exception
     
     return user
 
+def _is_local_request(request: Request) -> bool:
+    """서버 자신에서 프록시를 거치지 않고 직접 보낸 요청인지 확인합니다"""
+    if request.client is None or "x-forwarded-for" in request.headers:
+        return False  # 같은 서버의 Nginx를 거친 외부 요청도 접속 주소는 localhost입니다
+    try:
+        return ipaddress.ip_address(request.client.host).is_loopback
+    except ValueError:
+        return False
+
+def require_metrics_access(request: Request):
+    """
+    통계 엔드포인트(/metrics/*)를 볼 수 있는 요청인지 확인하는 의존성 함수
+    
+    통계에는 대기열 길이, DB 커넥션 풀 상태, 알림 대기 수 같은 내부 정보가 들어 있으므로
+    METRICS_TOKEN이 설정되어 있으면 X-Metrics-Token 헤더가 같은 요청만,
+    없으면 서버 자신에서 직접 보낸 요청만 허용합니다.
+    
+    Args:
+        request: HTTP 요청
+    
+    Raises:
+        HTTPException: 허용되지 않은 요청인 경우 (403)
+    """
+    if METRICS_TOKEN:
+        token = request.headers.get("x-metrics-token", "")
+        # 한 글자씩 비교하는 시간 차이로 토큰을 알아낼 수 없도록 항상 같은 시간에 비교
+        if hmac.compare_digest(token.encode("utf-8"), METRICS_TOKEN.encode("utf-8")):
+            return
+    elif _is_local_request(request):
+        return
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="통계를 조회할 권한이 없습니다")
+
 def get_current_active_user(current_user: models.User = Depends(get_current_user)):
     """
     현재 로그인한 활성 사용자를 반환하는 의존성 함수
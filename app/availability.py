@@ -0,0 +1,175 @@
+"""
+사용자명/이메일 사용 가능 여부 확인 모듈
+
+이 파일의 역할:
+1. 기존 사용자명과 이메일을 블룸 필터(Bloom filter)에 담아 메모리에 보관합니다
+2. 회원가입 화면에서 입력 중인 사용자명/이메일이 사용 가능한지 빠르게 알려줍니다
+3. 필터가 "있을 수도 있다"고 답한 경우에만 데이터베이스를 조회합니다
+
+초보자를 위한 설명:
+- 블룸 필터: 적은 메모리로 "확실히 없음" 또는 "있을 수도 있음"을 알려주는 자료구조
+  * "없음"이라는 답은 항상 정확하므로 DB 조회 없이 바로 사용 가능하다고 답합니다
+  * "있을 수도 있음"은 가끔 틀리므로(오탐) 이때만 DB에서 실제로 확인합니다
+- 조회 비용은 저장된 사용자 수와 관계없이 해시 몇 번으로 일정합니다
+- 필터는 서버 시작 시 DB에서 만들고, 회원가입이 성공할 때마다 추가합니다
+- 워커가 여러 개라면 다른 워커에서 가입한 사용자는 재시작 전까지 필터에 없으므로,
+  이 확인 결과는 참고용이고 최종 판단은 DB의 unique 제약조건이 합니다
+"""
+
+import hashlib
+import math
+import threading
+from typing import Optional
+
+from email_validator import EmailNotValidError, validate_email
+from sqlalchemy.orm import Session
+
+from . import models
+from .crud import get_users_by_username_or_email
+
+class BloomFilter:
+    """
+    비트 배열과 여러 개의 해시로 구성된 블룸 필터
+
+    Args:
+        capacity: 담을 것으로 예상되는 항목 수
+        error_rate: 허용할 오탐 확률 (기본 1%)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        # 최적의 비트 수(m)와 해시 개수(k) 계산
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        """항목을 해시하여 k개의 비트 위치를 만듭니다 (이중 해싱)"""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+class UserAvailabilityIndex:
+    """
+    사용자명과 이메일 각각의 블룸 필터를 관리합니다
+
+    build()로 DB에서 필터를 만들고, 가입이 성공할 때마다 add()로 추가합니다.
+    build()가 끝나기 전에는 "있을 수도 있음"으로 답하여 항상 DB로 확인하게 합니다.
+    (서버 시작을 기다리지 않도록 build()는 백그라운드에서 실행됩니다)
+    """
+
+    def __init__(self):
+        self._usernames = BloomFilter(1)
+        self._emails = BloomFilter(1)
+        self._ready = False
+        self._pending = None  # build() 중에 가입한 사용자 (필터 교체 후 다시 추가)
+        self._lock = threading.Lock()
+
+    def build(self, db: Session, error_rate: float = 0.01):
+        """
+        DB의 모든 사용자명/이메일로 필터를 새로 만듭니다
+
+        사용자 수의 2배를 용량으로 잡아, 가입이 늘어도 한동안 오탐률이 유지되게 합니다.
+        사용자를 한 번에 메모리에 올리지 않도록 나눠서 읽습니다.
+        """
+        with self._lock:
+            self._pending = []
+
+        count = db.query(models.User).count()
+        usernames = BloomFilter(max(1024, count * 2), error_rate)
+        emails = BloomFilter(max(1024, count * 2), error_rate)
+
+        rows = db.query(models.User.username, models.User.email).yield_per(1000)
+        for username, email in rows:
+            usernames.add(username)
+            emails.add(email)
+
+        with self._lock:
+            for username, email in self._pending:
+                usernames.add(username)
+                emails.add(email)
+            self._usernames, self._emails = usernames, emails
+            self._pending = None
+            self._ready = True
+
+    def add(self, username: str, email: str):
+        """새로 가입한 사용자의 사용자명/이메일을 필터에 추가합니다"""
+        with self._lock:
+            self._usernames.add(username)
+            self._emails.add(email)
+            if self._pending is not None:
+                self._pending.append((username, email))
+
+    def username_may_exist(self, username: str) -> bool:
+        return not self._ready or username in self._usernames
+
+    def email_may_exist(self, email: str) -> bool:
+        return not self._ready or email in self._emails
+
+# 애플리케이션 전체에서 공유하는 사용자명/이메일 필터
+user_index = UserAvailabilityIndex()
+
+def normalize_email(email: str) -> Optional[str]:
+    """
+    회원가입(EmailStr)과 같은 방식으로 이메일을 정규화합니다
+
+    가입 시 저장되는 이메일은 도메인이 소문자로 바뀌므로(Alice@Example.com → Alice@example.com)
+    확인할 때도 같은 형태로 바꿔야 필터와 DB에서 올바르게 찾을 수 있습니다.
+
+    Returns:
+        Optional[str]: 정규화된 이메일, 형식이 잘못되었으면 None
+    """
+    try:
+        return validate_email(email, check_deliverability=False).normalized
+    except EmailNotValidError:
+        return None
+
+def check_availability(db: Session, username: Optional[str] = None, email: Optional[str] = None) -> dict:
+    """
+    사용자명/이메일이 사용 가능한지 확인합니다
+
+    필터가 "없음"이라고 답하면 DB를 조회하지 않고,
+    "있을 수도 있음"이면 한 번의 쿼리로 두 값을 함께 확인합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        username: 확인할 사용자명 (선택)
+        email: 확인할 이메일 (선택)
+
+    Returns:
+        dict: {"username": bool | None, "email": bool | None}
+              True면 사용 가능, False면 이미 사용 중(또는 형식이 잘못된 이메일), None이면 확인하지 않음
+    """
+    invalid_email = False
+    if email is not None:
+        email = normalize_email(email)
+        invalid_email = email is None
+
+    result = {
+        "username": None if username is None else not user_index.username_may_exist(username),
+        "email": None if email is None else not user_index.email_may_exist(email),
+    }
+
+    # 필터가 "있을 수도 있음"이라고 답한 값만 DB에서 확인
+    check_username = username if result["username"] is False else None
+    check_email = email if result["email"] is False else None
+    if invalid_email:
+        # 가입할 수 없는 형식이므로 DB를 조회하지 않고 사용 불가로 답합니다
+        result["email"] = False
+    if check_username is None and check_email is None:
+        return result
+
+    existing = get_users_by_username_or_email(db, username=check_username, email=check_email)
+    if check_username is not None:
+        result["username"] = not any(u.username == check_username for u in existing)
+    if check_email is not None:
+        result["email"] = not any(u.email == check_email for u in existing)
+    return result
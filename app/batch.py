@@ -0,0 +1,229 @@
+"""
+묶음 요청(/batch) 실행 모듈
+
+이 파일의 역할:
+1. 여러 API 호출을 담은 요청 하나를 받아, 기존 API들을 서버 안에서 순서대로 실행합니다
+2. 모든 하위 요청은 /batch에서 한 번 확인한 사용자와 하나의 DB 세션을 함께 씁니다
+3. atomic 옵션을 주면 모든 하위 요청을 한 트랜잭션으로 묶어, 하나라도 실패하면 모두 취소합니다
+
+초보자를 위한 설명:
+- 페이지를 열 때 /me, /todos/ 등을 따로 요청하면 요청마다 네트워크 왕복이 생기고,
+  서버는 매번 토큰 해석, 사용자 조회, 세션 준비를 반복합니다
+- 지연이 큰 모바일 환경에서는 왕복 횟수가 곧 화면이 뜨는 시간입니다
+- 묶음 요청은 이 호출들을 한 번의 왕복으로 보내고, 결과를 한꺼번에 받습니다
+- 하위 요청은 네트워크를 거치지 않고 같은 앱의 라우터로 바로 전달되므로,
+  기존 API의 검증, 권한 확인, 응답 형식이 그대로 적용됩니다
+- 하위 요청도 하나하나 요청 수용 제어의 처리 자리를 얻어서 실행되므로,
+  묶음 요청으로 동시 처리 수 한도를 넘어 쓰기를 몰아넣을 수 없습니다
+  (atomic 묶음은 커넥션 하나로 실행되므로, 커넥션을 빌리기 전에 묶음 전체의 자리를 한 번 얻습니다)
+- 커넥션 빌리기, 커밋 등 기다릴 수 있는 DB 작업은 스레드풀에서 실행하여
+  DB가 느려도 다른 요청을 처리하는 이벤트 루프가 멈추지 않게 합니다
+"""
+
+import json
+from typing import List
+
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+
+from .admission import classify_request, limiters, release_request_slot
+from .cache import todo_cache
+from .database import BATCH_SCOPE_KEY, SessionLocal, engine
+
+# ====== 묶음 요청 설정 ======
+# (한 번에 담을 수 있는 하위 요청 수는 crud.BATCH_MAX_OPERATIONS)
+
+# 묶음 요청으로 호출할 수 있는 경로 (로그인/회원가입, 통계, 정적 파일, /batch 자신은 제외)
+BATCH_ALLOWED_PATHS = ("/me",)
+BATCH_ALLOWED_PREFIXES = ("/me/", "/todos/", "/users/")
+
+# 처리 자리를 얻지 못했을 때의 안내 문구
+_BUSY_DETAIL = "요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도해주세요"
+
+# 하위 요청 scope에 부모 요청에서 그대로 물려줄 항목
+_INHERITED_SCOPE_KEYS = (
+    "type", "asgi", "http_version", "scheme", "server", "client",
+    "root_path", "app", "state", "starlette.exception_handlers",
+)
+
+class BatchContext:
+    """
+    하위 요청들이 함께 쓰는 정보 (확인된 사용자, 공유 DB 세션)
+
+    하위 요청 scope에 담겨 get_db와 get_current_user가 사용합니다.
+    """
+
+    def __init__(self, user, db, atomic: bool = False):
+        self.user = user
+        self.db = db
+        db.info["batch"] = True  # 하위 요청이 끝날 때 세션을 닫지 않도록 표시
+        db.info["atomic"] = atomic  # 롤백하면 묶음 전체가 취소되는 세션인지 (충돌 시 재시도 안 함)
+        if atomic:
+            # 알림 등록 등 저장 후 작업은 묶음 전체가 커밋된 뒤에 실행 (database.after_commit)
+            db.info["after_commit"] = []
+
+def _is_allowed(path: str) -> bool:
+    """묶음 요청으로 호출할 수 있는 경로인지 확인합니다 (/metrics 등이 /me로 시작한다고 통과하지 않게)"""
+    return path in BATCH_ALLOWED_PATHS or path.startswith(BATCH_ALLOWED_PREFIXES)
+
+async def _dispatch(parent_scope: dict, context: BatchContext, operation) -> dict:
+    """
+    하위 요청 하나를 같은 앱의 라우터로 실행하고 상태 코드와 본문을 돌려줍니다
+
+    CORS 미들웨어는 /batch 요청에서 이미 거쳤으므로 다시 거치지 않지만,
+    수용 제어의 처리 자리는 하위 요청마다 종류(조회/쓰기)에 맞게 따로 얻습니다.
+    (atomic 묶음은 run_batch가 묶음 전체의 자리를 이미 얻었으므로 다시 얻지 않습니다)
+    """
+    path, _, query = operation.path.partition("?")
+    if not _is_allowed(path):
+        return {"status": 400, "body": {"detail": f"묶음 요청으로 호출할 수 없는 경로입니다: {path}"}}
+
+    body = json.dumps(operation.body).encode("utf-8") if operation.body is not None else b""
+    headers = [
+        (name, value) for name, value in parent_scope["headers"]
+        if name not in (b"content-type", b"content-length")
+    ]
+    headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+
+    scope = {key: parent_scope[key] for key in _INHERITED_SCOPE_KEYS if key in parent_scope}
+    scope.update({
+        "method": operation.method.upper(),
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": query.encode("utf-8"),
+        "headers": headers,
+        BATCH_SCOPE_KEY: context,
+    })
+
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    response = {"status": 500, "headers": [], "body": b""}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    atomic = context.db.info.get("atomic", False)
+    limiter = None if atomic else limiters.get(classify_request(scope["method"], path))
+    if limiter is not None:
+        if context.db.in_transaction():
+            # 이전 하위 요청이 조회만 하고 붙잡고 있는 커넥션을, 자리를 기다리기 전에 반환합니다
+            await run_in_threadpool(context.db.rollback)
+        if not await limiter.acquire():
+            return {"status": 503, "body": {"detail": _BUSY_DETAIL}}
+
+    try:
+        await scope["app"].router(scope, receive, send)
+    except HTTPException as error:
+        # 없는 경로(404)나 허용되지 않은 메서드(405)는 라우트 밖에서 예외로 나옵니다
+        return {"status": error.status_code, "body": {"detail": error.detail}}
+    except Exception as error:
+        # 예상하지 못한 오류도 이 하위 요청의 500 결과로 돌려주고 다음 하위 요청을 계속합니다
+        print(f"⚠️ 묶음 하위 요청 실패 ({scope['method']} {path}): {error!r}")
+        if not atomic:
+            # 실패한 작업이 공유 세션에 남아 다음 하위 요청까지 실패하지 않게 되돌립니다
+            # (atomic이면 묶음이 여기서 멈추고 전체가 취소됩니다)
+            await run_in_threadpool(context.db.rollback)
+        return {"status": 500, "body": {"detail": "서버 내부 오류가 발생했습니다"}}
+    finally:
+        if limiter is not None:
+            limiter.release()
+
+    content_type = dict(response["headers"]).get(b"content-type", b"")
+    if response["body"] and content_type.startswith(b"application/json"):
+        result_body = json.loads(response["body"])
+    else:
+        result_body = response["body"].decode("utf-8") or None
+    return {"status": response["status"], "body": result_body}
+
+async def run_batch(parent_scope: dict, operations: List, user, db, atomic: bool = False) -> dict:
+    """
+    하위 요청들을 순서대로 실행합니다
+
+    Args:
+        parent_scope: /batch 요청의 ASGI scope (헤더, 앱 정보를 물려줌)
+        operations: 실행할 하위 요청 목록 (BatchOperation)
+        user: /batch에서 확인한 현재 사용자
+        db: /batch 요청의 DB 세션 (atomic이 아니면 모든 하위 요청이 이 세션을 씀)
+        atomic: True면 한 트랜잭션으로 실행하고, 하나라도 실패(4xx/5xx)하면 멈추고 모두 취소
+
+    Returns:
+        dict: {"results": [하위 요청 결과...], "committed": 저장 여부}
+
+    Raises:
+        HTTPException: atomic 묶음이 처리 자리를 얻지 못한 경우 (503)
+    """
+    # /batch 자신의 처리 자리는 반환하고, 하위 요청(또는 atomic 묶음 전체)마다 자리를 얻습니다
+    release_request_slot(parent_scope)
+
+    if not atomic:
+        # 각 하위 요청은 평소처럼 자기 작업을 커밋합니다
+        context = BatchContext(user, db)
+        try:
+            results = [await _dispatch(parent_scope, context, operation) for operation in operations]
+        finally:
+            # 이제 /batch 자신의 세션이므로, 끝나면 평소처럼 바로 닫히게 합니다
+            db.info.pop("batch", None)
+            db.info.pop("atomic", None)
+        return {"results": results, "committed": True}
+
+    # atomic: 묶음 전체가 커넥션 하나를 계속 쓰므로, 커넥션을 빌리기 전에 묶음 전체의 자리를 얻습니다
+    read_only = all(operation.method.upper() in ("GET", "HEAD") for operation in operations)
+    limiter = limiters["read" if read_only else "write"]
+    await run_in_threadpool(db.close)  # 사용자 조회에 쓴 커넥션은 자리를 기다리기 전에 반환
+    if not await limiter.acquire():
+        raise HTTPException(status_code=503, detail=_BUSY_DETAIL, headers={"Retry-After": str(limiter.retry_after())})
+
+    try:
+        return await _run_atomic(parent_scope, operations, user)
+    finally:
+        limiter.release()
+
+async def _run_atomic(parent_scope: dict, operations: List, user) -> dict:
+    """
+    하위 요청들을 한 트랜잭션으로 실행합니다 (하나라도 실패하면 멈추고 모두 취소)
+
+    바깥 트랜잭션을 직접 열고, 하위 요청 안의 commit()은 이 트랜잭션을 끝내지 않게 합니다
+    (join_transaction_mode="rollback_only": commit은 바깥 트랜잭션에 영향 없음, rollback은 전체 취소)
+    """
+    results = []
+    committed = False
+    connection = await run_in_threadpool(engine.connect)
+    try:
+        transaction = await run_in_threadpool(connection.begin)
+        shared = SessionLocal(bind=connection, join_transaction_mode="rollback_only", expire_on_commit=False)
+        try:
+            # /batch 세션을 닫아 분리된 사용자 객체를 공유 세션에 붙입니다 (탈퇴/비활성화가 사용자를 수정할 수 있게)
+            context = BatchContext(shared.merge(user, load=False), shared, atomic=True)
+            for operation in operations:
+                result = await _dispatch(parent_scope, context, operation)
+                results.append(result)
+                if result["status"] >= 400:
+                    break
+            else:
+                await run_in_threadpool(shared.flush)
+                await run_in_threadpool(transaction.commit)
+                committed = True
+                # 저장이 확정되었으므로 미뤄 둔 작업(알림 등록, 재배치 요청 등)을 실행합니다
+                for callback, args in shared.info["after_commit"]:
+                    callback(*args)
+        finally:
+            shared.info.pop("after_commit", None)  # 취소되었으면 미뤄 둔 작업은 버립니다
+            await run_in_threadpool(shared.close)
+            if not committed:
+                await run_in_threadpool(transaction.rollback)
+    finally:
+        await run_in_threadpool(connection.close)
+        # 트랜잭션 중에 캐시된 결과가 실제 저장 상태와 다를 수 있으므로 무효화합니다
+        await run_in_threadpool(todo_cache.invalidate_owner, user.id)
+    return {"results": results, "committed": committed}
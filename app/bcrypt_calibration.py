@@ -0,0 +1,133 @@
+"""
+bcrypt 비용(cost) 보정 모듈
+
+이 파일의 역할:
+1. 현재 서버 CPU에서 bcrypt 라운드별 해시/검증 시간을 측정합니다
+2. 목표 검증 시간(예: 250ms)에 맞는 bcrypt 라운드를 자동으로 고릅니다
+3. 라운드별 초당 해시 수를 보여주는 보정 리포트를 출력합니다
+
+초보자를 위한 설명:
+- bcrypt의 라운드(cost)가 1 올라갈 때마다 계산량은 2배가 됩니다
+- 서버가 빠를수록 같은 라운드의 해시가 빨리 끝나므로, 더 높은 라운드를 써도 됩니다
+- 하지만 보안을 위해 최소 라운드(하한선) 아래로는 절대 내려가지 않습니다
+
+사용 예시 (보정 리포트 출력):
+    python -m app.bcrypt_calibration
+"""
+
+import os
+import time
+from typing import List
+
+from passlib.hash import bcrypt
+
+# ====== 보정 설정 ======
+
+# 로그인 1회의 비밀번호 검증에 허용할 목표 시간 (밀리초)
+BCRYPT_TARGET_MS = float(os.getenv("BCRYPT_TARGET_MS", "250"))
+
+# 보안 하한선: 이보다 낮은 라운드는 절대 사용하지 않습니다 (passlib 기본값과 동일)
+BCRYPT_MIN_ROUNDS = int(os.getenv("BCRYPT_MIN_ROUNDS", "12"))
+
+# 상한선: 너무 느린 해시로 로그인이 멈추는 것을 막습니다
+BCRYPT_MAX_ROUNDS = int(os.getenv("BCRYPT_MAX_ROUNDS", "16"))
+
+# 측정에 사용할 샘플 비밀번호 (실제 사용자 비밀번호가 아님)
+_SAMPLE_PASSWORD = "calibration-sample-password"
+
+def measure_verify_seconds(rounds: int, samples: int = 3) -> float:
+    """
+    주어진 라운드에서 bcrypt 검증 1회에 걸리는 시간을 측정합니다
+
+    Args:
+        rounds: 측정할 bcrypt 라운드 (cost)
+        samples: 반복 측정 횟수 (가장 빠른 값을 사용하여 잡음을 줄임)
+
+    Returns:
+        float: 검증 1회에 걸린 시간 (초)
+    """
+    hashed = bcrypt.using(rounds=rounds).hash(_SAMPLE_PASSWORD)
+
+    best = float("inf")
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.verify(_SAMPLE_PASSWORD, hashed)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def clamp_rounds(rounds: int, min_rounds: int = BCRYPT_MIN_ROUNDS, max_rounds: int = BCRYPT_MAX_ROUNDS) -> int:
+    """
+    직접 지정한 라운드를 하한선과 상한선 사이로 맞춥니다
+
+    BCRYPT_ROUNDS로 라운드를 고정해도 보안 하한선 아래로는 내려가지 않게 합니다.
+    """
+    clamped = max(min_rounds, min(max_rounds, rounds))
+    if clamped != rounds:
+        print(f"⚠️ BCRYPT_ROUNDS={rounds}는 허용 범위({min_rounds}~{max_rounds}) 밖이므로 {clamped}를 사용합니다")
+    return clamped
+
+def calibrate_rounds(
+    target_ms: float = BCRYPT_TARGET_MS,
+    min_rounds: int = BCRYPT_MIN_ROUNDS,
+    max_rounds: int = BCRYPT_MAX_ROUNDS,
+) -> int:
+    """
+    목표 검증 시간을 넘지 않는 가장 높은 bcrypt 라운드를 계산합니다
+
+    하한선 라운드에서 한 번만 측정하고, 라운드가 1 오를 때마다
+    시간이 2배가 된다는 bcrypt의 성질로 나머지를 추정합니다.
+    따라서 보정에 드는 시간은 하한선 해시 몇 번 정도입니다.
+
+    Args:
+        target_ms: 목표 검증 시간 (밀리초)
+        min_rounds: 보안 하한선 라운드
+        max_rounds: 상한선 라운드
+
+    Returns:
+        int: 사용할 bcrypt 라운드 (min_rounds 이상 max_rounds 이하)
+    """
+    base_ms = measure_verify_seconds(min_rounds) * 1000
+
+    rounds = min_rounds
+    # 다음 라운드(2배 시간)도 목표 안에 들어오면 한 단계씩 올립니다
+    while rounds < max_rounds and base_ms * 2 ** (rounds + 1 - min_rounds) <= target_ms:
+        rounds += 1
+    return rounds
+
+def calibration_report(
+    min_rounds: int = BCRYPT_MIN_ROUNDS,
+    max_rounds: int = BCRYPT_MAX_ROUNDS,
+    samples: int = 3,
+) -> List[dict]:
+    """
+    라운드별 검증 시간과 초당 해시 수(코어 1개 기준)를 측정합니다
+
+    로그인 처리 용량을 산정할 때 사용합니다.
+    예: 초당 4회 x 워커 4개 = 초당 약 16회의 로그인 처리 가능
+
+    Args:
+        min_rounds: 측정을 시작할 라운드
+        max_rounds: 측정을 끝낼 라운드
+        samples: 라운드별 반복 측정 횟수
+
+    Returns:
+        List[dict]: {"rounds", "verify_ms", "hashes_per_sec"} 항목들의 목록
+    """
+    report = []
+    for rounds in range(min_rounds, max_rounds + 1):
+        seconds = measure_verify_seconds(rounds, samples=samples)
+        report.append({
+            "rounds": rounds,
+            "verify_ms": seconds * 1000,
+            "hashes_per_sec": 1 / seconds,
+        })
+    return report
+
+# 이 파일을 직접 실행하면 보정 리포트를 출력합니다
+if __name__ == "__main__":
+    print(f"🔐 bcrypt 보정 리포트 (목표: {BCRYPT_TARGET_MS:.0f}ms, 하한선: {BCRYPT_MIN_ROUNDS})")
+    print(f"{'rounds':>6} {'verify_ms':>10} {'hashes/sec':>11}")
+    for row in calibration_report():
+        marker = " ✅" if row["verify_ms"] <= BCRYPT_TARGET_MS else ""
+        print(f"{row['rounds']:>6} {row['verify_ms']:>10.1f} {row['hashes_per_sec']:>11.2f}{marker}")
+    print(f"👉 선택된 라운드: {calibrate_rounds()}")
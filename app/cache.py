@@ -0,0 +1,244 @@
+"""
+할일 조회 결과 캐시 모듈
+
+이 파일의 역할:
+1. 할일 목록/단건 조회 결과를 소유자와 조회 조건별로 캐시합니다
+2. 할일이 생성/수정/삭제되면 해당 소유자의 캐시를 무효화합니다
+3. 캐시 저장소를 바꿔 끼울 수 있게 합니다 (프로세스 내 LRU / 공유 키-값 저장소)
+4. 같은 키를 동시에 조회하면 DB 조회를 한 번만 실행합니다 (single-flight)
+5. 적중률(hit ratio) 등 캐시 통계를 제공합니다
+
+초보자를 위한 설명:
+- 프론트엔드가 /todos/를 주기적으로 호출하면, 바뀐 것이 없어도 매번 같은 쿼리가 실행됩니다
+- 한 번 조회한 결과를 메모리에 저장해 두면, 다음 조회는 DB 없이 바로 응답할 수 있습니다
+- 무효화는 "소유자별 버전"으로 합니다. 쓰기가 일어나면 버전을 바꾸고,
+  캐시 키에 버전이 들어가므로 예전 결과는 더 이상 조회되지 않고 자연스럽게 밀려납니다
+- LRU: 가장 오랫동안 사용하지 않은 항목부터 지우는 방식 (메모리 크기 제한)
+- 프로세스 내 LRU는 워커 하나일 때만 안전합니다. 다른 워커에서 일어난 쓰기는 이 워커의
+  버전을 바꾸지 못하므로, WEB_CONCURRENCY가 2 이상인데 공유 저장소가 없으면 캐시를 끕니다
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from .kvstore import connect_key_value_store
+
+# ====== 캐시 설정 ======
+
+# 프로세스 내 LRU 캐시의 최대 항목 수
+TODO_CACHE_MAX_ENTRIES = int(os.getenv("TODO_CACHE_MAX_ENTRIES", "10000"))
+
+# 캐시 항목을 보관할 시간 (초) - 공유 저장소와 프로세스 내 LRU 모두에 적용
+TODO_CACHE_TTL = int(os.getenv("TODO_CACHE_TTL", "300"))
+
+# 같은 키를 먼저 조회 중인 요청을 기다리는 최대 시간 (초) - 넘으면 직접 조회합니다
+TODO_CACHE_LOAD_WAIT_SEC = float(os.getenv("TODO_CACHE_LOAD_WAIT_SEC", "5"))
+
+# 서버 워커(프로세스) 수 - uvicorn/gunicorn이 사용하는 표준 환경변수
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# 공유 저장소(Redis) 주소 - 설정하면 모든 워커가 같은 캐시를 사용합니다
+TODO_CACHE_REDIS_URL = os.getenv("TODO_CACHE_REDIS_URL")
+
+# 캐시에 값이 없음을 나타내는 표시 (None도 캐시할 수 있도록 별도로 둠)
+MISSING = object()
+
+# ====== 캐시 저장소 ======
+
+class LRUCacheBackend:
+    """
+    프로세스 메모리에 저장하는 크기 제한 LRU 캐시
+
+    Args:
+        max_entries: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+        ttl: 항목을 보관할 시간 (초) - 지나면 없는 것으로 봅니다
+    """
+
+    def __init__(self, max_entries: int = TODO_CACHE_MAX_ENTRIES, ttl: int = TODO_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+class KeyValueCacheBackend:
+    """
+    get / set(ex=) / delete를 지원하는 키-값 저장소(Redis 등)를 사용하는 캐시
+
+    값은 JSON으로 저장하며, 크기 제한은 TTL과 저장소의 메모리 정책에 맡깁니다.
+    """
+
+    def __init__(self, client, ttl: int = TODO_CACHE_TTL, prefix: str = "todo-cache:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.evictions = 0
+
+    def get(self, key: str):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return MISSING
+        return json.loads(raw)
+
+    def set(self, key: str, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+class NullCacheBackend:
+    """
+    아무것도 저장하지 않는 캐시 (캐시를 끈 상태)
+
+    공유 저장소 없이 워커가 여러 개일 때 사용하여, 다른 워커의 쓰기를 모르는
+    오래된 목록이 응답되지 않게 합니다. (동시 조회 합치기는 그대로 동작)
+    """
+
+    evictions = 0
+
+    def get(self, key: str):
+        return MISSING
+
+    def set(self, key: str, value):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+# ====== 할일 캐시 ======
+
+class TodoCache:
+    """
+    소유자별 버전으로 무효화하는 조회 결과 캐시
+
+    값은 JSON으로 바꿀 수 있는 데이터(dict, list, None 등)만 저장합니다.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._inflight = {}  # key -> (완료 이벤트, 결과를 담을 리스트)
+        self._lock = threading.Lock()
+
+    def _version(self, owner_id: int) -> str:
+        """소유자의 현재 캐시 버전을 가져옵니다 (없으면 새로 만듦)"""
+        key = f"owner:{owner_id}:version"
+        version = self.backend.get(key)
+        if version is MISSING:
+            version = uuid.uuid4().hex
+            self.backend.set(key, version)
+        return version
+
+    def invalidate_owner(self, owner_id: int):
+        """
+        소유자의 모든 캐시를 무효화합니다
+
+        버전을 새 값으로 바꾸기만 하므로 항목 수와 관계없이 한 번의 쓰기로 끝납니다.
+        """
+        self.backend.set(f"owner:{owner_id}:version", uuid.uuid4().hex)
+
+    def get_or_load(self, owner_id: int, params: tuple, loader: Callable[[], object]):
+        """
+        캐시에서 값을 찾고, 없으면 loader로 조회하여 저장합니다
+
+        같은 키를 여러 요청이 동시에 찾으면 첫 요청만 loader를 실행하고
+        나머지는 그 결과를 기다려서 함께 사용합니다.
+
+        Args:
+            owner_id: 할일 소유자 ID
+            params: 조회 조건 (예: ("list", skip, limit))
+            loader: 캐시에 없을 때 실제로 조회하는 함수
+
+        Returns:
+            캐시되었거나 새로 조회한 값
+        """
+        key = f"owner:{owner_id}:{self._version(owner_id)}:" + ":".join(map(str, params))
+
+        value = self.backend.get(key)
+        with self._lock:
+            if value is not MISSING:
+                self.hits += 1
+                return value
+            self.misses += 1
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = (threading.Event(), [])
+                self._inflight[key] = flight
+
+        event, result = flight
+        if not leader:
+            event.wait(TODO_CACHE_LOAD_WAIT_SEC)
+            if result:
+                return result[0]
+            # 먼저 조회하던 요청이 실패했거나 너무 오래 걸리면 직접 조회합니다
+            return loader()
+
+        try:
+            value = loader()
+            self.backend.set(key, value)
+            result.append(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "evictions": self.backend.evictions,
+            "enabled": not isinstance(self.backend, NullCacheBackend),
+        }
+
+def create_todo_cache() -> TodoCache:
+    """
+    환경변수에 맞는 저장소로 할일 캐시를 생성합니다
+
+    TODO_CACHE_REDIS_URL이 있으면 공유 저장소를, 없으면 프로세스 내 LRU를 사용합니다.
+    프로세스 내 LRU는 워커가 하나일 때만 쓰고, 여러 개면 캐시를 끕니다.
+    """
+    if TODO_CACHE_REDIS_URL:
+        return TodoCache(KeyValueCacheBackend(connect_key_value_store(TODO_CACHE_REDIS_URL)))
+    if WEB_CONCURRENCY > 1:
+        print("⚠️ 워커가 여러 개인데 TODO_CACHE_REDIS_URL이 없어 할일 조회 캐시를 끕니다")
+        return TodoCache(NullCacheBackend())
+    return TodoCache(LRUCacheBackend())
+
+# 애플리케이션 전체에서 공유하는 할일 캐시
+todo_cache = create_todo_cache()
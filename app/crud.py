@@ -15,12 +15,21 @@ CRUD (Create, Read, Update, Delete) 작업 모듈
 - Pydantic은 데이터 검증과 직렬화를 도와주는 라이브러리입니다
 - 이 파일은 FastAPI와 데이터베이스 사이의 다리 역할을 합니다
 """
+from sqlalchemy import or_  # OR 조건 쿼리를 위한 import
 from sqlalchemy.orm import Session  # 데이터베이스 세션을 위한 import
 from . import models  # 같은 패키지의 models.py에서 Todo 모델 가져오기
-from pydantic import BaseModel, EmailStr  # 데이터 검증을 위한 BaseModel, 이메일 검증
-from typing import Optional  # 선택적 필드 타입 힌트
+from pydantic import BaseModel, EmailStr, Field, field_validator  # 데이터 검증을 위한 BaseModel, 이메일 검증
+from typing import Any, Dict, List, Optional  # 선택적 필드 타입 힌트
 from datetime import datetime  # 날짜/시간 처리
 from .auth import get_password_hash  # 비밀번호 해싱 함수 가져오기
+from .cache import todo_cache  # 할일 조회 결과 캐시
+from .reminders import reminder_scheduler  # 마감 알림 스케줄러
+from .ordering import commit_rank_change, key_between, last_rank, rank_rebalancer, update_rank, RANK_MAX_LENGTH  # 할일 순서 키
+from .database import after_commit  # 저장이 확정된 뒤에 실행할 작업
+import os  # 환경변수 읽기
+
+# 묶음 요청(/batch) 한 번에 담을 수 있는 최대 하위 요청 수
+BATCH_MAX_OPERATIONS = int(os.getenv("BATCH_MAX_OPERATIONS", "20"))
 
 # ====== Pydantic 스키마 정의 ======
 # 스키마는 API로 주고받는 데이터의 형태를 정의합니다
@@ -61,6 +70,14 @@ class UserResponse(BaseModel):
         # SQLAlchemy 모델을 Pydantic 모델로 변환할 때 필요
         from_attributes = True
 
+class UserAvailability(BaseModel):
+    """
+    사용자명/이메일 사용 가능 여부 응답 스키마
+    회원가입 폼에서 입력 중인 값을 확인할 때 반환되는 데이터 구조
+    """
+    username: Optional[bool] = None  # 사용자명 사용 가능 여부 (확인하지 않았으면 None)
+    email: Optional[bool] = None  # 이메일 사용 가능 여부 (확인하지 않았으면 None)
+
 class Token(BaseModel):
     """
     JWT 토큰 응답 스키마
@@ -71,6 +88,18 @@ class Token(BaseModel):
 
 # ====== 할일 관련 스키마 ======
 
+def to_kst_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    입력받은 일시를 DB 저장 형식(시간대 정보 없는 한국 시간)으로 맞춥니다
+    
+    created_at 등 다른 일시 컬럼과 같은 기준으로 비교할 수 있도록,
+    시간대가 있는 값은 한국 시간으로 바꾸고 시간대 정보를 뗍니다.
+    시간대가 없는 값은 이미 한국 시간이라고 봅니다.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(models.KST).replace(tzinfo=None)
+
 class TodoCreate(BaseModel):
     """
     할일 생성 요청 스키마
@@ -79,6 +108,9 @@ class TodoCreate(BaseModel):
     title: str  # 필수 필드: 할일 제목
     description: Optional[str] = None  # 선택적 필드: 할일 설명
     priority: Optional[int] = 2  # 선택적 필드: 우선순위 (1: 높음, 2: 보통, 3: 낮음)
+    due_at: Optional[datetime] = None  # 선택적 필드: 마감 일시
+
+    _normalize_due_at = field_validator("due_at")(to_kst_naive)
 
 class TodoUpdate(BaseModel):
     """
@@ -89,6 +121,17 @@ class TodoUpdate(BaseModel):
     description: Optional[str] = None  # 선택적: 새로운 설명
     completed: Optional[bool] = None  # 선택적: 완료 상태
     priority: Optional[int] = None  # 선택적: 우선순위
+    due_at: Optional[datetime] = None  # 선택적: 마감 일시 (null을 직접 보내면 마감을 지움)
+
+    _normalize_due_at = field_validator("due_at")(to_kst_naive)
+
+class TodoMove(BaseModel):
+    """
+    할일 순서 이동 요청 스키마
+    옮긴 뒤 바로 앞/뒤에 올 할일의 ID를 보냅니다 (맨 앞/맨 뒤로 옮기면 한쪽은 생략)
+    """
+    prev_id: Optional[int] = None  # 선택적: 바로 앞에 올 할일 ID
+    next_id: Optional[int] = None  # 선택적: 바로 뒤에 올 할일 ID
 
 class TodoResponse(BaseModel):
     """
@@ -101,6 +144,8 @@ class TodoResponse(BaseModel):
     completed: bool  # 완료 상태
     priority: int  # 우선순위
     created_at: datetime  # 생성 일시
+    completed_at: Optional[datetime] = None  # 완료 일시 (미완료면 None)
+    due_at: Optional[datetime] = None  # 마감 일시 (없으면 None)
     owner_id: int  # 할일 작성자 ID
 
     class Config:
@@ -108,6 +153,59 @@ class TodoResponse(BaseModel):
         # ORM 모드 활성화로 ORM 객체를 직접 사용 가능
         from_attributes = True
 
+class ArchivedTodoResponse(BaseModel):
+    """
+    보관된 할일 응답 스키마
+    완료된 지 오래되어 보관 테이블로 옮겨진 할일 데이터 구조
+    """
+    id: int  # 보관 ID (되돌리기, 페이지 조회에 사용)
+    original_id: Optional[int] = None  # 보관 전 할일 ID (참고용)
+    title: str  # 할일 제목
+    description: Optional[str]  # 할일 설명 (없을 수 있음)
+    priority: int  # 우선순위
+    created_at: Optional[datetime]  # 생성 일시
+    completed_at: Optional[datetime]  # 완료 일시
+    due_at: Optional[datetime] = None  # 마감 일시
+    archived_at: datetime  # 보관 일시
+    owner_id: int  # 할일 작성자 ID
+
+    class Config:
+        from_attributes = True
+
+# ====== 묶음 요청(/batch) 관련 스키마 ======
+
+class BatchOperation(BaseModel):
+    """
+    묶음 요청에 담긴 하위 요청 하나
+    기존 API를 호출할 때와 같은 메서드, 경로, 본문을 보냅니다
+    """
+    method: str = "GET"  # HTTP 메서드 (GET, POST, PUT, DELETE)
+    path: str  # 요청 경로 (쿼리 문자열 포함 가능, 예: "/todos/?limit=20")
+    body: Optional[Any] = None  # 선택적 필드: JSON 본문
+
+class BatchRequest(BaseModel):
+    """
+    묶음 요청 스키마
+    여러 API 호출을 한 번의 왕복으로 순서대로 실행합니다
+    """
+    operations: List[BatchOperation] = Field(min_length=1, max_length=BATCH_MAX_OPERATIONS)
+    atomic: bool = False  # True면 모든 하위 요청을 한 트랜잭션으로 실행 (하나라도 실패하면 모두 취소)
+
+class BatchResult(BaseModel):
+    """
+    하위 요청 하나의 결과 (기존 API가 돌려주는 상태 코드와 본문)
+    """
+    status: int  # HTTP 상태 코드
+    body: Optional[Any] = None  # 응답 본문 (JSON)
+
+class BatchResponse(BaseModel):
+    """
+    묶음 요청 응답 스키마
+    실행한 순서대로 하위 요청의 결과를 담습니다
+    """
+    results: List[BatchResult]  # 하위 요청 결과 목록 (atomic이면 실패한 요청까지만)
+    committed: bool  # 변경 사항이 저장되었는지 여부 (atomic에서 실패하면 False)
+
 # ====== 사용자 관련 CRUD 함수들 ======
 
 def get_user(db: Session, user_id: int):
@@ -149,6 +247,28 @@ def get_user_by_email(db: Session, email: str):
     """
     return db.query(models.User).filter(models.User.email == email).first()
 
+def get_users_by_username_or_email(db: Session, username: Optional[str] = None, email: Optional[str] = None) -> List[models.User]:
+    """
+    사용자명 또는 이메일이 일치하는 사용자들을 한 번의 쿼리로 조회합니다.
+    회원가입 중복 확인처럼 두 값을 함께 확인할 때 쿼리 수를 줄이기 위해 사용합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        username: 조회할 사용자명 (선택)
+        email: 조회할 이메일 주소 (선택)
+    
+    Returns:
+        List[User]: 일치하는 사용자 목록 (최대 2명)
+    """
+    conditions = []
+    if username is not None:
+        conditions.append(models.User.username == username)
+    if email is not None:
+        conditions.append(models.User.email == email)
+    if not conditions:
+        return []
+    return db.query(models.User).filter(or_(*conditions)).limit(2).all()
+
 def create_user(db: Session, user: UserCreate):
     """
     새로운 사용자를 생성합니다.
@@ -175,27 +295,82 @@ def create_user(db: Session, user: UserCreate):
     db.refresh(db_user)  # 생성된 ID 등 최신 정보로 갱신
     return db_user
 
+def deactivate_user(db: Session, db_user: models.User):
+    """
+    계정을 비활성화합니다.
+    비활성화된 계정은 로그인할 수 없고, 이미 발급된 토큰도 바로 사용할 수 없습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        db_user: 비활성화할 사용자 객체
+    
+    Returns:
+        User: 비활성화된 사용자 객체
+    """
+    db_user.is_active = False
+    db.commit()
+    db.refresh(db_user)
+    return db_user
+
+def request_account_deletion(db: Session, db_user: models.User):
+    """
+    계정 삭제를 요청합니다.
+    계정을 바로 비활성화하고 삭제 요청 일시만 기록합니다.
+    할일과 계정은 백그라운드 작업(accounts.py)이 나눠서 삭제합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        db_user: 삭제할 사용자 객체
+    
+    Returns:
+        User: 삭제 요청이 기록된 사용자 객체
+    """
+    db_user.is_active = False
+    db_user.deleted_at = models.get_kst_now()
+    db.commit()
+    db.refresh(db_user)
+    todo_cache.invalidate_owner(db_user.id)  # 이 사용자의 조회 캐시 무효화
+    return db_user
+
 # ====== 할일 관련 CRUD 함수들 ======
 
-def get_todos(db: Session, owner_id: int, skip: int = 0, limit: int = 100):
+def get_todos(db: Session, owner_id: int, skip: int = 0, limit: int = 100, due_before: Optional[datetime] = None):
     """
     특정 사용자의 할일 목록을 조회합니다.
-    우선순위 순으로 정렬됩니다. (1: 높음, 2: 보통, 3: 낮음)
+    사용자가 직접 정한 순서(rank)대로 정렬되며, (owner_id, rank) 인덱스 순서 그대로 읽습니다.
+    같은 조건의 결과는 캐시되어, 할일이 바뀌기 전까지 DB를 다시 조회하지 않습니다.
     
     Args:
         db: 데이터베이스 세션
         owner_id: 할일 소유자의 사용자 ID
         skip: 건너뛸 레코드 수 (페이지네이션용)
         limit: 반환할 최대 레코드 수
+        due_before: 이 일시 이전에 마감되는 할일만 조회 (선택, (owner_id, due_at) 인덱스 사용)
     
     Returns:
-        List[Todo]: 해당 사용자의 할일 목록 (우선순위순)
+        List[TodoResponse]: 해당 사용자의 할일 목록 (사용자가 정한 순서)
     """
-    return db.query(models.Todo).filter(models.Todo.owner_id == owner_id).order_by(models.Todo.priority, models.Todo.created_at.desc()).offset(skip).limit(limit).all()
+    due_before = to_kst_naive(due_before)
+    
+    def load():
+        query = db.query(models.Todo).filter(models.Todo.owner_id == owner_id)
+        if due_before is not None:
+            query = query.filter(models.Todo.due_at < due_before)
+        todos = query.order_by(models.Todo.rank, models.Todo.id).offset(skip).limit(limit).all()
+        return [TodoResponse.model_validate(todo).model_dump(mode="json") for todo in todos]
+    
+    if db.info.get("atomic"):
+        # atomic 묶음 안에서는 아직 커밋되지 않은 값이므로 캐시에 넣지 않습니다
+        cached = load()
+    else:
+        params = ("list", skip, limit, due_before.isoformat() if due_before else "")
+        cached = todo_cache.get_or_load(owner_id, params, load)
+    return [TodoResponse.model_validate(todo) for todo in cached]
 
 def get_todo(db: Session, todo_id: int, owner_id: int):
     """
     특정 ID의 할일을 조회합니다 (소유자 확인 포함).
+    결과는 캐시되어, 할일이 바뀌기 전까지 DB를 다시 조회하지 않습니다.
     
     Args:
         db: 데이터베이스 세션
@@ -203,9 +378,17 @@ def get_todo(db: Session, todo_id: int, owner_id: int):
         owner_id: 할일 소유자의 사용자 ID
     
     Returns:
-        Todo or None: 할일 객체 또는 None (없거나 권한 없는 경우)
+        TodoResponse or None: 할일 정보 또는 None (없거나 권한 없는 경우)
     """
-    return db.query(models.Todo).filter(models.Todo.id == todo_id, models.Todo.owner_id == owner_id).first()
+    def load():
+        todo = db.query(models.Todo).filter(models.Todo.id == todo_id, models.Todo.owner_id == owner_id).first()
+        return TodoResponse.model_validate(todo).model_dump(mode="json") if todo else None
+    
+    if db.info.get("atomic"):
+        cached = load()  # 아직 커밋되지 않은 값은 캐시에 넣지 않습니다
+    else:
+        cached = todo_cache.get_or_load(owner_id, ("todo", todo_id), load)
+    return TodoResponse.model_validate(cached) if cached is not None else None
 
 def create_todo(db: Session, todo: TodoCreate, owner_id: int):
     """
@@ -218,19 +401,69 @@ def create_todo(db: Session, todo: TodoCreate, owner_id: int):
     
     Returns:
         Todo: 생성된 할일 객체
-    """
-    # Pydantic 모델을 SQLAlchemy 모델로 변환 (소유자 ID 포함)
-    db_todo = models.Todo(
-        title=todo.title,
-        description=todo.description,
-        priority=todo.priority,
-        owner_id=owner_id  # 로그인한 사용자를 소유자로 설정
-    )
-    db.add(db_todo)  # 세션에 추가
-    db.commit()  # 데이터베이스에 커밋
+    
+    Raises:
+        RankConflictError: 동시에 순서 키가 계속 바뀌어 맨 뒤 자리를 정하지 못한 경우
+    """
+    def change():
+        # Pydantic 모델을 SQLAlchemy 모델로 변환 (소유자 ID 포함)
+        db_todo = models.Todo(
+            title=todo.title,
+            description=todo.description,
+            priority=todo.priority,
+            due_at=todo.due_at,
+            rank=key_between(last_rank(db, owner_id), None),  # 목록의 맨 뒤에 추가
+            owner_id=owner_id  # 로그인한 사용자를 소유자로 설정
+        )
+        db.add(db_todo)  # 세션에 추가
+        return db_todo
+    
+    # 동시에 추가된 할일이 같은 키를 먼저 받았으면(고유 인덱스 위반) 마지막 키를 다시 읽어 재시도
+    db_todo = commit_rank_change(db, change)
     db.refresh(db_todo)  # 생성된 ID 등 최신 정보로 갱신
+    todo_cache.invalidate_owner(owner_id)  # 이 사용자의 조회 캐시 무효화
+    notify_reminder(db, db_todo)  # 곧 마감되는 할일이면 알림 스케줄러에 등록
+    if len(db_todo.rank) > RANK_MAX_LENGTH:
+        after_commit(db, rank_rebalancer.request, owner_id)  # 키가 길어졌으면 백그라운드에서 재배치
     return db_todo
 
+def apply_todo_update(db_todo: models.Todo, todo: TodoUpdate):
+    """
+    할일 객체에 수정 데이터를 적용합니다 (커밋은 하지 않음).
+    단건 수정과 묶음 수정(update_todos_bulk)이 같은 규칙을 쓰도록 분리한 함수입니다.
+    
+    Args:
+        db_todo: 수정할 할일 객체
+        todo: 수정할 데이터 (None이 아닌 필드만 적용, due_at은 null을 보냈으면 지움)
+    """
+    if todo.title is not None:
+        db_todo.title = todo.title
+    if todo.description is not None:
+        db_todo.description = todo.description
+    if todo.completed is not None and todo.completed != db_todo.completed:
+        db_todo.completed = todo.completed
+        # 완료 시각 기록 (미완료로 되돌리면 지움) - 보관 작업의 기준이 됩니다
+        db_todo.completed_at = models.get_kst_now() if todo.completed else None
+    if todo.priority is not None:
+        db_todo.priority = todo.priority
+    # 보내지 않은 것(변경 없음)과 null을 보낸 것(마감 지우기)을 구분합니다
+    if "due_at" in todo.model_fields_set:
+        db_todo.due_at = todo.due_at
+
+def notify_reminder(db: Session, db_todo: models.Todo):
+    """
+    생성/수정된 할일의 마감 정보를 알림 스케줄러에 알려줍니다.
+    /batch의 atomic 묶음 안이면 묶음이 커밋된 뒤에 알려줍니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        db_todo: 커밋이 끝난 할일 객체
+    """
+    after_commit(
+        db, reminder_scheduler.notify,
+        db_todo.id, db_todo.owner_id, db_todo.title, db_todo.due_at, db_todo.completed
+    )
+
 def update_todo(db: Session, todo_id: int, todo: TodoUpdate, owner_id: int):
     """
     기존 할일을 수정합니다 (소유자 확인 포함).
@@ -249,18 +482,97 @@ def update_todo(db: Session, todo_id: int, todo: TodoUpdate, owner_id: int):
     
     if db_todo:
         # 제공된 필드만 업데이트 (None이 아닌 경우만)
-        if todo.title is not None:
-            db_todo.title = todo.title
-        if todo.description is not None:
-            db_todo.description = todo.description
-        if todo.completed is not None:
-            db_todo.completed = todo.completed
-        if todo.priority is not None:
-            db_todo.priority = todo.priority
+        apply_todo_update(db_todo, todo)
         
         db.commit()  # 변경사항 커밋
         db.refresh(db_todo)  # 최신 정보로 갱신
+        todo_cache.invalidate_owner(owner_id)  # 이 사용자의 조회 캐시 무효화
+        notify_reminder(db, db_todo)  # 마감이 바뀌었으면 알림 스케줄러에 등록
+    
+    return db_todo
+
+def update_todos_bulk(db: Session, updates: Dict[int, TodoUpdate], owner_id: int) -> Dict[int, TodoResponse]:
+    """
+    한 사용자의 여러 할일을 한 번의 조회와 한 번의 커밋으로 수정합니다 (소유자 확인 포함).
+    짧은 시간에 몰린 수정 요청을 묶어서 처리할 때 사용합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        updates: 할일 ID별 수정 데이터
+        owner_id: 할일 소유자의 사용자 ID
+    
+    Returns:
+        Dict[int, TodoResponse]: 수정된 할일 ID별 최신 정보 (없거나 권한 없는 ID는 빠짐)
+    """
+    db_todos = db.query(models.Todo).filter(
+        models.Todo.id.in_(list(updates)),
+        models.Todo.owner_id == owner_id
+    ).all()
+    
+    for db_todo in db_todos:
+        apply_todo_update(db_todo, updates[db_todo.id])
+    
+    db.commit()  # 모든 변경사항을 한 번에 커밋
+    todo_cache.invalidate_owner(owner_id)  # 이 사용자의 조회 캐시 무효화
+    for db_todo in db_todos:
+        notify_reminder(db, db_todo)  # 제목이 바뀌었을 수 있으므로 알림 스케줄러에 알림
+    return {db_todo.id: TodoResponse.model_validate(db_todo) for db_todo in db_todos}
+
+def move_todo(db: Session, todo_id: int, owner_id: int, prev_id: Optional[int] = None, next_id: Optional[int] = None):
+    """
+    할일을 두 할일 사이로 옮깁니다 (소유자 확인 포함).
+    두 이웃의 순서 키 사이에 새 키를 만들어, 옮긴 할일 한 행만 수정합니다.
+    새 키가 너무 길어지면 이 사용자의 순서 키 재배치를 백그라운드 작업에 요청합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        todo_id: 옮길 할일의 ID
+        owner_id: 할일 소유자의 사용자 ID
+        prev_id: 옮긴 뒤 바로 앞에 올 할일의 ID (맨 앞이면 None)
+        next_id: 옮긴 뒤 바로 뒤에 올 할일의 ID (맨 뒤면 None)
+    
+    Returns:
+        Todo or None: 옮긴 할일 객체 또는 None (없거나 권한 없는 경우)
+    
+    Raises:
+        ValueError: 이웃 할일이 없거나, 이웃의 순서가 목록과 맞지 않는 경우
+                    (동시에 순서 키가 계속 바뀐 경우의 RankConflictError 포함)
+    """
+    ids = {todo_id} | {i for i in (prev_id, next_id) if i is not None}
+    
+    def change():
+        todos = {
+            db_todo.id: db_todo
+            for db_todo in db.query(models.Todo).filter(models.Todo.id.in_(ids), models.Todo.owner_id == owner_id)
+        }
+        db_todo = todos.get(todo_id)
+        if db_todo is None:
+            return None
+        if todo_id in (prev_id, next_id):
+            raise ValueError("할일을 자기 자신의 옆으로 옮길 수 없습니다")
+        if any(i is not None and i not in todos for i in (prev_id, next_id)):
+            raise ValueError("이웃 할일을 찾을 수 없습니다. 목록을 새로고침한 뒤 다시 시도해주세요")
+        
+        prev_rank = todos[prev_id].rank if prev_id is not None else None
+        next_rank = todos[next_id].rank if next_id is not None else None
+        try:
+            new_rank = key_between(prev_rank, next_rank)
+        except ValueError:
+            # 이웃 키가 같아졌거나 비어 있으면 재배치로 바로잡습니다
+            rank_rebalancer.request(owner_id)
+            raise ValueError("목록 순서가 바뀌었습니다. 목록을 새로고침한 뒤 다시 시도해주세요")
+        # 옮긴 할일 한 행만, 읽었을 때의 키 그대로일 때만 수정
+        update_rank(db, todo_id, db_todo.rank, new_rank)
+        return db_todo
     
+    # 그사이 재배치/다른 이동이 있었으면 이웃 키를 다시 읽어 재시도
+    db_todo = commit_rank_change(db, change)
+    if db_todo is None:
+        return None
+    db.refresh(db_todo)
+    todo_cache.invalidate_owner(owner_id)  # 이 사용자의 조회 캐시 무효화
+    if len(db_todo.rank) > RANK_MAX_LENGTH:
+        after_commit(db, rank_rebalancer.request, owner_id)  # 키가 길어졌으면 백그라운드에서 재배치
     return db_todo
 
 def delete_todo(db: Session, todo_id: int, owner_id: int):
@@ -281,5 +593,79 @@ def delete_todo(db: Session, todo_id: int, owner_id: int):
     if db_todo:
         db.delete(db_todo)  # 세션에서 삭제
         db.commit()  # 데이터베이스에서 실제로 삭제
+        todo_cache.invalidate_owner(owner_id)  # 이 사용자의 조회 캐시 무효화
+    
+    return db_todo
+
+# ====== 보관된 할일 관련 CRUD 함수들 ======
+
+def get_archived_todos(db: Session, owner_id: int, before_id: Optional[int] = None, limit: int = 50):
+    """
+    특정 사용자의 보관된 할일 목록을 ID 역순으로 조회합니다.
+    
+    OFFSET 대신 마지막으로 받은 ID(before_id)를 기준으로 다음 페이지를 조회하므로
+    (keyset paging) 보관된 할일이 아무리 많아도 페이지마다 조회 시간이 일정합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        owner_id: 할일 소유자의 사용자 ID
+        before_id: 이전 페이지의 마지막 ID (첫 페이지면 None)
+        limit: 반환할 최대 레코드 수
+    
+    Returns:
+        List[ArchivedTodo]: 보관된 할일 목록 (최근 ID 순)
+    """
+    query = db.query(models.ArchivedTodo).filter(models.ArchivedTodo.owner_id == owner_id)
+    if before_id is not None:
+        query = query.filter(models.ArchivedTodo.id < before_id)
+    return query.order_by(models.ArchivedTodo.id.desc()).limit(limit).all()
+
+def unarchive_todo(db: Session, todo_id: int, owner_id: int):
+    """
+    보관된 할일을 다시 할일 목록(todos 테이블)으로 되돌립니다 (소유자 확인 포함).
+    보관 중에 원래 ID가 다른 할일에 쓰였을 수 있으므로 새 ID를 받습니다.
+    완료 일시를 지금으로 바꿔, 다음 보관 작업에서 바로 다시 보관되지 않게 합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        todo_id: 되돌릴 보관 할일의 보관 ID
+        owner_id: 할일 소유자의 사용자 ID
+    
+    Returns:
+        Todo or None: 되돌린 할일 객체 또는 None (없거나 권한 없는 경우)
+    
+    Raises:
+        RankConflictError: 동시에 순서 키가 계속 바뀌어 맨 뒤 자리를 정하지 못한 경우
+    """
+    def change():
+        archived = db.query(models.ArchivedTodo).filter(
+            models.ArchivedTodo.id == todo_id,
+            models.ArchivedTodo.owner_id == owner_id
+        ).first()
+        if archived is None:
+            return None
+        
+        db_todo = models.Todo(
+            title=archived.title,
+            description=archived.description,
+            priority=archived.priority,
+            completed=True,
+            completed_at=models.get_kst_now(),
+            created_at=archived.created_at,
+            due_at=archived.due_at,
+            rank=key_between(last_rank(db, owner_id), None),  # 목록의 맨 뒤로 되돌림
+            owner_id=owner_id
+        )
+        db.add(db_todo)
+        db.delete(archived)
+        return db_todo
     
+    # 추가와 삭제를 한 트랜잭션으로 커밋 (같은 키를 먼저 받은 할일이 있으면 재시도)
+    db_todo = commit_rank_change(db, change)
+    if db_todo is None:
+        return None
+    db.refresh(db_todo)
+    todo_cache.invalidate_owner(owner_id)  # 이 사용자의 조회 캐시 무효화
+    if len(db_todo.rank) > RANK_MAX_LENGTH:
+        after_commit(db, rank_rebalancer.request, owner_id)  # 키가 길어졌으면 백그라운드에서 재배치
     return db_todo
\ No newline at end of file
@@ -9,9 +9,16 @@ SQLAlchemy를 사용하여 데이터베이스와 연결을 관리합니다.
 - 환경변수(.env 파일)를 통해 데이터베이스 정보를 안전하게 관리합니다
 """
 import os
-from sqlalchemy import create_engine
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Request
+from fastapi.routing import APIRoute
 from dotenv import load_dotenv
 
 # .env 파일에서 환경변수를 로드합니다
@@ -58,7 +65,74 @@ SessionLocal = sessionmaker(
 # 예: class Todo(Base): ...
 Base = declarative_base()
 
-def get_db():
+# ====== 커넥션 점유 시간 통계 ======
+
+class PoolHoldStats:
+    """
+    커넥션을 풀에서 빌려간(checkout) 뒤 돌려줄(checkin) 때까지의 시간을 기록합니다
+    
+    점유 시간이 짧을수록 같은 풀 크기로 더 많은 요청을 처리할 수 있습니다.
+    최근 samples개의 값으로 중앙값(p50)과 p99를 계산합니다.
+    """
+
+    def __init__(self, samples: int = 1000):
+        self.checkouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._recent = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.perf_counter()
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        started = connection_record.info.pop("checkout_at", None)
+        if started is None:
+            return
+        held = time.perf_counter() - started
+        with self._lock:
+            self.checkouts += 1
+            self.total_seconds += held
+            self.max_seconds = max(self.max_seconds, held)
+            self._recent.append(held)
+
+    def stats(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+        def percentile(p):
+            return recent[min(len(recent) - 1, int(len(recent) * p))] * 1000 if recent else 0.0
+        return {
+            "checkouts": self.checkouts,
+            "avg_hold_ms": self.total_seconds / self.checkouts * 1000 if self.checkouts else 0.0,
+            "p50_hold_ms": percentile(0.50),
+            "p99_hold_ms": percentile(0.99),
+            "max_hold_ms": self.max_seconds * 1000,
+            "pool": engine.pool.status(),
+        }
+
+# 엔진의 커넥션 풀에 점유 시간 기록을 연결합니다
+pool_stats = PoolHoldStats()
+event.listen(engine, "checkout", pool_stats.on_checkout)
+event.listen(engine, "checkin", pool_stats.on_checkin)
+
+# ====== 요청별 세션 ======
+
+# /batch 안에서 실행되는 하위 요청의 scope에 묶음 정보(사용자, 공유 세션)를 담는 키
+BATCH_SCOPE_KEY = "todo.batch"
+
+def _reject_writes_in_read_only(session, flush_context, instances):
+    """
+    읽기 전용(GET) 요청의 세션에서 쓰기가 일어나면 막습니다
+    
+    읽기 전용 세션은 커밋할 것이 없으므로 커밋 없이 바로 커넥션을 반환합니다.
+    실수로 쓰기를 하면 조용히 버려지지 않도록 여기서 오류를 냅니다.
+    """
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("읽기 전용(GET) 요청에서는 데이터를 변경할 수 없습니다")
+
+event.listen(Session, "before_flush", _reject_writes_in_read_only)
+
+def get_db(request: Request):
     """
     데이터베이스 세션을 생성하고 반환하는 의존성 함수
     
@@ -75,12 +149,31 @@ def get_db():
         Session: SQLAlchemy 데이터베이스 세션 객체
         
     동작 과정:
-        1. 새로운 데이터베이스 세션 생성
-        2. API 함수에 세션 전달 (yield)
-        3. API 함수 실행 완료 후 세션 정리 (finally 블록)
+        1. 새로운 데이터베이스 세션 생성 (커넥션은 첫 쿼리를 실행할 때 빌려옴)
+        2. GET 요청이면 읽기 전용으로 표시 (커밋 없이 커넥션 반환)
+        3. API 함수에 세션 전달 (yield)
+        4. API 함수가 끝나면 EarlyReleaseRoute가 응답 변환 전에 커넥션을 반환
+        5. 마지막으로 세션 정리 (finally 블록)
+    
+    주의: 로그인이 필요한 API는 get_current_user가 같은 세션으로 사용자를 먼저 조회하므로,
+    커넥션은 API 함수가 시작되기 전(인증 단계)에 빌려오고 API 함수가 끝날 때까지 유지됩니다.
+    (조회한 사용자 객체를 API 함수에서 그대로 수정/저장할 수 있도록 같은 세션을 씁니다)
+    커넥션을 빌려오는 시점이 늦춰지는 것은 인증이 필요 없는 API뿐이고,
+    EarlyReleaseRoute가 줄여 주는 것은 API 함수가 끝난 뒤 응답 변환 동안의 점유 시간입니다.
+    
+    /batch의 하위 요청이면 새 세션을 만들지 않고 묶음 전체가 공유하는 세션을 전달합니다.
+    공유 세션은 /batch가 모든 하위 요청을 마친 뒤 닫습니다.
     """
+    batch = request.scope.get(BATCH_SCOPE_KEY)
+    if batch is not None:
+        yield batch.db
+        return
+    
     # 새로운 데이터베이스 세션 생성
-    db = SessionLocal()
+    # expire_on_commit=False: 커밋 후에도 객체 값을 유지하여, 세션을 먼저 닫아도 응답을 만들 수 있게 함
+    db = SessionLocal(expire_on_commit=False)
+    if request.method in ("GET", "HEAD"):
+        db.info["read_only"] = True
     try:
         # yield 키워드로 세션을 API 함수에 전달
         # 이 지점에서 API 함수가 실행되고, 완료되면 아래 finally로 이동
@@ -88,4 +181,85 @@ def get_db():
     finally:
         # API 함수 실행이 완료되면 (성공/실패 관계없이) 세션을 닫아 메모리 정리
         # 이는 데이터베이스 연결을 안전하게 해제하기 위한 중요한 단계입니다
-        db.close()
\ No newline at end of file
+        db.close()
+
+def after_commit(db: Session, callback, *args):
+    """
+    저장이 확정된 뒤에 해야 하는 작업(알림 등록, 백그라운드 작업 깨우기 등)을 실행합니다
+    
+    보통은 이미 커밋한 뒤에 호출되므로 바로 실행합니다.
+    /batch의 atomic 묶음 안에서는 하위 요청의 commit()이 실제 저장이 아니므로
+    묶음 전체가 커밋될 때까지 미루고, 묶음이 취소되면 실행하지 않습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        callback: 실행할 함수
+        *args: 함수에 넘길 값 (지금 시점의 값으로 고정됨)
+    """
+    pending = db.info.get("after_commit")
+    if pending is None:
+        callback(*args)
+    else:
+        pending.append((callback, args))
+
+def _release_sessions(kwargs: dict):
+    """API 함수에 전달된 세션들을 닫아 커넥션을 풀에 바로 돌려줍니다 (/batch 공유 세션 제외)"""
+    for value in kwargs.values():
+        if isinstance(value, Session) and not value.info.get("batch"):
+            value.close()
+
+class EarlyReleaseRoute(APIRoute):
+    """
+    API 함수가 끝나는 즉시 DB 커넥션을 반환하는 라우트 클래스
+    
+    FastAPI는 의존성(get_db) 정리를 응답 변환(JSON 직렬화)이 끝난 뒤에 실행하므로,
+    그동안 커넥션이 풀로 돌아가지 못합니다. 이 클래스는 API 함수가 데이터를 반환하면
+    바로 세션을 닫아, 직렬화하는 동안 다른 요청이 그 커넥션을 쓸 수 있게 합니다.
+    세션을 닫아도 이미 읽어 온 객체의 값은 그대로 남아 있어 응답을 만들 수 있습니다.
+    커넥션을 빌려오는 시점은 바꾸지 않습니다 (인증 단계의 첫 쿼리에서 빌려옴, get_db 참고).
+    
+    사용 예시:
+        app.router.route_class = EarlyReleaseRoute
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        if asyncio.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def wrapped(**values):
+                try:
+                    return await endpoint(**values)
+                finally:
+                    _release_sessions(values)
+        else:
+            @functools.wraps(endpoint)
+            def wrapped(**values):
+                try:
+                    return endpoint(**values)
+                finally:
+                    _release_sessions(values)
+        super().__init__(path, wrapped, **kwargs)
+
+def add_missing_columns(bind, metadata):
+    """
+    이미 있는 테이블에 모델에 새로 추가된 컬럼과 인덱스를 만들어 줍니다
+    
+    create_all()은 없는 테이블만 만들고, 기존 테이블의 구조는 바꾸지 않습니다.
+    그래서 모델에 컬럼을 추가하면 기존 DB에는 그 컬럼이 없어 오류가 납니다.
+    이 함수는 빠진 컬럼(NULL 허용)을 ALTER TABLE로 추가하고 빠진 인덱스를 생성합니다.
+    
+    Args:
+        bind: 데이터베이스 엔진
+        metadata: 모델 정보가 담긴 Base.metadata
+    """
+    inspector = inspect(bind)
+    with bind.begin() as conn:
+        for table in metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=bind.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+JWT 토큰 처리(백엔드) 모듈
+
+이 파일의 역할:
+1. JWT 토큰 생성/검증을 한 가지 라이브러리(PyJWT)로 처리합니다
+2. 서명 키와 알고리즘 객체를 처음 한 번만 준비하고 이후에는 재사용합니다
+3. 다른 JWT 라이브러리로 바꿔 끼울 수 있도록 백엔드 등록 기능을 제공합니다
+
+초보자를 위한 설명:
+- 예전에는 PyJWT와 python-jose를 둘 다 설치했지만 실제로는 하나만 있으면 됩니다
+  → 설치 크기와 서버 시작 시 읽어 들이는 모듈이 줄어듭니다
+- 라이브러리는 첫 토큰을 만들거나 검증할 때 불러옵니다 (서버 시작을 늦추지 않음)
+- RS256 같은 공개키 방식은 PEM 키를 해석하는 비용이 크므로, 한 번 해석한 키를 계속 씁니다
+- JWT_BACKEND 환경변수로 register_jwt_backend()에 등록한 다른 백엔드를 고를 수 있습니다
+- 설정이 잘못되었으면(공개키 방식인데 키가 없는 등) 첫 로그인이 아니라 서버 시작 때 알려줍니다
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ====== JWT 설정 ======
+
+# 사용할 JWT 백엔드 이름 (register_jwt_backend로 등록된 이름)
+JWT_BACKEND = os.getenv("JWT_BACKEND", "pyjwt")
+
+# JWT 서명 알고리즘 (HS256: 비밀키 방식, RS256/ES256 등: 공개키 방식)
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+
+# 공개키 방식일 때 사용할 PEM 형식의 개인키/공개키 (HS 계열은 SECRET_KEY 사용)
+JWT_PRIVATE_KEY = os.getenv("JWT_PRIVATE_KEY")
+JWT_PUBLIC_KEY = os.getenv("JWT_PUBLIC_KEY")
+
+class TokenError(Exception):
+    """토큰이 잘못되었거나 만료된 경우 백엔드가 발생시키는 예외"""
+
+class JWTConfigError(RuntimeError):
+    """JWT 설정(백엔드 이름, 알고리즘, 키)이 잘못된 경우의 예외"""
+
+def _missing_keys(algorithm: str, private_key: Optional[str], public_key: Optional[str]) -> List[str]:
+    """공개키 방식 알고리즘에 필요한데 설정되지 않은 키의 환경변수 이름들"""
+    if algorithm.startswith("HS"):
+        return []
+    return [name for name, value in (("JWT_PRIVATE_KEY", private_key), ("JWT_PUBLIC_KEY", public_key)) if not value]
+
+class PyJWTBackend:
+    """
+    PyJWT를 사용하는 JWT 백엔드
+
+    Args:
+        secret: HS 계열 알고리즘의 비밀키
+        algorithm: 서명 알고리즘 이름
+        private_key: 공개키 방식의 개인키 (PEM)
+        public_key: 공개키 방식의 공개키 (PEM)
+    """
+
+    def __init__(self, secret: str, algorithm: str = JWT_ALGORITHM,
+                 private_key: str = JWT_PRIVATE_KEY, public_key: str = JWT_PUBLIC_KEY):
+        import jwt  # 첫 사용 시점에 불러옵니다
+
+        missing = _missing_keys(algorithm, private_key, public_key)
+        if missing:
+            raise JWTConfigError(f"{algorithm} 알고리즘을 쓰려면 {', '.join(missing)}에 PEM 형식의 키를 설정해야 합니다")
+
+        self._jwt = jwt
+        self.algorithm = algorithm
+        self._algorithms = [algorithm]
+
+        # 키를 한 번만 해석해 두고 이후 모든 토큰에 재사용합니다
+        algorithm_object = jwt.get_algorithm_by_name(algorithm)
+        if algorithm.startswith("HS"):
+            self._signing_key = self._verifying_key = algorithm_object.prepare_key(secret)
+        else:
+            self._signing_key = algorithm_object.prepare_key(private_key)
+            self._verifying_key = algorithm_object.prepare_key(public_key)
+
+    def encode(self, claims: dict) -> str:
+        return self._jwt.encode(claims, self._signing_key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict:
+        try:
+            return self._jwt.decode(token, self._verifying_key, algorithms=self._algorithms)
+        except self._jwt.InvalidTokenError as error:
+            raise TokenError(str(error)) from error
+
+# 이름 -> 백엔드를 만드는 함수 (secret을 받아 encode/decode를 가진 객체를 반환)
+_BACKENDS: Dict[str, Callable[[str], object]] = {"pyjwt": PyJWTBackend}
+
+# (백엔드 이름, 알고리즘, 비밀키) -> 준비된 백엔드 객체
+_backends: Dict[Tuple[str, str, str], object] = {}
+_backend_lock = threading.Lock()
+
+def register_jwt_backend(name: str, factory: Callable[[str], object]):
+    """
+    JWT 백엔드를 등록합니다
+
+    Args:
+        name: JWT_BACKEND 환경변수에 쓸 이름
+        factory: 비밀키를 받아 encode(claims)/decode(token) 메서드를 가진 객체를 만드는 함수
+                 (decode는 잘못된 토큰에 TokenError를 발생시켜야 합니다)
+    """
+    _BACKENDS[name] = factory
+
+def check_jwt_settings(
+    backend: str = JWT_BACKEND,
+    algorithm: str = JWT_ALGORITHM,
+    private_key: Optional[str] = JWT_PRIVATE_KEY,
+    public_key: Optional[str] = JWT_PUBLIC_KEY,
+):
+    """
+    JWT 설정을 확인합니다 (서버 시작 시 호출)
+
+    라이브러리를 불러오지 않고 설정 값만 확인하므로 서버 시작을 늦추지 않습니다.
+
+    Raises:
+        JWTConfigError: 등록되지 않은 백엔드이거나, 공개키 방식인데 키가 설정되지 않은 경우
+    """
+    if backend not in _BACKENDS:
+        raise JWTConfigError(f"등록되지 않은 JWT_BACKEND입니다: {backend} (사용 가능: {', '.join(_BACKENDS)})")
+    missing = _missing_keys(algorithm, private_key, public_key)
+    if missing:
+        raise JWTConfigError(
+            f"JWT_ALGORITHM={algorithm}을 쓰려면 {', '.join(missing)} 환경변수에 PEM 형식의 키를 설정해야 합니다"
+        )
+
+def get_jwt_backend(secret: str):
+    """
+    설정된 JWT 백엔드를 비밀키별로 처음 한 번 만들고 이후에는 같은 객체를 반환합니다
+
+    (백엔드 이름, 알고리즘, 비밀키)마다 따로 준비하므로 다른 비밀키를 넘기면 그 키로 처리합니다.
+    """
+    key = (JWT_BACKEND, JWT_ALGORITHM, secret)
+    backend = _backends.get(key)
+    if backend is None:
+        with _backend_lock:
+            backend = _backends.get(key)
+            if backend is None:
+                backend = _backends[key] = _BACKENDS[JWT_BACKEND](secret)
+    return backend
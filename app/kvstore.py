@@ -0,0 +1,59 @@
+"""
+공유 키-값 저장소 연결 모듈
+
+이 파일의 역할:
+1. 여러 워커가 함께 쓰는 키-값 저장소(Redis 등)에 연결합니다
+2. Redis 없이 개발/테스트할 수 있도록 같은 방식으로 동작하는 로컬 대체 클라이언트를 제공합니다
+
+초보자를 위한 설명:
+- 로그인 시도 제한, 조회 캐시 등은 워커가 여러 개일 때 상태를 공유해야 합니다
+- 이 모듈의 클라이언트는 Redis와 같은 get / set(ex=) / delete 방식만 사용합니다
+- 그래서 실제 Redis와 LocalKeyValueClient를 서로 바꿔 끼울 수 있습니다
+"""
+
+import threading
+import time
+from typing import Optional
+
+class LocalKeyValueClient:
+    """
+    Redis 클라이언트의 get / set(ex=) / delete 동작을 흉내내는 로컬 대체 클라이언트
+
+    Redis 없이 공유 저장소를 쓰는 코드를 테스트할 때 사용합니다.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.time()):
+                return None
+            return entry[1]
+
+    def set(self, key: str, value, ex: Optional[int] = None):
+        with self._lock:
+            expires_at = time.time() + ex if ex else None
+            self._data[key] = (expires_at, value)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+def connect_key_value_store(url: str):
+    """
+    URL로 공유 키-값 저장소에 연결합니다
+
+    "local://"이면 프로세스 안의 LocalKeyValueClient를,
+    그 외(redis://...)에는 Redis 클라이언트(redis 패키지 별도 설치 필요)를 반환합니다.
+
+    Args:
+        url: 저장소 주소 (예: redis://localhost:6379/0)
+    """
+    if url.startswith("local://"):
+        return LocalKeyValueClient()
+    import redis  # 공유 저장소를 쓸 때만 필요하므로 여기서 가져옵니다
+    return redis.Redis.from_url(url)
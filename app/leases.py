@@ -0,0 +1,74 @@
+"""
+백그라운드 작업 실행권(lease) 모듈
+
+이 파일의 역할:
+1. 워커(프로세스)가 여러 개일 때 백그라운드 작업을 한 워커에서만 실행하게 합니다
+2. 실행권은 DB(job_leases 테이블)에 저장하므로 Redis 같은 별도 저장소가 필요 없습니다
+3. 실행권에 만료 일시를 두어, 가진 워커가 죽어도 다른 워커가 이어받을 수 있게 합니다
+
+초보자를 위한 설명:
+- uvicorn --workers 4로 실행하면 서버 시작 작업(lifespan)도 4번 실행되어
+  보관 작업이나 마감 알림이 4개의 워커에서 동시에 돌아갑니다
+- 동시에 돌면 같은 할일을 두 번 보관하거나 같은 알림을 여러 번 보내게 됩니다
+- 작업 전에 try_acquire_lease()로 실행권을 얻은 워커만 실행하고, 나머지는 건너뜁니다
+- 실행권 얻기는 "만료되었거나 내가 가진 행만 갱신, 없으면 추가"로 처리하므로
+  두 워커가 동시에 시도해도 DB의 기본 키 제약조건 덕분에 한 워커만 성공합니다
+"""
+
+import os
+import socket
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from . import models
+from .database import SessionLocal
+
+# 이 워커의 식별자 (같은 호스트의 다른 워커, 재시작한 워커와도 구분됨)
+LEASE_HOLDER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+def try_acquire_lease(name: str, ttl_seconds: float) -> bool:
+    """
+    작업 실행권을 얻거나, 이미 가지고 있으면 만료 일시를 연장합니다
+
+    Args:
+        name: 작업 이름
+        ttl_seconds: 실행권을 유지할 시간 (초) - 이 시간 안에 다시 호출하여 연장해야 합니다
+
+    Returns:
+        bool: 이 워커가 실행권을 가졌으면 True
+    """
+    JobLease = models.JobLease
+    now = models.get_kst_now().replace(tzinfo=None)  # DB 저장 형식(시간대 없는 한국 시간)
+    expires_at = now + timedelta(seconds=ttl_seconds)
+
+    db = SessionLocal()
+    try:
+        updated = db.query(JobLease).filter(
+            JobLease.name == name,
+            or_(JobLease.holder == LEASE_HOLDER, JobLease.expires_at < now)
+        ).update({JobLease.holder: LEASE_HOLDER, JobLease.expires_at: expires_at}, synchronize_session=False)
+        if not updated:
+            # 행이 없으면 새로 추가 (다른 워커가 가지고 있으면 기본 키 중복으로 실패)
+            db.add(JobLease(name=name, holder=LEASE_HOLDER, expires_at=expires_at))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+def release_lease(name: str):
+    """이 워커가 가진 작업 실행권을 바로 내려놓아 다른 워커가 이어받을 수 있게 합니다"""
+    db = SessionLocal()
+    try:
+        db.query(models.JobLease).filter(
+            models.JobLease.name == name,
+            models.JobLease.holder == LEASE_HOLDER
+        ).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
@@ -23,33 +23,105 @@ FastAPI 메인 애플리케이션 모듈
 """
 
 # ====== 필요한 라이브러리들을 가져옵니다 ======
-from fastapi import FastAPI, Depends, HTTPException, status  # FastAPI 핵심 기능들
+from fastapi import FastAPI, Depends, HTTPException, status, BackgroundTasks, Request  # FastAPI 핵심 기능들
 from fastapi.middleware.cors import CORSMiddleware          # CORS 처리를 위한 미들웨어
 from sqlalchemy.orm import Session                          # 데이터베이스 세션 타입
-from typing import List                                     # 리스트 타입 힌트
-from datetime import timedelta                              # 토큰 만료 시간 설정용
+from sqlalchemy.exc import IntegrityError                   # unique 제약조건 위반 처리용
+from typing import List, Optional                           # 리스트/선택 타입 힌트
+from datetime import datetime, timedelta                    # 마감 일시 필터, 토큰 만료 시간 설정용
+from contextlib import asynccontextmanager                  # 서버 시작/종료 시 실행할 작업 정의용
+import math                                                 # Retry-After 초 단위 올림용
+import threading                                            # 시작 준비 작업을 백그라운드에서 실행
 
 # ====== 우리가 만든 모듈들을 가져옵니다 ======
 from . import crud, models                                  # CRUD 함수들과 데이터베이스 모델
-from .database import SessionLocal, engine, get_db         # 데이터베이스 연결 관련
+from .database import (                                     # 데이터베이스 연결 관련
+    SessionLocal, engine, get_db, add_missing_columns,
+    EarlyReleaseRoute, pool_stats, BATCH_SCOPE_KEY, after_commit
+)
 from .crud import (
-    TodoCreate, TodoUpdate, TodoResponse,                   # 할일 관련 스키마
-    UserCreate, UserLogin, UserResponse, Token             # 사용자 관련 스키마
+    TodoCreate, TodoUpdate, TodoMove, TodoResponse,        # 할일 관련 스키마
+    ArchivedTodoResponse,
+    UserCreate, UserLogin, UserResponse, Token,            # 사용자 관련 스키마
+    UserAvailability,
+    BatchRequest, BatchResponse                            # 묶음 요청 스키마
 )
 from .auth import (
     authenticate_user, create_access_token,                 # 인증 관련 함수
-    get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES    # 사용자 확인 함수
+    get_current_active_user, ACCESS_TOKEN_EXPIRE_MINUTES,   # 사용자 확인 함수
+    configure_password_hashing,                             # bcrypt 라운드 보정
+    require_metrics_access                                  # 통계 엔드포인트 접근 확인
+)
+from .jwt_backend import check_jwt_settings                 # JWT 설정 확인 (잘못되면 서버 시작 시 바로 실패)
+from .rate_limit import get_client_ip, login_throttle, login_throttle_keys  # 로그인 시도 제한
+from .availability import user_index, check_availability    # 사용자명/이메일 필터
+from .admission import AdmissionControlMiddleware, admission_stats  # 과부하 시 요청 수용 제어
+from .cache import todo_cache                               # 할일 조회 결과 캐시
+from .archive import archive_worker, ARCHIVE_ENABLED        # 완료된 할일 보관 작업
+from .write_batching import write_coalescer, is_coalescible  # 할일 수정 묶음 커밋
+from .static_assets import get_assets, serve_asset          # 프론트엔드 정적 파일 제공
+from .reminders import reminder_scheduler, REMINDERS_ENABLED  # 마감 알림 스케줄러
+from .ordering import (                                     # 할일 순서 키 재배치
+    rank_rebalancer, backfill_ranks, prepare_unique_rank_index, RankConflictError
 )
+from .batch import run_batch                                # 여러 API 호출을 한 번에 실행
+from .accounts import account_purge_worker                  # 삭제 요청된 계정 정리 작업
+
+# ====== 서버 시작 시 준비 작업 ======
+# 모듈을 불러오는 시점에는 아무 작업도 하지 않고, 서버가 시작될 때(lifespan) 실행합니다
+# 새 워커가 빨리 요청을 받을 수 있도록 꼭 필요한 DB 초기화만 먼저 하고,
+# 나머지는 백그라운드에서 준비합니다
+
+def initialize_database():
+    """
+    데이터베이스 테이블들을 자동으로 생성합니다 (요청을 받기 전에 끝나야 하는 작업)
+    이미 테이블이 있다면 건드리지 않고, 없다면 새로 만듭니다
+    """
+    print("📊 데이터베이스 테이블을 확인하고 생성 중...")
+    models.Base.metadata.create_all(bind=engine)
+    # 기존 테이블에 새로 추가된 컬럼/인덱스가 없으면 추가합니다
+    # (순서 키 고유 인덱스는 겹치는 키를 먼저 비워야 만들 수 있습니다)
+    prepare_unique_rank_index(engine)
+    add_missing_columns(engine, models.Base.metadata)
+    print("✅ 데이터베이스 초기화 완료!")
 
-# ====== 데이터베이스 초기화 ======
-# 애플리케이션이 시작될 때 데이터베이스 테이블들을 자동으로 생성합니다
-# 이미 테이블이 있다면 건드리지 않고, 없다면 새로 만듭니다
-print("📊 데이터베이스 테이블을 확인하고 생성 중...")
-models.Base.metadata.create_all(bind=engine)
-print("✅ 데이터베이스 초기화 완료!")
+def warm_up():
+    """
+    첫 응답을 늦추지 않도록 백그라운드에서 미리 준비하는 작업
+    준비가 끝나기 전에 요청이 와도 각 기능이 느린 방법으로 올바르게 처리합니다
+    """
+    with SessionLocal() as db:
+        # 기존 사용자명/이메일로 사용 가능 여부 확인용 블룸 필터를 만듭니다
+        user_index.build(db)
+        # 순서 기능 이전에 만든 할일에 순서 키를 채웁니다 (예전 우선순위 정렬 순서 유지)
+        backfill_ranks(db)
+    # 현재 서버 CPU에 맞는 bcrypt 라운드를 측정하여 적용합니다 (첫 로그인이 기다리지 않도록)
+    print(f"🔐 bcrypt 라운드 {configure_password_hashing()} 적용")
+
+# ====== 서버 시작/종료 시 실행할 작업 ======
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버가 시작될 때 DB를 초기화하고 백그라운드 작업을 시작하며, 종료될 때 멈춥니다
+    """
+    check_jwt_settings()  # 공개키 방식인데 키가 없으면 첫 로그인이 아니라 지금 알려줍니다
+    initialize_database()
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+    if ARCHIVE_ENABLED:
+        archive_worker.start()  # 오래된 완료 할일 보관 작업
+    if REMINDERS_ENABLED:
+        reminder_scheduler.start()  # 마감 알림 스케줄러
+    rank_rebalancer.start()  # 길어진 순서 키 재배치
+    account_purge_worker.start()  # 삭제 요청된 계정 정리
+    yield
+    archive_worker.stop()
+    reminder_scheduler.stop()
+    rank_rebalancer.stop()
+    account_purge_worker.stop()
 
 # ====== FastAPI 애플리케이션 생성 ======
 app = FastAPI(
+    lifespan=lifespan,  # 서버 시작/종료 시 실행할 작업
     title="📝 할일 관리 API",  # 자동 생성되는 API 문서에 표시될 제목
     description="한국 시간 기준으로 작동하는 간단한 할일 관리 애플리케이션 API입니다.",  
     version="1.0.0",  # API 버전 (클라이언트가 호환성을 확인할 때 사용)
@@ -57,6 +129,15 @@ app = FastAPI(
     redoc_url="/redoc"  # ReDoc 문서 경로 (기본값)
 )
 
+# API 함수가 끝나면 응답 변환 전에 DB 커넥션을 바로 풀에 돌려주도록 설정
+# (아래에서 엔드포인트를 정의하기 전에 설정해야 적용됩니다)
+app.router.route_class = EarlyReleaseRoute
+
+# 요청 수용 제어 (Admission Control)
+# DB 연결 수보다 많은 요청이 몰리면 짧게 대기시키고, 넘치는 요청은 바로 503으로 거절
+# CORS 미들웨어보다 먼저 등록하여 503 응답에도 CORS 헤더가 붙도록 합니다
+app.add_middleware(AdmissionControlMiddleware)
+
 # CORS (Cross-Origin Resource Sharing) 설정
 # 프론트엔드가 다른 포트에서 실행되어도 API에 접근할 수 있도록 허용
 app.add_middleware(
@@ -79,6 +160,63 @@ def read_root():
     """
     return {"message": "할일 관리 API에 오신 것을 환영합니다!"}
 
+@app.get("/metrics/admission", dependencies=[Depends(require_metrics_access)])
+def read_admission_metrics():
+    """
+    요청 수용 제어 통계 엔드포인트
+    요청 종류별 처리 중인 요청 수, 대기열 길이, 거절 횟수를 반환합니다.
+    """
+    return admission_stats()
+
+@app.get("/metrics/cache", dependencies=[Depends(require_metrics_access)])
+def read_cache_metrics():
+    """
+    할일 조회 캐시 통계 엔드포인트
+    캐시 적중/실패 횟수, 적중률, 제거된 항목 수를 반환합니다.
+    """
+    return todo_cache.stats()
+
+@app.get("/metrics/writes", dependencies=[Depends(require_metrics_access)])
+def read_write_metrics():
+    """
+    할일 수정 묶음 처리 통계 엔드포인트
+    묶음 처리된 수정 요청 수, 커밋 횟수, 커밋당 요청 수를 반환합니다.
+    """
+    return write_coalescer.stats()
+
+@app.get("/metrics/db-pool", dependencies=[Depends(require_metrics_access)])
+def read_db_pool_metrics():
+    """
+    DB 커넥션 풀 통계 엔드포인트
+    커넥션을 빌려간 횟수와 점유 시간(평균, p50, p99, 최대), 현재 풀 상태를 반환합니다.
+    """
+    return pool_stats.stats()
+
+@app.get("/metrics/reminders", dependencies=[Depends(require_metrics_access)])
+def read_reminder_metrics():
+    """
+    마감 알림 스케줄러 상태 엔드포인트
+    힙에 올라간 알림 수, 가장 빠른 마감, 미리 읽어 둔 구간의 끝을 반환합니다.
+    """
+    return reminder_scheduler.stats()
+
+# ====== 프론트엔드 정적 파일 ======
+
+@app.get("/app/", include_in_schema=False)
+def read_frontend_index(request: Request):
+    """
+    프론트엔드 첫 페이지(index.html)를 제공합니다
+    """
+    return serve_asset(get_assets(), "index.html", request)
+
+@app.get("/app/{filename}", include_in_schema=False)
+def read_frontend_file(filename: str, request: Request):
+    """
+    프론트엔드 파일을 제공합니다
+    해시가 붙은 CSS/JS는 영구 캐시되고, HTML은 ETag로 변경 여부만 확인합니다.
+    """
+    return serve_asset(get_assets(), filename, request)
+
 # ====== 인증 관련 엔드포인트 ======
 
 @app.post("/signup", response_model=UserResponse)
@@ -97,54 +235,114 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 이미 존재하는 사용자명이나 이메일인 경우 400 에러
     """
-    # 중복 사용자명 확인
-    db_user = crud.get_user_by_username(db, username=user.username)
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 등록된 사용자명입니다"
-        )
+    # 중복 사용자명/이메일 확인
+    # 블룸 필터가 "있을 수도 있음"이라고 답한 경우에만 한 번의 쿼리로 함께 확인합니다
+    if user_index.username_may_exist(user.username) or user_index.email_may_exist(user.email):
+        existing = crud.get_users_by_username_or_email(db, username=user.username, email=user.email)
+        if any(u.username == user.username for u in existing):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 등록된 사용자명입니다"
+            )
+        if any(u.email == user.email for u in existing):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 등록된 이메일입니다"
+            )
     
-    # 중복 이메일 확인
-    db_user = crud.get_user_by_email(db, email=user.email)
-    if db_user:
+    # 새 사용자 생성
+    # 동시에 같은 값으로 가입하는 경우는 DB의 unique 제약조건이 최종적으로 막아줍니다
+    try:
+        db_user = crud.create_user(db=db, user=user)
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 등록된 이메일입니다"
+            detail="이미 등록된 사용자명 또는 이메일입니다"
         )
     
-    # 새 사용자 생성
-    return crud.create_user(db=db, user=user)
+    after_commit(db, user_index.add, db_user.username, db_user.email)
+    return db_user
+
+@app.get("/users/available", response_model=UserAvailability)
+def users_available(
+    username: Optional[str] = None,
+    email: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    사용자명/이메일 사용 가능 여부 확인 엔드포인트
+    회원가입 폼에서 입력하는 동안 중복 여부를 미리 알려줍니다.
+    
+    대부분의 요청은 메모리의 블룸 필터만으로 응답하며,
+    이미 사용 중일 가능성이 있는 값만 DB에서 확인합니다.
+    
+    Args:
+        username: 확인할 사용자명 (선택)
+        email: 확인할 이메일 (선택)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        UserAvailability: 각 값의 사용 가능 여부 (True: 사용 가능, False: 사용 중)
+    """
+    return check_availability(db, username=username, email=email)
 
 @app.post("/login", response_model=Token)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+def login(
+    user_credentials: UserLogin,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     로그인 엔드포인트
     사용자 인증 후 JWT 토큰을 발급합니다.
     
+    시도 횟수 제한을 DB 조회와 bcrypt 검증보다 먼저 확인하여
+    무차별 대입 공격이 서버 CPU를 소모하지 못하게 합니다.
+    
     Args:
         user_credentials: 로그인 정보 (사용자명, 비밀번호)
+        request: HTTP 요청 (클라이언트 IP 확인용, 자동 주입)
+        background_tasks: 비밀번호 재해시 등 응답 후 실행할 작업 (자동 주입)
         db: 데이터베이스 세션 (자동 주입)
     
     Returns:
         Token: JWT 액세스 토큰과 토큰 타입
     
     Raises:
-        HTTPException: 인증 실패 시 401 에러
+        HTTPException: 시도 횟수 초과 시 429 에러, 인증 실패 시 401 에러
     """
+    # 로그인 시도 제한 확인 (사용자명 + IP)
+    client_ip = get_client_ip(request)
+    throttle_keys = login_throttle_keys(user_credentials.username, client_ip)
+    retry_after = login_throttle.check(throttle_keys)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+    
     # 사용자 인증 확인
-    user = authenticate_user(db, user_credentials.username, user_credentials.password)
+    user = authenticate_user(
+        db, user_credentials.username, user_credentials.password, background_tasks
+    )
     if not user:
+        login_throttle.record_failure(throttle_keys)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자명 또는 비밀번호가 잘못되었습니다",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    login_throttle.record_success(throttle_keys)
+    
     # JWT 토큰 생성
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # 사용자명은 계정 삭제 후 다른 사람이 다시 쓸 수 있으므로 바뀌지 않는 사용자 ID를 넣습니다
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": str(user.id)}, expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
@@ -163,6 +361,71 @@ def read_users_me(current_user: models.User = Depends(get_current_active_user)):
     """
     return current_user
 
+@app.post("/me/deactivate", response_model=UserResponse)
+def deactivate_me(
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    내 계정을 비활성화합니다.
+    바로 로그인할 수 없게 되고, 이미 발급된 토큰도 사용할 수 없습니다. 할일은 그대로 남습니다.
+    
+    Args:
+        current_user: 현재 로그인한 사용자 (자동 주입)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        UserResponse: 비활성화된 사용자 정보
+    """
+    return crud.deactivate_user(db, current_user)
+
+@app.delete("/me", status_code=status.HTTP_202_ACCEPTED)
+def delete_me(
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    내 계정을 삭제합니다.
+    계정은 바로 비활성화되고, 할일과 계정 정보는 백그라운드에서 나눠서 삭제됩니다.
+    할일이 아주 많아도 응답은 바로 돌아갑니다 (202 Accepted).
+    
+    Args:
+        current_user: 현재 로그인한 사용자 (자동 주입)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        dict: 삭제 요청 접수 메시지
+    """
+    crud.request_account_deletion(db, current_user)
+    after_commit(db, account_purge_worker.request)  # 주기를 기다리지 않고 바로 정리 시작
+    return {"message": "계정 삭제 요청이 접수되었습니다. 잠시 후 모든 데이터가 삭제됩니다"}
+
+@app.post("/batch", response_model=BatchResponse)
+async def batch_requests(
+    batch: BatchRequest,
+    request: Request,
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 API 호출을 한 번의 요청으로 순서대로 실행합니다.
+    토큰 확인과 사용자 조회는 한 번만 하고, 모든 하위 요청이 같은 DB 세션을 씁니다.
+    
+    요청 예시:
+        {"operations": [{"method": "GET", "path": "/me"},
+                        {"method": "GET", "path": "/todos/"}]}
+    
+    Args:
+        batch: 하위 요청 목록과 atomic 여부 (atomic이면 한 트랜잭션으로 실행)
+        request: HTTP 요청 (하위 요청에 인증 헤더 등을 물려줌)
+        current_user: 현재 로그인한 사용자 (자동 주입)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        BatchResponse: 하위 요청별 상태 코드와 응답 본문, 저장 여부
+    """
+    return await run_batch(request.scope, batch.operations, current_user, db, atomic=batch.atomic)
+
 # ====== 할일 관련 엔드포인트 ======
 
 @app.post("/todos/", response_model=TodoResponse)
@@ -182,13 +445,20 @@ def create_todo(
     
     Returns:
         TodoResponse: 생성된 할일 정보
+    
+    Raises:
+        HTTPException: 동시에 목록 순서가 계속 바뀌어 저장하지 못한 경우 409 에러
     """
-    return crud.create_todo(db=db, todo=todo, owner_id=current_user.id)
+    try:
+        return crud.create_todo(db=db, todo=todo, owner_id=current_user.id)
+    except RankConflictError as error:
+        raise HTTPException(status_code=409, detail=str(error))
 
 @app.get("/todos/", response_model=List[TodoResponse])
 def read_todos(
     skip: int = 0, 
     limit: int = 100, 
+    due_before: Optional[datetime] = None,
     current_user: models.User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -198,15 +468,68 @@ def read_todos(
     Args:
         skip: 건너뛸 항목 수 (기본값: 0)
         limit: 반환할 최대 항목 수 (기본값: 100)
+        due_before: 이 일시 이전에 마감되는 할일만 조회 (선택)
         current_user: 현재 로그인한 사용자 (자동 주입)
         db: 데이터베이스 세션 (자동 주입)
     
     Returns:
         List[TodoResponse]: 현재 사용자의 할일 목록
     """
-    todos = crud.get_todos(db, owner_id=current_user.id, skip=skip, limit=limit)
+    todos = crud.get_todos(db, owner_id=current_user.id, skip=skip, limit=limit, due_before=due_before)
     return todos
 
+@app.get("/todos/archived", response_model=List[ArchivedTodoResponse])
+def read_archived_todos(
+    before_id: Optional[int] = None,
+    limit: int = 50,
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    현재 로그인한 사용자의 보관된 할일 목록을 조회합니다.
+    다음 페이지는 이전 응답의 마지막 id를 before_id로 넘겨서 조회합니다.
+    
+    Args:
+        before_id: 이전 페이지의 마지막 할일 ID (첫 페이지면 생략)
+        limit: 반환할 최대 항목 수 (기본값: 50)
+        current_user: 현재 로그인한 사용자 (자동 주입)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        List[ArchivedTodoResponse]: 보관된 할일 목록 (최근 ID 순)
+    """
+    return crud.get_archived_todos(db, owner_id=current_user.id, before_id=before_id, limit=limit)
+
+@app.post("/todos/archived/{todo_id}/unarchive", response_model=TodoResponse)
+def unarchive_todo(
+    todo_id: int,
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    보관된 할일을 다시 할일 목록으로 되돌립니다.
+    자신의 할일만 되돌릴 수 있으며, 되돌린 할일은 새 ID를 받습니다.
+    
+    Args:
+        todo_id: 되돌릴 보관 할일의 ID
+        current_user: 현재 로그인한 사용자 (자동 주입)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        TodoResponse: 되돌린 할일 정보
+    
+    Raises:
+        HTTPException: 보관된 할일을 찾을 수 없거나 접근 권한이 없는 경우 404 에러,
+                       동시에 목록 순서가 계속 바뀌어 저장하지 못한 경우 409 에러
+    """
+    try:
+        db_todo = crud.unarchive_todo(db, todo_id=todo_id, owner_id=current_user.id)
+    except RankConflictError as error:
+        raise HTTPException(status_code=409, detail=str(error))
+    if db_todo is None:
+        raise HTTPException(status_code=404, detail="보관된 할일을 찾을 수 없습니다")
+    return db_todo
+
 @app.get("/todos/{todo_id}", response_model=TodoResponse)
 def read_todo(
     todo_id: int, 
@@ -237,6 +560,8 @@ def read_todo(
 def update_todo(
     todo_id: int, 
     todo: TodoUpdate, 
+    request: Request,
+    coalesce: bool = False,
     current_user: models.User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -244,9 +569,16 @@ def update_todo(
     할일을 수정합니다.
     자신의 할일만 수정할 수 있습니다.
     
+    coalesce=true이고 제목/완료 상태/우선순위만 수정하는 경우,
+    짧은 시간 동안 모인 같은 사용자의 수정 요청과 함께 한 번에 커밋합니다.
+    응답은 커밋이 완료된 뒤에 반환됩니다.
+    /batch의 하위 요청은 이미 묶어서 처리되므로 coalesce를 무시합니다.
+    
     Args:
         todo_id: 수정할 할일의 ID
         todo: 수정할 데이터 (제목, 설명, 완료 상태, 우선순위)
+        request: HTTP 요청 (/batch 하위 요청인지 확인용)
+        coalesce: 수정 요청 묶음 커밋 사용 여부 (기본값: False)
         current_user: 현재 로그인한 사용자 (자동 주입)
         db: 데이터베이스 세션 (자동 주입)
     
@@ -256,7 +588,44 @@ def update_todo(
     Raises:
         HTTPException: 할일을 찾을 수 없거나 접근 권한이 없는 경우 404 에러
     """
-    db_todo = crud.update_todo(db, todo_id=todo_id, todo=todo, owner_id=current_user.id)
+    if coalesce and is_coalescible(todo) and BATCH_SCOPE_KEY not in request.scope:
+        db_todo = write_coalescer.submit(db, current_user.id, todo_id, todo)
+    else:
+        db_todo = crud.update_todo(db, todo_id=todo_id, todo=todo, owner_id=current_user.id)
+    if db_todo is None:
+        raise HTTPException(status_code=404, detail="할일을 찾을 수 없습니다")
+    return db_todo
+
+@app.post("/todos/{todo_id}/move", response_model=TodoResponse)
+def move_todo(
+    todo_id: int,
+    move: TodoMove,
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    할일을 목록에서 두 할일 사이로 옮깁니다 (드래그 앤 드롭).
+    자신의 할일만 옮길 수 있으며, 옮긴 할일 한 행만 수정됩니다.
+    
+    Args:
+        todo_id: 옮길 할일의 ID
+        move: 옮긴 뒤 바로 앞/뒤에 올 할일의 ID
+        current_user: 현재 로그인한 사용자 (자동 주입)
+        db: 데이터베이스 세션 (자동 주입)
+    
+    Returns:
+        TodoResponse: 옮긴 할일 정보
+    
+    Raises:
+        HTTPException: 할일을 찾을 수 없으면 404, 이웃 할일이 목록과 맞지 않으면 409 에러
+    """
+    try:
+        db_todo = crud.move_todo(
+            db, todo_id=todo_id, owner_id=current_user.id,
+            prev_id=move.prev_id, next_id=move.next_id
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=409, detail=str(error))
     if db_todo is None:
         raise HTTPException(status_code=404, detail="할일을 찾을 수 없습니다")
     return db_todo
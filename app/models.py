@@ -2,7 +2,7 @@
 데이터베이스 모델 정의 모듈
 SQLAlchemy ORM을 사용하여 Todo 테이블의 구조를 정의합니다.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone, timedelta
 from .database import Base
@@ -57,11 +57,17 @@ class User(Base):
     # created_at 컬럼: 계정 생성일시 (한국 표준시 기준)
     created_at = Column(DateTime, default=get_kst_now)
     
+    # deleted_at 컬럼: 계정 삭제를 요청한 일시 (삭제 요청이 없으면 NULL)
+    # 값이 있으면 백그라운드 작업이 할일을 나눠서 지운 뒤 계정을 삭제합니다 (accounts.py 참고)
+    deleted_at = Column(DateTime, nullable=True, index=True)
+    
     # todos 관계: 이 사용자가 작성한 모든 할일들
     # relationship(): SQLAlchemy에서 테이블 간의 관계를 정의
     # back_populates: Todo 모델의 owner와 연결
     # cascade: 사용자 삭제 시 관련 할일들도 함께 삭제
-    todos = relationship("Todo", back_populates="owner", cascade="all, delete-orphan")
+    # passive_deletes: 사용자를 삭제할 때 할일을 모두 메모리로 읽어 오지 않고
+    #                  DB의 ON DELETE CASCADE(또는 미리 나눠서 지운 결과)에 맡김
+    todos = relationship("Todo", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
 
 class Todo(Base):
     """
@@ -101,11 +107,93 @@ class Todo(Base):
     # default=get_kst_now: 한국 시간을 기본값으로 설정
     created_at = Column(DateTime, default=get_kst_now)
     
+    # completed_at 컬럼: 완료 처리된 일시 (한국 표준시 기준)
+    # 미완료 상태면 NULL, 오래된 완료 할일을 보관 테이블로 옮길 때 기준으로 사용
+    completed_at = Column(DateTime, nullable=True)
+    
+    # due_at 컬럼: 마감 일시 (한국 표준시 기준, 없으면 NULL)
+    due_at = Column(DateTime, nullable=True)
+    
+    # rank 컬럼: 사용자가 직접 정한 목록 순서 키 (사전순으로 정렬)
+    # 두 할일 사이로 옮길 때 옮긴 할일의 키만 바꾸면 됩니다 (ordering.py 참고)
+    rank = Column(String, nullable=True)
+    
     # owner_id 컬럼: 이 할일을 작성한 사용자의 ID (외래키)
     # ForeignKey(): 다른 테이블의 기본 키를 참조하는 외래키
     # nullable=False: 반드시 사용자가 지정되어야 함
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # ondelete="CASCADE": 사용자 행이 삭제되면 DB가 할일도 함께 삭제
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # owner 관계: 이 할일을 작성한 사용자 객체
     # back_populates: User 모델의 todos와 연결
-    owner = relationship("User", back_populates="todos")
\ No newline at end of file
+    owner = relationship("User", back_populates="todos")
+    
+    # 보관 작업이 "완료 + 오래된" 할일을 전체 스캔 없이 찾기 위한 인덱스
+    # (owner_id, due_at): 사용자별 마감 일시 필터(?due_before=)용 인덱스
+    # due_at: 알림 스케줄러가 전체 사용자의 다가오는 마감을 범위 조회하기 위한 인덱스
+    # (owner_id, rank): 사용자별 목록을 정렬 없이 순서대로 읽기 위한 인덱스
+    #   고유 인덱스라서 동시에 추가/옮기기를 해도 두 할일이 같은 키를 받지 못합니다 (NULL은 여러 개 가능)
+    __table_args__ = (
+        Index("ix_todos_completed_completed_at", "completed", "completed_at"),
+        Index("ix_todos_owner_id_due_at", "owner_id", "due_at"),
+        Index("ix_todos_due_at", "due_at"),
+        Index("uq_todos_owner_id_rank", "owner_id", "rank", unique=True),
+    )
+
+class ArchivedTodo(Base):
+    """
+    보관된 할일(ArchivedTodo) 모델 클래스
+    데이터베이스의 archived_todos 테이블과 매핑됩니다.
+    
+    초보자를 위한 설명:
+    - 완료된 지 오래된 할일은 todos 테이블에서 이 테이블로 옮겨집니다
+    - 자주 조회하는 todos 테이블을 작게 유지하여 목록 조회를 빠르게 합니다
+    - 보관된 할일은 /todos/archived에서 조회하고, 필요하면 되돌릴 수 있습니다
+    """
+    __tablename__ = "archived_todos"
+
+    # id 컬럼: 보관 테이블 자체의 ID (자동 증가, 되돌리기/페이지 조회에 사용)
+    # SQLite는 지운 행의 ID를 다시 쓰므로, todos의 ID를 그대로 쓰면 다른 할일과 겹칠 수 있습니다
+    id = Column(Integer, primary_key=True)
+    
+    # original_id 컬럼: todos 테이블에서 사용하던 ID (참고용, 겹칠 수 있으므로 unique 아님)
+    original_id = Column(Integer, nullable=True)
+    title = Column(String, nullable=False)
+    description = Column(String)
+    priority = Column(Integer, default=2)
+    created_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    due_at = Column(DateTime)
+    
+    # archived_at 컬럼: 보관 테이블로 옮겨진 일시
+    archived_at = Column(DateTime, default=get_kst_now)
+    
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    
+    # 사용자별 보관 목록을 ID 역순으로 페이지 단위 조회(keyset paging)하기 위한 인덱스
+    # sqlite_autoincrement: 지운 보관 행의 ID도 다시 쓰지 않습니다
+    __table_args__ = (
+        Index("ix_archived_todos_owner_id_id", "owner_id", "id"),
+        {"sqlite_autoincrement": True},
+    )
+
+class JobLease(Base):
+    """
+    백그라운드 작업 실행권(lease) 모델 클래스
+    데이터베이스의 job_leases 테이블과 매핑됩니다.
+    
+    초보자를 위한 설명:
+    - 워커(프로세스)가 여러 개면 각 워커가 같은 백그라운드 작업을 동시에 실행하게 됩니다
+    - 작업을 시작하기 전에 이 테이블의 행을 차지한 워커 하나만 실행합니다 (leases.py 참고)
+    - 실행권에는 만료 일시가 있어, 차지한 워커가 죽어도 시간이 지나면 다른 워커가 이어받습니다
+    """
+    __tablename__ = "job_leases"
+
+    # name 컬럼: 작업 이름 (예: "archive", "reminders")
+    name = Column(String, primary_key=True)
+    
+    # holder 컬럼: 실행권을 가진 워커의 식별자 (호스트명:프로세스ID:임의값)
+    holder = Column(String, nullable=False)
+    
+    # expires_at 컬럼: 실행권 만료 일시 (한국 표준시 기준)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,354 @@
+"""
+할일 수동 정렬(순서 키) 모듈
+
+이 파일의 역할:
+1. 두 할일 사이에 들어갈 "순서 키(rank)" 문자열을 만듭니다
+2. 키가 너무 길어진 사용자의 할일 순서 키를 백그라운드에서 다시 고르게 배치합니다
+3. 순서 키가 없는 기존 할일에 순서 키를 채워 넣습니다
+
+초보자를 위한 설명:
+- 순서를 1, 2, 3 같은 정수 위치로 저장하면, 하나를 옮길 때 뒤의 할일들을 모두 고쳐야 합니다
+- 대신 문자열 키를 사전순으로 정렬합니다. "a"와 "b" 사이에는 "am"을 넣을 수 있고,
+  "a"와 "am" 사이에는 "ag"를 넣을 수 있습니다 → 옮길 때 그 할일 한 행만 바꾸면 됩니다
+- 같은 자리에 계속 끼워 넣으면 키가 조금씩 길어지므로, 가끔 고르게 다시 배치합니다
+- 키에는 0-9, a-z만 사용하여 DB의 정렬 규칙(collation)과 관계없이 같은 순서가 되게 합니다
+- 맨 뒤에 추가할 때는 마지막 키를 36진수 숫자로 보고 1을 더하므로,
+  계속 추가해도 키 길이는 추가한 개수의 로그에 비례해서만 늘어납니다
+- 옮기기는 "읽었을 때 키 그대로인 경우에만" 그 할일 한 행을 바꾸고,
+  (owner_id, rank) 고유 인덱스가 두 할일이 같은 키를 받는 것을 막습니다
+  다른 작업(재배치, 동시 추가)과 겹쳤으면 내 변경을 취소하고 처음부터 다시 합니다
+"""
+
+import os
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy import bindparam, exists, func, inspect, select, text, update
+from sqlalchemy.exc import IntegrityError
+
+from . import models
+from .cache import todo_cache
+from .database import SessionLocal
+
+# ====== 순서 키 설정 ======
+
+# 키에 사용할 문자 (사전순 = 숫자 크기순)
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# 이보다 긴 키가 생기면 해당 사용자의 순서 키를 다시 배치합니다
+RANK_MAX_LENGTH = int(os.getenv("RANK_MAX_LENGTH", "16"))
+
+# 다시 배치할 때 한 번에 수정할 최대 행 수
+RANK_REBALANCE_BATCH_SIZE = int(os.getenv("RANK_REBALANCE_BATCH_SIZE", "1000"))
+
+# 재배치 작업 확인 간격 (초)
+RANK_REBALANCE_INTERVAL_SEC = float(os.getenv("RANK_REBALANCE_INTERVAL_SEC", "10"))
+
+# 다른 작업이 먼저 순서 키를 바꿨을 때 처음부터 다시 시도할 최대 횟수
+RANK_CONFLICT_RETRIES = int(os.getenv("RANK_CONFLICT_RETRIES", "3"))
+
+class RankConflictError(ValueError):
+    """다시 시도해도 다른 작업이 계속 먼저 순서 키를 바꾼 경우 (API에서는 409)"""
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    """
+    a < b인 두 키 사이의 키를 만듭니다 (b가 None이면 a보다 큰 키)
+
+    키는 끝자리가 "0"이 아니어야 항상 사이에 다른 키를 넣을 수 있습니다.
+    """
+    if b is not None:
+        # 공통 앞부분은 그대로 두고 나머지 부분 사이의 키를 찾습니다
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = RANK_DIGITS.index(a[0]) if a else 0
+    digit_b = RANK_DIGITS.index(b[0]) if b is not None else len(RANK_DIGITS)
+    if digit_b - digit_a > 1:
+        return RANK_DIGITS[(digit_a + digit_b + 1) // 2]
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return RANK_DIGITS[digit_a] + _midpoint(a[1:], None)
+
+def _key_after(a: str) -> str:
+    """
+    a보다 큰 키를 만듭니다 (맨 뒤에 추가)
+
+    a를 36진수 숫자로 보고 1을 더합니다. 모든 자리가 "z"라 더할 수 없으면
+    같은 길이만큼 자리를 늘리므로, 키 길이는 추가한 개수의 로그에 비례해서만 늘어납니다.
+    (예: "y" → "z" → "z1" → ... → "zz" → "zz01" → ... → "zzzz" → "zzzz0001")
+    """
+    digits = [RANK_DIGITS.index(c) for c in a]
+    i = len(digits) - 1
+    while i >= 0 and digits[i] == len(RANK_DIGITS) - 1:
+        digits[i] = 0  # 받아올림
+        i -= 1
+    if i < 0:
+        return a + "0" * (len(a) - 1) + "1"
+    digits[i] += 1
+    if digits[-1] == 0:
+        digits[-1] = 1  # 끝자리 "0"이면 사이에 키를 넣을 수 없으므로 하나 더 올립니다
+    return "".join(RANK_DIGITS[d] for d in digits)
+
+def key_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    두 순서 키 사이에 들어갈 새 키를 만듭니다
+
+    Args:
+        before: 앞에 올 할일의 키 (맨 앞에 넣으면 None)
+        after: 뒤에 올 할일의 키 (맨 뒤에 넣으면 None)
+
+    Returns:
+        str: before < 결과 < after 인 키
+
+    Raises:
+        ValueError: before가 after보다 크거나 같은 경우
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"{before!r}는 {after!r}보다 앞이어야 합니다")
+    if before and after is None:
+        return _key_after(before)
+    return _midpoint(before or "", after)
+
+def evenly_spaced_keys(count: int) -> List[str]:
+    """
+    count개의 키를 같은 길이, 같은 간격으로 만듭니다 (재배치용)
+
+    간격이 넉넉하므로 재배치 후에는 한동안 짧은 키로 끼워 넣을 수 있습니다.
+    """
+    width = 1
+    while len(RANK_DIGITS) ** width < (count + 1) * len(RANK_DIGITS):
+        width += 1
+    step = len(RANK_DIGITS) ** width // (count + 1)
+
+    keys = []
+    for i in range(1, count + 1):
+        value = step * i
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, len(RANK_DIGITS))
+            digits.append(RANK_DIGITS[remainder])
+        # 끝자리 "0"은 값에 영향이 없으므로 떼어 냅니다
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
+
+def _conflict() -> RankConflictError:
+    return RankConflictError("목록 순서가 바뀌었습니다. 목록을 새로고침한 뒤 다시 시도해주세요")
+
+def update_rank(db, todo_id: int, old_rank: Optional[str], new_rank: str):
+    """
+    할일 한 행의 순서 키를, 읽었을 때의 키 그대로일 때만 바꿉니다 (커밋하지 않음)
+
+    Raises:
+        RankConflictError: 그사이 다른 작업(재배치 등)이 이 할일의 키를 바꾼 경우
+    """
+    Todo = models.Todo
+    result = db.execute(
+        update(Todo)
+        .where(Todo.id == todo_id, Todo.rank.is_not_distinct_from(old_rank))
+        .values(rank=new_rank)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise _conflict()
+
+def commit_rank_change(db, change: Callable[[], object]):
+    """
+    순서 키를 바꾸는 작업을 실행하고 커밋하며, 다른 작업과 겹쳤으면 처음부터 다시 합니다
+
+    change()는 현재 키를 읽고 변경을 세션에 담습니다 (커밋하지 않음).
+    읽은 키가 그사이 바뀌었거나(RankConflictError), 같은 사용자의 다른 할일이
+    같은 키를 먼저 받았으면(고유 인덱스 위반) 롤백하고 change()를 다시 실행합니다.
+    /batch의 atomic 묶음 안에서는 롤백하면 묶음 전체가 취소되므로 다시 시도하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        change: 변경을 세션에 담고 결과를 반환하는 함수 (None을 반환하면 바꿀 것이 없음)
+
+    Returns:
+        change()의 결과
+
+    Raises:
+        RankConflictError: 다시 시도해도 계속 충돌한 경우
+    """
+    atomic = db.info.get("atomic", False)
+    for _ in range(1 if atomic else RANK_CONFLICT_RETRIES):
+        try:
+            result = change()
+            if result is None:
+                return None
+            db.commit()
+            return result
+        except (RankConflictError, IntegrityError):
+            if atomic:
+                break
+            db.rollback()
+    raise _conflict()
+
+def rebalance_owner(db, owner_id: int, batch_size: int = RANK_REBALANCE_BATCH_SIZE):
+    """
+    한 사용자의 모든 할일 순서 키를 현재 순서 그대로 고르게 다시 배치합니다
+
+    순서 키가 없는 할일(순서 기능 이전에 만든 할일)은 예전 정렬 순서대로 뒤에 붙입니다.
+    ID와 키만 읽어 오고, batch_size개씩 나눈 UPDATE를 하나의 트랜잭션으로 커밋하므로
+    조회하는 쪽에서 예전 키와 새 키가 섞여 보이지 않습니다.
+    행 잠금을 지원하는 DB는 읽은 행을 잠가(FOR UPDATE) 동시에 옮기는 작업이 기다리게 하고,
+    그 밖의 DB는 읽은 키 그대로인 행만 바꿔서 그사이 옮겨진 할일이 있으면 처음부터 다시 합니다.
+
+    Raises:
+        RankConflictError: 다시 시도해도 계속 충돌한 경우
+    """
+    table = models.Todo.__table__
+    # 1단계: 키를 비워 둡니다 (새 키가 아직 바꾸지 않은 다른 행의 예전 키와 겹쳐 고유 인덱스에 걸리지 않게)
+    clear_statement = (
+        update(table)
+        .where(table.c.id == bindparam("todo_id"), table.c.rank.is_not_distinct_from(bindparam("old_rank")))
+        .values(rank=None)
+    )
+    # 2단계: 새 키를 채웁니다
+    set_statement = (
+        update(table)
+        .where(table.c.id == bindparam("todo_id"))
+        .values(rank=bindparam("new_rank"))
+    )
+
+    def change():
+        rows = db.execute(
+            select(table.c.id, table.c.rank)
+            .where(table.c.owner_id == owner_id)
+            .order_by(table.c.rank.is_(None), table.c.rank, table.c.priority, table.c.created_at.desc())
+            .with_for_update()
+        ).all()
+
+        keys = evenly_spaced_keys(len(rows))
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            result = db.execute(clear_statement, [{"todo_id": row.id, "old_rank": row.rank} for row in batch])
+            if result.supports_sane_multi_rowcount() and result.rowcount != len(batch):
+                raise _conflict()
+        for start in range(0, len(rows), batch_size):
+            db.execute(set_statement, [
+                {"todo_id": row.id, "new_rank": key}
+                for row, key in zip(rows[start:start + batch_size], keys[start:start + batch_size])
+            ])
+        return len(rows)
+
+    commit_rank_change(db, change)
+    todo_cache.invalidate_owner(owner_id)
+
+def backfill_ranks(db) -> int:
+    """
+    순서 키가 없는 할일이 있는 사용자들의 순서 키를 채웁니다
+
+    Returns:
+        int: 처리한 사용자 수
+    """
+    Todo = models.Todo
+    owner_ids = db.execute(
+        select(Todo.owner_id).where(Todo.rank.is_(None)).group_by(Todo.owner_id)
+    ).scalars().all()
+    for owner_id in owner_ids:
+        try:
+            rebalance_owner(db, owner_id)
+        except RankConflictError:
+            # 요청 처리와 동시에 실행되므로, 계속 충돌하면 백그라운드 재배치에 넘깁니다
+            rank_rebalancer.request(owner_id)
+    return len(owner_ids)
+
+def prepare_unique_rank_index(bind):
+    """
+    기존 DB에 (owner_id, rank) 고유 인덱스를 만들 수 있게 준비합니다 (add_missing_columns 전에 호출)
+
+    예전의 고유하지 않은 인덱스를 지우고, 같은 사용자 안에서 키가 겹치는 할일(고유 인덱스가
+    생기기 전에 만든 것)의 키를 비웁니다. 비운 키는 backfill_ranks()가 다시 채웁니다.
+    """
+    inspector = inspect(bind)
+    if not inspector.has_table("todos"):
+        return
+    if "rank" not in {column["name"] for column in inspector.get_columns("todos")}:
+        return
+    if any(index["name"] == "uq_todos_owner_id_rank" for index in inspector.get_indexes("todos")):
+        return
+
+    table = models.Todo.__table__
+    earlier = table.alias("earlier")
+    with bind.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_todos_owner_id_rank"))
+        conn.execute(
+            update(table)
+            .where(exists().where(
+                earlier.c.owner_id == table.c.owner_id,
+                earlier.c.rank == table.c.rank,
+                earlier.c.id < table.c.id,
+            ))
+            .values(rank=None)
+        )
+
+def last_rank(db, owner_id: int) -> Optional[str]:
+    """사용자의 마지막 순서 키를 (owner_id, rank) 인덱스로 한 번에 찾습니다"""
+    return db.execute(
+        select(func.max(models.Todo.rank)).where(models.Todo.owner_id == owner_id)
+    ).scalar()
+
+class RankRebalancer:
+    """
+    키가 길어진 사용자의 순서 키를 백그라운드에서 다시 배치하는 작업
+
+    할일을 추가하거나 옮기다가 키가 RANK_MAX_LENGTH보다 길어지면 request()로 요청하고,
+    백그라운드 스레드가 주기적으로 요청된 사용자들을 처리합니다.
+    """
+
+    def __init__(self, interval: float = RANK_REBALANCE_INTERVAL_SEC):
+        self.interval = interval
+        self.rebalanced = 0
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def request(self, owner_id: int):
+        with self._lock:
+            self._pending.add(owner_id)
+
+    def run_once(self) -> int:
+        """요청된 사용자들의 순서 키를 다시 배치하고 처리한 사용자 수를 반환합니다"""
+        with self._lock:
+            owner_ids, self._pending = self._pending, set()
+
+        db = SessionLocal()
+        try:
+            for owner_id in owner_ids:
+                try:
+                    rebalance_owner(db, owner_id)
+                except RankConflictError:
+                    self.request(owner_id)  # 다음 주기에 다시 시도
+        finally:
+            db.close()
+        self.rebalanced += len(owner_ids)
+        return len(owner_ids)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as error:
+                # 한 번 실패해도 다음 주기에 다시 시도합니다
+                print(f"⚠️ 순서 키 재배치 실패: {error}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="rank-rebalancer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+# 애플리케이션 전체에서 공유하는 순서 키 재배치 작업
+rank_rebalancer = RankRebalancer()
@@ -0,0 +1,267 @@
+"""
+로그인 시도 제한(Throttling) 모듈
+
+이 파일의 역할:
+1. 사용자명과 클라이언트 IP별로 로그인 시도 횟수를 제한합니다 (토큰 버킷)
+2. 연속으로 실패하면 점점 더 오래 로그인을 막습니다 (지수 백오프)
+3. 제한 상태를 저장할 저장소를 바꿔 끼울 수 있게 합니다 (메모리 / 공유 저장소)
+
+초보자를 위한 설명:
+- 로그인 1회마다 bcrypt 검증이 실행되어 CPU를 많이 사용합니다
+- 누군가 틀린 비밀번호로 /login을 계속 호출하면 서버 CPU가 가득 찰 수 있습니다
+- 그래서 DB 조회나 bcrypt 검증 전에 먼저 시도 횟수를 확인하여 빠르게 거절합니다
+- 토큰 버킷: 버킷에 토큰이 일정 속도로 채워지고, 시도할 때마다 토큰 1개를 사용합니다
+- 워커(프로세스)가 여러 개라면 메모리 저장소는 워커마다 따로 동작하므로
+  Redis 같은 공유 저장소(KeyValueThrottleStore)를 사용해야 합니다
+"""
+
+import ipaddress
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from .kvstore import connect_key_value_store
+
+# ====== 제한 설정 ======
+
+# 사용자명별 버킷 크기와 충전 속도 (기본: 최대 5회, 1분에 5회 충전)
+LOGIN_USER_CAPACITY = float(os.getenv("LOGIN_USER_CAPACITY", "5"))
+LOGIN_USER_REFILL_PER_MIN = float(os.getenv("LOGIN_USER_REFILL_PER_MIN", "5"))
+
+# IP별 버킷 크기와 충전 속도 (여러 사용자가 같은 IP를 쓸 수 있으므로 더 넉넉하게)
+LOGIN_IP_CAPACITY = float(os.getenv("LOGIN_IP_CAPACITY", "20"))
+LOGIN_IP_REFILL_PER_MIN = float(os.getenv("LOGIN_IP_REFILL_PER_MIN", "20"))
+
+# 지수 백오프 설정: 허용 실패 횟수를 넘으면 1초, 2초, 4초 ... 최대 300초 동안 차단
+LOGIN_FREE_FAILURES = int(os.getenv("LOGIN_FREE_FAILURES", "3"))
+LOGIN_BACKOFF_BASE_SEC = float(os.getenv("LOGIN_BACKOFF_BASE_SEC", "1"))
+LOGIN_BACKOFF_MAX_SEC = float(os.getenv("LOGIN_BACKOFF_MAX_SEC", "300"))
+
+# 공유 저장소(Redis) 주소 - 설정하면 모든 워커가 같은 제한 상태를 공유합니다
+LOGIN_THROTTLE_REDIS_URL = os.getenv("LOGIN_THROTTLE_REDIS_URL")
+
+# 앞단 프록시(Nginx 등)의 주소 목록 (쉼표로 구분, 127.0.0.1 또는 10.0.0.0/8 형식)
+# 이 주소에서 온 요청만 X-Forwarded-For 헤더의 클라이언트 IP를 믿습니다
+TRUSTED_PROXIES = [
+    ipaddress.ip_network(value.strip(), strict=False)
+    for value in os.getenv("TRUSTED_PROXIES", "").split(",") if value.strip()
+]
+
+# ====== 상태 저장소 ======
+
+class InMemoryThrottleStore:
+    """
+    프로세스 메모리에 제한 상태를 저장하는 저장소
+
+    워커가 하나일 때 사용합니다. 가득 차면 가장 오래전에 저장된 항목부터 지워서
+    공격자가 임의의 사용자명을 보내도 메모리가 무한히 늘지 않게 합니다.
+    (저장할 때마다 맨 뒤로 옮기므로 맨 앞에서 꺼내면 되어, 항목 수와 관계없이 빠릅니다)
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key -> (만료 시각, 상태), 오래 저장된 순서
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return dict(entry[1])
+
+    def save(self, key: str, state: dict, ttl: float):
+        with self._lock:
+            now = time.monotonic()
+            self._data.pop(key, None)
+            while len(self._data) >= self.max_entries:
+                self._data.popitem(last=False)
+            self._data[key] = (now + ttl, dict(state))
+
+class KeyValueThrottleStore:
+    """
+    get/set(ex=)를 지원하는 키-값 저장소(Redis 등)에 제한 상태를 저장하는 저장소
+
+    여러 워커가 같은 저장소를 바라보므로 워커 수와 관계없이 제한이 적용됩니다.
+    읽기-수정-쓰기 사이의 경쟁은 허용하며, 그만큼 제한이 약간 느슨해질 수 있습니다.
+    """
+
+    def __init__(self, client, prefix: str = "login-throttle:"):
+        self.client = client
+        self.prefix = prefix
+
+    def load(self, key: str) -> Optional[dict]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def save(self, key: str, state: dict, ttl: float):
+        self.client.set(self.prefix + key, json.dumps(state), ex=max(1, int(ttl) + 1))
+
+# ====== 로그인 제한기 ======
+
+class LoginThrottle:
+    """
+    사용자명/IP별 토큰 버킷과 지수 백오프로 로그인 시도를 제한합니다
+
+    사용 순서:
+        1. check(): 시도 전에 호출, 차단 중이면 다시 시도할 때까지 남은 초를 반환
+        2. record_failure() 또는 record_success(): 인증 결과를 기록
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def _limits(self, key: str):
+        """키 종류(user:/ip:)에 맞는 (버킷 크기, 초당 충전량)을 반환합니다"""
+        if key.startswith("ip:"):
+            return LOGIN_IP_CAPACITY, LOGIN_IP_REFILL_PER_MIN / 60
+        return LOGIN_USER_CAPACITY, LOGIN_USER_REFILL_PER_MIN / 60
+
+    def _state(self, key: str, now: float) -> dict:
+        """저장된 상태를 불러와 경과 시간만큼 토큰을 충전합니다"""
+        capacity, refill = self._limits(key)
+        state = self.store.load(key) or {
+            "tokens": capacity, "updated": now, "failures": 0, "blocked_until": 0.0
+        }
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(capacity, state["tokens"] + elapsed * refill)
+        state["updated"] = now
+        return state
+
+    def _save(self, key: str, state: dict, now: float):
+        """버킷이 가득 차고 차단이 풀릴 때까지만 상태를 보관합니다"""
+        capacity, refill = self._limits(key)
+        refill_time = (capacity - state["tokens"]) / refill if refill > 0 else LOGIN_BACKOFF_MAX_SEC
+        ttl = max(refill_time, state["blocked_until"] - now, LOGIN_BACKOFF_MAX_SEC)
+        self.store.save(key, state, ttl)
+
+    def check(self, keys: Iterable[str]) -> float:
+        """
+        로그인 시도를 허용할지 확인하고, 허용되면 각 버킷에서 토큰 1개를 사용합니다
+
+        Args:
+            keys: 확인할 키 목록 (예: ["user:alice", "ip:1.2.3.4"])
+
+        Returns:
+            float: 0이면 허용, 0보다 크면 다시 시도할 때까지 기다려야 할 초
+        """
+        now = time.time()
+        states = {key: self._state(key, now) for key in keys}
+
+        retry_after = 0.0
+        for key, state in states.items():
+            _, refill = self._limits(key)
+            if state["blocked_until"] > now:
+                retry_after = max(retry_after, state["blocked_until"] - now)
+            elif state["tokens"] < 1:
+                wait = (1 - state["tokens"]) / refill if refill > 0 else LOGIN_BACKOFF_MAX_SEC
+                retry_after = max(retry_after, wait)
+
+        # 하나라도 막혀 있으면 토큰을 쓰지 않고 거절합니다
+        if retry_after > 0:
+            return retry_after
+
+        for key, state in states.items():
+            state["tokens"] -= 1
+            self._save(key, state, now)
+        return 0.0
+
+    def record_failure(self, keys: Iterable[str]):
+        """
+        로그인 실패를 기록합니다
+
+        허용 실패 횟수를 넘으면 실패할 때마다 차단 시간이 2배로 늘어납니다.
+        """
+        now = time.time()
+        for key in keys:
+            state = self._state(key, now)
+            state["failures"] += 1
+            excess = state["failures"] - LOGIN_FREE_FAILURES
+            if excess > 0:
+                backoff = min(LOGIN_BACKOFF_MAX_SEC, LOGIN_BACKOFF_BASE_SEC * 2 ** (excess - 1))
+                state["blocked_until"] = now + backoff
+            self._save(key, state, now)
+
+    def record_success(self, keys: Iterable[str]):
+        """
+        로그인 성공 시 사용자명의 연속 실패 횟수와 차단을 초기화합니다 (토큰은 그대로 유지)
+
+        IP 키는 초기화하지 않습니다. 그렇지 않으면 공격자가 중간중간 자기 계정으로
+        로그인하여 같은 IP에서의 무차별 대입 차단을 계속 풀 수 있습니다.
+        """
+        now = time.time()
+        for key in keys:
+            if not key.startswith("user:"):
+                continue
+            state = self._state(key, now)
+            state["failures"] = 0
+            state["blocked_until"] = 0.0
+            self._save(key, state, now)
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in TRUSTED_PROXIES)
+
+def get_client_ip(request) -> Optional[str]:
+    """
+    요청을 보낸 실제 클라이언트 IP를 찾습니다
+
+    Nginx 같은 프록시 뒤에서는 모든 요청의 접속 주소가 프록시 주소로 같습니다.
+    접속 주소가 TRUSTED_PROXIES에 있을 때만 X-Forwarded-For를 오른쪽(가까운 쪽)부터 읽어
+    신뢰하는 프록시가 아닌 첫 주소를 클라이언트 IP로 씁니다.
+    (클라이언트가 직접 보낸 헤더는 왼쪽에 붙으므로 위조해도 영향이 없습니다)
+
+    Args:
+        request: HTTP 요청
+
+    Returns:
+        Optional[str]: 클라이언트 IP (알 수 없으면 None)
+    """
+    client_ip = request.client.host if request.client else None
+    if client_ip is None or not _is_trusted_proxy(client_ip):
+        return client_ip
+
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for address in reversed([part.strip() for part in forwarded.split(",") if part.strip()]):
+        client_ip = address
+        if not _is_trusted_proxy(address):
+            break
+    return client_ip
+
+def login_throttle_keys(username: str, client_ip: Optional[str]) -> list:
+    """
+    로그인 시도에 적용할 제한 키 목록을 만듭니다
+
+    Args:
+        username: 로그인하려는 사용자명
+        client_ip: 요청을 보낸 클라이언트 IP (알 수 없으면 None)
+
+    Returns:
+        list: ["user:<사용자명>", "ip:<IP>"] 형태의 키 목록
+    """
+    keys = [f"user:{username}"]
+    if client_ip:
+        keys.append(f"ip:{client_ip}")
+    return keys
+
+def create_login_throttle() -> LoginThrottle:
+    """
+    환경변수에 맞는 저장소로 로그인 제한기를 생성합니다
+
+    LOGIN_THROTTLE_REDIS_URL이 있으면 Redis(별도 설치 필요)를,
+    없으면 프로세스 메모리를 저장소로 사용합니다.
+    """
+    if LOGIN_THROTTLE_REDIS_URL:
+        return LoginThrottle(KeyValueThrottleStore(connect_key_value_store(LOGIN_THROTTLE_REDIS_URL)))
+    return LoginThrottle(InMemoryThrottleStore())
+
+# 애플리케이션 전체에서 공유하는 로그인 제한기
+login_throttle = create_login_throttle()
@@ -0,0 +1,328 @@
+"""
+마감 알림 스케줄러 모듈
+
+이 파일의 역할:
+1. 곧 마감되는 할일만 메모리의 최소 힙(min-heap)에 올려 둡니다
+2. 마감 시각이 되면 알림 이벤트를 만들어 알림 전달 대상(sink)에 보냅니다
+3. 힙이 비어가면 due_at 인덱스를 이용한 범위 조회로 다음 구간을 채웁니다
+
+초보자를 위한 설명:
+- 매 순간 "마감된 할일이 있나?"를 전체 테이블에서 찾으면 할일이 많을수록 느려집니다
+- 대신 앞으로 몇 분(window) 안에 마감되는 할일만 미리 가져와 힙에 넣어 둡니다
+- 힙은 가장 빠른 마감이 항상 맨 앞에 있어서, 확인 비용이 할일 수와 거의 무관합니다
+- 다음 구간은 "마지막으로 가져온 (마감 일시, ID) 이후"부터 인덱스로 이어서 조회합니다
+- 알림 전달 대상(sink)은 바꿔 끼울 수 있습니다 (로그 출력, 메모리 수집, 이메일 등)
+- 워커가 여러 개여도 DB의 실행권(leases.py)을 가진 워커 하나만 알림을 보내므로 중복되지 않습니다
+- 다른 워커에서 생성/수정된 할일은 이 워커의 notify()로 전달되지 않으므로,
+  REMINDER_RESCAN_SEC마다 올려 둔 구간을 DB에서 다시 읽어 힙을 새로 만듭니다
+"""
+
+import heapq
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, select
+
+from . import models
+from .database import SessionLocal
+from .leases import release_lease, try_acquire_lease
+
+# ====== 알림 설정 ======
+
+# 알림 스케줄러 실행 여부
+REMINDERS_ENABLED = os.getenv("REMINDERS_ENABLED", "true").lower() == "true"
+
+# 미리 힙에 올려 둘 구간 (초) - 지금부터 이 시간 안에 마감되는 할일만 메모리에 둡니다
+REMINDER_WINDOW_SEC = float(os.getenv("REMINDER_WINDOW_SEC", "300"))
+
+# 한 번의 범위 조회로 가져올 최대 할일 수 (힙 크기의 상한)
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "1000"))
+
+# 마감 여부를 확인하는 간격 (초)
+REMINDER_TICK_SEC = float(os.getenv("REMINDER_TICK_SEC", "1"))
+
+# 올려 둔 구간을 DB에서 다시 읽는 간격 (초) - 다른 워커에서 바뀐 마감은 최대 이만큼 늦게 반영됩니다
+REMINDER_RESCAN_SEC = float(os.getenv("REMINDER_RESCAN_SEC", "30"))
+
+# 알림을 보낼 워커를 정하는 실행권의 유지 시간 (초)
+# 알림을 보내던 워커가 죽으면 최대 이 시간 뒤에 다른 워커가 이어받습니다
+REMINDER_LEASE_NAME = "reminders"
+REMINDER_LEASE_TTL_SEC = float(os.getenv("REMINDER_LEASE_TTL_SEC", "30"))
+
+# ====== 알림 전달 대상 (sink) ======
+
+class LogReminderSink:
+    """알림 이벤트를 서버 로그로 출력하는 전달 대상"""
+
+    def emit(self, event: dict):
+        print(f"⏰ 마감 알림: 사용자 {event['owner_id']}의 '{event['title']}' ({event['due_at']})")
+
+class InMemoryReminderSink:
+    """알림 이벤트를 메모리에 모아 두는 전달 대상 (로컬 확인/테스트용)"""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event: dict):
+        self.events.append(event)
+
+# ====== 스케줄러 ======
+
+class ReminderScheduler:
+    """
+    다가오는 마감만 최소 힙에 두고, 마감 시각에 알림을 보내는 스케줄러
+
+    힙에는 (마감 일시, 할일 ID, 소유자 ID, 제목)이 들어갑니다.
+    _loaded_through는 "여기까지의 (마감 일시, ID)는 모두 힙에 올렸다"는 경계입니다.
+
+    Args:
+        sink: 알림 이벤트를 받을 전달 대상 (emit(event) 메서드 필요)
+        window: 미리 힙에 올려 둘 구간
+        batch_size: 한 번의 범위 조회로 가져올 최대 할일 수
+        tick: 마감 여부를 확인하는 간격 (초)
+        rescan: 올려 둔 구간을 DB에서 다시 읽는 간격 (초)
+        lease_ttl: 알림을 보낼 워커를 정하는 실행권의 유지 시간 (초)
+    """
+
+    def __init__(
+        self,
+        sink,
+        window: timedelta = timedelta(seconds=REMINDER_WINDOW_SEC),
+        batch_size: int = REMINDER_BATCH_SIZE,
+        tick: float = REMINDER_TICK_SEC,
+        rescan: float = REMINDER_RESCAN_SEC,
+        lease_ttl: float = REMINDER_LEASE_TTL_SEC,
+    ):
+        self.sink = sink
+        self.window = window
+        self.batch_size = batch_size
+        self.tick_interval = tick
+        self.rescan_interval = rescan
+        self.lease_ttl = lease_ttl
+        self.is_leader = False
+        self._heap = []
+        self._loaded_through = None  # (마감 일시, 할일 ID)
+        self._checked_until = None  # (마감 일시, 할일 ID) - 여기까지의 할일은 이미 알림을 처리함
+        self._last_rescan = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _now(self) -> datetime:
+        """DB에 저장된 일시와 같은 형식(시간대 없는 한국 시간)의 현재 시각"""
+        return models.get_kst_now().replace(tzinfo=None)
+
+    def _refill(self, db, now: datetime):
+        """
+        경계 이후부터 now + window까지의 마감 할일을 인덱스 범위 조회로 힙에 채웁니다
+
+        한 번에 batch_size개까지만 가져오므로, 구간에 할일이 많으면
+        다음 틱에서 이어서 가져옵니다.
+        """
+        Todo = models.Todo
+        horizon = now + self.window
+        last_due, last_id = self._loaded_through
+        # 구간을 이미 다 올렸거나, 힙에 한 번 조회분 이상이 남아 있으면 채우지 않습니다
+        if last_due >= horizon or len(self._heap) >= self.batch_size:
+            return
+
+        rows = db.execute(
+            select(Todo.id, Todo.owner_id, Todo.title, Todo.due_at)
+            .where(
+                Todo.due_at <= horizon,
+                or_(Todo.due_at > last_due, and_(Todo.due_at == last_due, Todo.id > last_id)),
+                Todo.completed.is_(False),
+            )
+            .order_by(Todo.due_at, Todo.id)
+            .limit(self.batch_size)
+        ).all()
+
+        with self._lock:
+            for row in rows:
+                heapq.heappush(self._heap, (row.due_at, row.id, row.owner_id, row.title))
+            if len(rows) < self.batch_size:
+                # 구간 끝까지 모두 가져왔음
+                self._loaded_through = (horizon, sys.maxsize)
+            else:
+                self._loaded_through = (rows[-1].due_at, rows[-1].id)
+
+    def notify(self, todo_id: int, owner_id: int, title: str, due_at: Optional[datetime], completed: bool):
+        """
+        할일이 생성/수정될 때 호출합니다
+
+        이미 힙에 올린 구간 안으로 마감이 잡힌 할일은 범위 조회로는 다시 찾지 않으므로
+        여기서 직접 힙에 넣습니다. 구간 밖이면 나중에 범위 조회가 가져갑니다.
+        """
+        if due_at is None or completed:
+            return
+        with self._lock:
+            if self._loaded_through is not None and (due_at, todo_id) <= self._loaded_through:
+                heapq.heappush(self._heap, (due_at, todo_id, owner_id, title))
+
+    def reset(self):
+        """힙과 경계를 비웁니다 (다음 틱에서 지금부터 다시 시작)"""
+        with self._lock:
+            self._heap = []
+            self._loaded_through = None
+            self._checked_until = None
+
+    def _rescan(self):
+        """
+        올려 둔 구간을 버리고, 이미 처리한 (마감 일시, ID) 이후부터 DB에서 다시 읽게 합니다
+
+        다른 워커에서 구간 안으로 마감을 잡거나 바꾼 할일도 이렇게 해서 힙에 들어옵니다.
+        이미 처리한 할일까지는 다시 읽지 않으므로 알림이 중복되지 않고,
+        아직 가져오지 못한 할일부터 이어서 읽으므로 빠지는 알림도 없습니다.
+        """
+        with self._lock:
+            if self._checked_until is None:
+                return
+            self._heap = []
+            self._loaded_through = self._checked_until
+
+    def _pop_due(self, now: datetime) -> List[tuple]:
+        """마감 시각이 지난 항목들을 힙에서 꺼냅니다 (같은 할일/마감의 중복은 하나로)"""
+        due = {}
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                due[(entry[1], entry[0])] = entry
+        return list(due.values())
+
+    def tick(self, db) -> int:
+        """
+        힙을 채우고, 마감된 할일의 알림을 보냅니다
+
+        같은 시각에 마감된 할일이 batch_size개보다 많으면, 한 페이지씩 가져와
+        알림을 보내면서 지금까지 마감된 할일을 모두 가져올 때까지 이어서 조회합니다.
+
+        Returns:
+            int: 보낸 알림 수
+        """
+        now = self._now()
+        if self._loaded_through is None:
+            # 서버 시작 시점 이전에 지난 마감은 알리지 않습니다
+            self._loaded_through = (now, sys.maxsize)
+        elif time.monotonic() - self._last_rescan >= self.rescan_interval:
+            self._rescan()
+            self._last_rescan = time.monotonic()
+
+        sent = 0
+        while True:
+            self._refill(db, now)
+            entries = self._pop_due(now)
+            with self._lock:
+                # 가져온 곳까지만 처리한 것으로 기록합니다 (가져오지 못한 할일을 건너뛰지 않게)
+                self._checked_until = min(self._loaded_through, (now, sys.maxsize))
+                caught_up = self._checked_until == (now, sys.maxsize)
+            sent += self._send(db, entries)
+            if caught_up:
+                return sent
+
+    def _send(self, db, entries: List[tuple]) -> int:
+        """
+        꺼낸 항목들의 알림을 보냅니다
+
+        힙에 올린 뒤 마감이 바뀌었거나, 완료/삭제된 할일은
+        기본 키로 한 번에 다시 확인하여 알림을 보내지 않습니다.
+        """
+        if not entries:
+            return 0
+
+        Todo = models.Todo
+        current = {
+            row.id: row
+            for row in db.execute(
+                select(Todo.id, Todo.due_at, Todo.completed, Todo.title)
+                .where(Todo.id.in_([entry[1] for entry in entries]))
+            ).all()
+        }
+
+        sent = 0
+        for due_at, todo_id, owner_id, _ in sorted(entries):
+            row = current.get(todo_id)
+            if row is None or row.completed or row.due_at != due_at:
+                continue
+            self.sink.emit({
+                "todo_id": todo_id,
+                "owner_id": owner_id,
+                "title": row.title,
+                "due_at": due_at.isoformat(),
+            })
+            sent += 1
+        return sent
+
+    def _hold_lease(self, last_attempt: float) -> float:
+        """
+        알림을 보낼 워커의 실행권을 얻거나 연장합니다 (유지 시간의 1/3마다)
+
+        실행권을 잃으면 힙을 비우고, 새로 얻으면 지금부터 다시 시작합니다.
+
+        Returns:
+            float: 이번에 실행권을 확인한 시각 (time.monotonic)
+        """
+        now = time.monotonic()
+        if now - last_attempt < self.lease_ttl / 3:
+            return last_attempt
+
+        leader = try_acquire_lease(REMINDER_LEASE_NAME, self.lease_ttl)
+        if leader != self.is_leader:
+            self.reset()
+            self.is_leader = leader
+            if leader:
+                print("⏰ 이 워커가 마감 알림을 보냅니다")
+        return now
+
+    def _loop(self):
+        last_attempt = float("-inf")
+        while not self._stop.is_set():
+            try:
+                last_attempt = self._hold_lease(last_attempt)
+            except Exception as error:
+                print(f"⚠️ 마감 알림 실행권 확인 실패: {error}")
+            if not self.is_leader:
+                self._stop.wait(self.tick_interval)
+                continue
+
+            db = SessionLocal()
+            try:
+                self.tick(db)
+            except Exception as error:
+                # 한 번 실패해도 다음 틱에 다시 시도합니다
+                print(f"⚠️ 마감 알림 처리 실패: {error}")
+            finally:
+                db.close()
+            self._stop.wait(self.tick_interval)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="reminder-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self.is_leader:
+            # 다른 워커가 유지 시간을 기다리지 않고 바로 이어받게 합니다
+            release_lease(REMINDER_LEASE_NAME)
+            self.is_leader = False
+            self.reset()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "leader": self.is_leader,
+                "heap_size": len(self._heap),
+                "next_due_at": self._heap[0][0].isoformat() if self._heap else None,
+                "loaded_through": self._loaded_through[0].isoformat() if self._loaded_through else None,
+            }
+
+# 애플리케이션 전체에서 공유하는 마감 알림 스케줄러
+reminder_scheduler = ReminderScheduler(LogReminderSink())
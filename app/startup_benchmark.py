@@ -0,0 +1,119 @@
+"""
+서버 시작 속도(콜드 스타트) 측정 모듈
+
+이 파일의 역할:
+1. 새 파이썬 프로세스에서 app.main을 불러오는 데 걸리는 시간(import 시간)을 측정합니다
+2. 같은 프로세스에서 서버 시작 작업(lifespan)을 거쳐 첫 응답을 받기까지의 시간을 측정합니다
+3. 측정값이 정해진 예산(budget)을 넘으면 실패(종료 코드 1)로 알려줍니다
+
+초보자를 위한 설명:
+- 요청이 몰려 워커/인스턴스를 늘릴 때, 새 워커는 시작 준비가 끝나야 요청을 받을 수 있습니다
+- 무거운 모듈을 미리 불러오거나 시작 시 오래 걸리는 작업을 하면 그만큼 늦게 투입됩니다
+- 이 측정을 배포 전에 실행하면 시작을 느리게 만드는 변경을 바로 발견할 수 있습니다
+- 이미 불러온 모듈은 다시 불러오지 않으므로, 매 측정은 새 프로세스에서 실행합니다
+
+사용 예시:
+    python -m app.startup_benchmark
+    STARTUP_IMPORT_BUDGET_MS=1500 STARTUP_FIRST_RESPONSE_BUDGET_MS=2000 python -m app.startup_benchmark
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# ====== 측정 설정 ======
+
+# app.main을 불러오는 데 허용하는 시간 (밀리초)
+STARTUP_IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500"))
+
+# 프로세스 시작부터 첫 응답까지 허용하는 시간 (밀리초)
+STARTUP_FIRST_RESPONSE_BUDGET_MS = float(os.getenv("STARTUP_FIRST_RESPONSE_BUDGET_MS", "2000"))
+
+# 새 프로세스로 반복 측정할 횟수 (중앙값을 사용)
+STARTUP_BENCHMARK_RUNS = int(os.getenv("STARTUP_BENCHMARK_RUNS", "3"))
+
+# 새 프로세스 안에서 실행할 측정 코드
+# 인터프리터 자체의 시작 시간은 빼고, app.main import부터 첫 응답까지를 잽니다
+_PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+
+async def first_response():
+    application = app.main.app
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/", "raw_path": b"/",
+        "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 8000),
+    }
+    async with application.router.lifespan_context(application):
+        await application(scope, receive, send)
+        responded = time.perf_counter()
+    return messages[0]["status"], responded
+
+status, responded = asyncio.run(first_response())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": (responded - started) * 1000,
+    "status": status,
+}))
+"""
+
+def measure_once() -> dict:
+    """새 파이썬 프로세스에서 import 시간과 첫 응답까지의 시간을 한 번 측정합니다"""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # 서버가 출력한 로그 다음의 마지막 줄이 측정 결과입니다
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run_benchmark(runs: int = STARTUP_BENCHMARK_RUNS) -> dict:
+    """
+    여러 번 측정하여 중앙값을 예산과 비교합니다
+
+    Args:
+        runs: 새 프로세스로 반복 측정할 횟수
+
+    Returns:
+        dict: import/첫 응답 시간의 중앙값(ms), 예산, 통과 여부
+    """
+    samples = [measure_once() for _ in range(runs)]
+    import_ms = statistics.median(sample["import_ms"] for sample in samples)
+    first_response_ms = statistics.median(sample["first_response_ms"] for sample in samples)
+    return {
+        "import_ms": round(import_ms, 1),
+        "import_budget_ms": STARTUP_IMPORT_BUDGET_MS,
+        "first_response_ms": round(first_response_ms, 1),
+        "first_response_budget_ms": STARTUP_FIRST_RESPONSE_BUDGET_MS,
+        "ok": (
+            import_ms <= STARTUP_IMPORT_BUDGET_MS
+            and first_response_ms <= STARTUP_FIRST_RESPONSE_BUDGET_MS
+            and all(sample["status"] == 200 for sample in samples)
+        ),
+    }
+
+if __name__ == "__main__":
+    report = run_benchmark()
+    print(f"📦 app.main import: {report['import_ms']}ms (예산 {report['import_budget_ms']:.0f}ms)")
+    print(f"🚀 첫 응답까지: {report['first_response_ms']}ms (예산 {report['first_response_budget_ms']:.0f}ms)")
+    if not report["ok"]:
+        print("❌ 시작 시간 예산을 넘었습니다")
+        sys.exit(1)
+    print("✅ 시작 시간 예산 안에 있습니다")
@@ -0,0 +1,299 @@
+"""
+프론트엔드 정적 파일 제공 모듈
+
+이 파일의 역할:
+1. /app/ 경로가 처음 요청될 때 frontend/ 폴더의 파일을 빌드 폴더로 준비합니다
+   * CSS/JS 파일 이름에 내용 해시를 붙입니다 (예: style.3f2a9c1b7d4e.css)
+   * HTML 안의 CSS/JS 참조를 해시가 붙은 이름으로 바꿉니다
+   * gzip, brotli로 미리 압축한 파일을 만들어 둡니다
+2. 브라우저가 지원하는 압축 방식에 맞는 파일을 골라서 응답합니다
+3. 해시가 붙은 파일은 "절대 바뀌지 않음(immutable)"으로 1년간 캐시하게 합니다
+
+초보자를 위한 설명:
+- 파일 내용이 바뀌면 해시도 바뀌므로 파일 이름이 달라집니다
+- 그래서 브라우저는 같은 이름의 파일을 다시 확인할 필요 없이 캐시된 파일을 씁니다
+  → 두 번째 방문부터는 CSS/JS 요청이 아예 발생하지 않습니다
+- HTML은 이름이 고정이라 매번 확인하되, ETag로 바뀌지 않았으면 304(본문 없음)로 답합니다
+- 압축은 요청마다 하지 않고 처음 한 번만 해 둡니다
+- 워커가 여러 개면 각 워커가 빌드하므로, 각자 임시 폴더에 만든 뒤 원본 내용의 해시로
+  이름 붙인 폴더로 옮깁니다. 다른 워커가 보내고 있는 파일을 지우거나 덮어쓰지 않습니다
+- 원본이 바뀌어 생긴 예전 빌드 폴더는, 배포 중인 예전 워커가 다 내려갔을 만큼
+  (ASSET_BUILD_RETENTION_SEC) 아무도 쓰지 않았으면 지웁니다
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse, Response
+
+# ====== 정적 파일 설정 ======
+
+# 원본 프론트엔드 폴더
+FRONTEND_DIR = Path(os.getenv("FRONTEND_DIR", Path(__file__).resolve().parent.parent / "frontend"))
+
+# 해시 이름/압축 파일을 만들어 둘 빌드 폴더 (안에 원본 내용별 하위 폴더가 만들어짐)
+ASSET_BUILD_DIR = Path(os.getenv("ASSET_BUILD_DIR", Path(__file__).resolve().parent.parent / ".static_build"))
+
+# 해시를 붙여 영구 캐시할 파일 확장자
+FINGERPRINT_EXTENSIONS = {".css", ".js"}
+
+# 이보다 작은 파일은 압축해도 이득이 적으므로 압축하지 않습니다 (바이트)
+MIN_COMPRESS_SIZE = 256
+
+# 이 시간(초) 동안 아무 워커도 쓰지 않은 예전 빌드 폴더는 지웁니다
+ASSET_BUILD_RETENTION_SEC = float(os.getenv("ASSET_BUILD_RETENTION_SEC", "3600"))
+
+# 해시가 붙은 파일: 1년 동안 다시 확인하지 않음
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# HTML: 매번 ETag로 바뀌었는지 확인
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+class BuiltAsset:
+    """빌드 폴더에 준비된 파일 하나의 정보"""
+
+    def __init__(self, path: Path, media_type: str, etag: str, immutable: bool):
+        self.path = path
+        self.media_type = media_type
+        self.etag = etag
+        self.immutable = immutable
+        self.variants = {}  # 압축 방식("br", "gzip") -> 압축 파일 경로
+
+def _load_brotli():
+    """brotli 모듈을 불러옵니다 (빌드할 때만 필요하므로 서버 시작 시점에 불러오지 않음, 없으면 None)"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+def _write_variants(asset: BuiltAsset, data: bytes, brotli=None):
+    """미리 압축한 gzip/brotli 파일을 만들어 둡니다 (크기가 줄어드는 경우만)"""
+    if len(data) < MIN_COMPRESS_SIZE:
+        return
+
+    compressed = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressed["br"] = brotli.compress(data, quality=11)
+
+    for encoding, body in compressed.items():
+        if len(body) < len(data):
+            suffix = ".br" if encoding == "br" else ".gz"
+            variant_path = asset.path.with_name(asset.path.name + suffix)
+            variant_path.write_bytes(body)
+            asset.variants[encoding] = variant_path
+
+def _source_version(source_dir: Path) -> str:
+    """원본 파일 이름과 내용 전체의 해시 (내용이 같으면 어느 워커에서 계산해도 같음)"""
+    digest = hashlib.sha256()
+    for source in sorted(source_dir.iterdir()):
+        if source.is_file():
+            digest.update(source.name.encode("utf-8") + b"\0" + source.read_bytes())
+    return digest.hexdigest()[:12]
+
+def build_assets(source_dir: Path = FRONTEND_DIR, build_dir: Path = ASSET_BUILD_DIR) -> Dict[str, BuiltAsset]:
+    """
+    프론트엔드 파일을 빌드 폴더에 준비하고, 요청 이름별 파일 정보를 반환합니다
+
+    이 프로세스만 쓰는 임시 폴더에 만든 뒤, 원본 내용의 해시로 이름 붙인 폴더로 한 번에 옮깁니다.
+    다른 워커가 같은 내용을 먼저 옮겼다면 그 폴더(내용이 같음)를 쓰고 임시 폴더는 지웁니다.
+
+    Args:
+        source_dir: 원본 프론트엔드 폴더
+        build_dir: 결과 폴더들을 만들 상위 폴더
+
+    Returns:
+        Dict[str, BuiltAsset]: URL의 파일 이름 -> 준비된 파일 정보
+    """
+    build_dir.mkdir(parents=True, exist_ok=True)
+    final_dir = build_dir / _source_version(source_dir)
+    work_dir = build_dir / f".tmp-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    work_dir.mkdir()
+    try:
+        assets = _build_into(source_dir, work_dir)
+        try:
+            os.rename(work_dir, final_dir)
+        except OSError:
+            # 다른 워커가 이미 같은 내용을 준비해 두었습니다
+            if not final_dir.is_dir():
+                raise
+            shutil.rmtree(work_dir)
+            os.utime(final_dir)  # 이 워커도 쓰고 있다고 표시 (정리 대상에서 빠지도록)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    _remove_stale_builds(build_dir, keep=final_dir)
+
+    # 파일 경로를 옮긴 폴더 기준으로 바꿉니다
+    for asset in assets.values():
+        asset.path = final_dir / asset.path.name
+        asset.variants = {encoding: final_dir / path.name for encoding, path in asset.variants.items()}
+    return assets
+
+def _remove_stale_builds(build_dir: Path, keep: Path, retention: float = ASSET_BUILD_RETENTION_SEC):
+    """
+    예전 원본으로 만든 빌드 폴더와 중단된 빌드의 임시 폴더를 지웁니다
+
+    배포 중에는 아직 내려가지 않은 예전 워커가 예전 폴더의 파일을 보내고 있을 수 있으므로,
+    retention초 동안 아무 워커도 준비하거나 쓰지 않은 폴더만 지웁니다.
+    """
+    expired_before = time.time() - retention
+    for path in build_dir.iterdir():
+        if path == keep:
+            continue
+        try:
+            if path.stat().st_mtime >= expired_before:
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()  # 폴더별 빌드 이전 방식으로 바로 아래에 만들었던 파일
+        except OSError:
+            pass  # 다른 워커가 먼저 지웠습니다
+
+def _build_into(source_dir: Path, build_dir: Path) -> Dict[str, BuiltAsset]:
+    """build_dir(비어 있는 폴더)에 해시 이름 파일과 압축 파일을 만듭니다"""
+    brotli = _load_brotli()
+    assets = {}
+    renamed = {}  # 원래 이름 -> 해시가 붙은 이름
+
+    # 1단계: CSS/JS 파일에 내용 해시를 붙여 복사
+    for source in sorted(source_dir.iterdir()):
+        if not source.is_file() or source.suffix not in FINGERPRINT_EXTENSIONS:
+            continue
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        hashed_name = f"{source.stem}.{digest}{source.suffix}"
+        renamed[source.name] = hashed_name
+
+        asset = BuiltAsset(
+            build_dir / hashed_name,
+            mimetypes.guess_type(source.name)[0] or "application/octet-stream",
+            f'"{digest}"',
+            immutable=True,
+        )
+        asset.path.write_bytes(data)
+        _write_variants(asset, data, brotli)
+        assets[hashed_name] = asset
+
+    # 2단계: 나머지 파일(HTML 등)은 이름을 유지하고, HTML 속 참조를 해시 이름으로 바꿈
+    reference = re.compile(r'(src|href)="([^"/:]+)"')
+    for source in sorted(source_dir.iterdir()):
+        if not source.is_file() or source.suffix in FINGERPRINT_EXTENSIONS:
+            continue
+        data = source.read_bytes()
+        if source.suffix == ".html":
+            html = data.decode("utf-8")
+            html = reference.sub(
+                lambda m: f'{m.group(1)}="{renamed.get(m.group(2), m.group(2))}"', html
+            )
+            data = html.encode("utf-8")
+
+        asset = BuiltAsset(
+            build_dir / source.name,
+            mimetypes.guess_type(source.name)[0] or "application/octet-stream",
+            f'"{hashlib.sha256(data).hexdigest()[:12]}"',
+            immutable=False,
+        )
+        asset.path.write_bytes(data)
+        _write_variants(asset, data, brotli)
+        assets[source.name] = asset
+
+    return assets
+
+_assets = None
+_assets_lock = threading.Lock()
+
+def get_assets() -> Dict[str, BuiltAsset]:
+    """
+    준비된 프론트엔드 파일 정보를 반환합니다 (처음 요청될 때 한 번만 빌드)
+
+    압축 등 빌드에 시간이 걸리므로 서버 시작 시점이 아니라
+    /app/ 경로가 처음 요청될 때 준비하여 서버 시작을 늦추지 않습니다.
+    """
+    global _assets
+    if _assets is None:
+        with _assets_lock:
+            if _assets is None:
+                _assets = build_assets()
+                print(f"🎨 프론트엔드 파일 {len(_assets)}개 준비 완료")
+    return _assets
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {압축 방식: 선호도(q)}로 바꿉니다 (q가 없으면 1, 잘못된 q는 0)"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, *params = [item.strip() for item in part.split(";")]
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+def _choose_encoding(asset: BuiltAsset, accept_encoding: str) -> Optional[str]:
+    """
+    브라우저가 받겠다고 한 압축 방식 중 선호도(q)가 가장 높은 것을 고릅니다
+
+    q=0은 "받지 않음"이므로 고르지 않습니다. 선호도가 같으면 더 작은 brotli를 먼저 고릅니다.
+    헤더에 없는 방식은 "*"의 선호도를 따릅니다.
+    """
+    accepted = _parse_accept_encoding(accept_encoding)
+    best, best_q = None, 0.0
+    for encoding in ("br", "gzip"):
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q and encoding in asset.variants:
+            best, best_q = encoding, q
+    return best
+
+def serve_asset(assets: Dict[str, BuiltAsset], filename: str, request: Request) -> Response:
+    """
+    준비된 정적 파일을 캐시 헤더와 함께 응답합니다
+
+    파일은 FileResponse로 보내므로 서버가 지원하면 메모리 복사 없이 전송됩니다.
+
+    Args:
+        assets: build_assets()가 반환한 파일 정보
+        filename: 요청한 파일 이름
+        request: HTTP 요청 (Accept-Encoding, If-None-Match 확인용)
+
+    Raises:
+        HTTPException: 파일이 없으면 404 에러
+    """
+    asset = assets.get(filename)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    encoding = _choose_encoding(asset, request.headers.get("accept-encoding", ""))
+    etag = asset.etag if encoding is None else f'{asset.etag[:-1]}-{encoding}"'
+    headers = {
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if asset.immutable else REVALIDATE_CACHE_CONTROL,
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+
+    # 브라우저가 가진 파일이 최신이면 본문 없이 304로 응답
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        return FileResponse(asset.variants[encoding], media_type=asset.media_type, headers=headers)
+    return FileResponse(asset.path, media_type=asset.media_type, headers=headers)
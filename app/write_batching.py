@@ -0,0 +1,129 @@
+"""
+할일 수정 묶음 처리(Group Commit) 모듈
+
+이 파일의 역할:
+1. 짧은 시간(기본 5ms) 동안 같은 사용자의 할일 수정 요청을 모읍니다
+2. 같은 할일에 대한 여러 수정은 하나로 합칩니다 (나중 값이 우선)
+3. 모은 수정을 하나의 트랜잭션으로 한 번만 커밋합니다
+4. 커밋이 끝난 뒤에 각 요청에 응답하므로, 응답을 받으면 저장이 완료된 상태입니다
+
+초보자를 위한 설명:
+- 사용자가 완료 버튼을 빠르게 여러 번 누르면 요청마다 커밋(디스크 기록)이 일어납니다
+- 커밋은 디스크에 확실히 기록하는(fsync) 비싼 작업이라 요청이 몰리면 느려집니다
+- 여러 요청을 모아서 한 번에 커밋하면(group commit) 커밋 횟수가 크게 줄어듭니다
+- 여러 번 적용해도 결과가 같은 필드(완료 여부, 우선순위, 제목)만 이 방식으로 처리합니다
+- 기다리는 동안에는 DB 커넥션을 잡고 있지 않습니다. 요청의 세션을 먼저 닫아 커넥션을 돌려주고,
+  대표 요청은 커밋할 때만 자기 세션으로 커넥션을 다시 빌립니다 (요청당 커넥션은 최대 1개)
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from . import crud
+from .crud import TodoUpdate, TodoResponse
+
+# ====== 묶음 처리 설정 ======
+
+# 수정 요청을 모으는 시간 (밀리초)
+WRITE_COALESCE_WINDOW_MS = float(os.getenv("WRITE_COALESCE_WINDOW_MS", "5"))
+
+# 묶음 처리할 수 있는 필드 (여러 번 적용해도 결과가 같은 필드)
+COALESCIBLE_FIELDS = {"completed", "priority", "title"}
+
+def is_coalescible(todo: TodoUpdate) -> bool:
+    """수정 데이터가 묶음 처리 가능한 필드만 포함하는지 확인합니다"""
+    fields = set(todo.model_dump(exclude_unset=True))  # null을 보낸 필드(예: 마감 지우기)도 포함
+    return bool(fields) and fields <= COALESCIBLE_FIELDS
+
+class _OwnerBatch:
+    """한 사용자에 대해 모으고 있는 수정 요청들"""
+
+    def __init__(self):
+        self.updates = {}  # todo_id -> 합쳐진 수정 필드
+        self.waiters = []  # (todo_id, 결과를 받을 Future)
+
+class WriteCoalescer:
+    """
+    사용자별로 수정 요청을 모아 한 번에 커밋하는 묶음 처리기
+
+    사용자의 첫 요청을 처리하는 스레드가 묶음의 대표(leader)가 되어
+    잠시 기다린 뒤 모인 수정을 한 트랜잭션으로 저장하고, 나머지 요청은 그 결과를 기다립니다.
+    """
+
+    def __init__(self, window_ms: float = WRITE_COALESCE_WINDOW_MS):
+        self.window = window_ms / 1000
+        self._batches = {}  # owner_id -> _OwnerBatch
+        self._lock = threading.Lock()
+
+        # 통계
+        self.requests = 0
+        self.commits = 0
+
+    def submit(self, db: Session, owner_id: int, todo_id: int, todo: TodoUpdate) -> Optional[TodoResponse]:
+        """
+        수정 요청을 묶음에 추가하고, 묶음이 커밋될 때까지 기다립니다
+
+        Args:
+            db: 요청의 데이터베이스 세션 (기다리기 전에 닫고, 대표 요청이면 커밋에 다시 사용)
+            owner_id: 할일 소유자 ID
+            todo_id: 수정할 할일 ID
+            todo: 수정할 데이터 (묶음 처리 가능한 필드만)
+
+        Returns:
+            Optional[TodoResponse]: 커밋 후의 할일 정보 (없거나 권한 없으면 None)
+        """
+        # 사용자 확인에 쓴 커넥션을 기다리기 전에 풀로 돌려줍니다
+        db.close()
+
+        future = Future()
+        with self._lock:
+            self.requests += 1
+            batch = self._batches.get(owner_id)
+            leader = batch is None
+            if leader:
+                batch = self._batches[owner_id] = _OwnerBatch()
+            batch.updates.setdefault(todo_id, {}).update(todo.model_dump(exclude_none=True))
+            batch.waiters.append((todo_id, future))
+
+        if leader:
+            # 잠시 기다리며 같은 사용자의 다른 요청이 모이게 합니다
+            time.sleep(self.window)
+            with self._lock:
+                self._batches.pop(owner_id)
+            self._flush(db, owner_id, batch)
+
+        return future.result()
+
+    def _flush(self, db: Session, owner_id: int, batch: _OwnerBatch):
+        """모인 수정을 대표 요청의 세션으로 한 번에 저장하고 기다리는 요청들에 결과를 전달합니다"""
+        try:
+            updates = {todo_id: TodoUpdate(**fields) for todo_id, fields in batch.updates.items()}
+            results = crud.update_todos_bulk(db, updates, owner_id)
+            with self._lock:
+                self.commits += 1
+        except Exception as error:
+            for _, future in batch.waiters:
+                future.set_exception(error)
+            return
+        finally:
+            db.close()
+
+        for todo_id, future in batch.waiters:
+            future.set_result(results.get(todo_id))
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests, commits = self.requests, self.commits
+        return {
+            "requests": requests,
+            "commits": commits,
+            "requests_per_commit": requests / commits if commits else 0.0,
+        }
+
+# 애플리케이션 전체에서 공유하는 수정 묶음 처리기
+write_coalescer = WriteCoalescer()
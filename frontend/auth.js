@@ -96,6 +96,33 @@ async function authenticatedFetch(url, options = {}) {
     });
 }
 
+/**
+ * 여러 API 호출을 /batch로 묶어 한 번의 왕복으로 보냅니다
+ * 
+ * Args:
+ *     operations: [{method, path, body}] 형태의 하위 요청 목록 (순서대로 실행)
+ *     atomic: true면 모두 성공했을 때만 저장 (하나라도 실패하면 모두 취소)
+ * 
+ * Returns:
+ *     Promise: 하위 요청별 {status, body} 결과 배열 (인증 실패 시 null)
+ */
+async function batchFetch(operations, atomic = false) {
+    const response = await authenticatedFetch(`${API_BASE_URL}/batch`, {
+        method: 'POST',
+        body: JSON.stringify({ operations: operations, atomic: atomic })
+    });
+    
+    if (response.status === 401 || response.status === 403) {
+        return null;
+    }
+    if (!response.ok) {
+        throw new Error('요청을 처리하지 못했습니다');
+    }
+    
+    const data = await response.json();
+    return data.results;
+}
+
 // ====== 회원가입 함수 ======
 
 /**
@@ -159,6 +186,51 @@ async function handleSignup(event) {
     }
 }
 
+// ====== 사용자명/이메일 사용 가능 여부 확인 ======
+
+// 입력이 멈춘 뒤 확인 요청을 보낼 때까지 기다리는 시간 (밀리초)
+const AVAILABILITY_DEBOUNCE_MS = 300;
+
+// 입력 필드별 대기 중인 타이머
+const availabilityTimers = {};
+
+/**
+ * 입력 중인 사용자명/이메일의 사용 가능 여부를 확인하여 표시합니다
+ * 타이핑할 때마다 요청하지 않도록 입력이 잠시 멈춘 뒤에만 요청합니다
+ * 
+ * Args:
+ *     field: 확인할 필드 이름 ('username' 또는 'email')
+ *     value: 입력된 값
+ */
+function checkAvailability(field, value) {
+    clearTimeout(availabilityTimers[field]);
+    const statusElement = document.getElementById(`${field}Status`);
+    
+    if (!value || (field === 'username' && value.length < 3)) {
+        statusElement.textContent = '';
+        return;
+    }
+    
+    availabilityTimers[field] = setTimeout(async () => {
+        try {
+            const params = new URLSearchParams({ [field]: value });
+            const response = await fetch(`${API_BASE_URL}/users/available?${params}`);
+            if (!response.ok) {
+                return;
+            }
+            
+            const data = await response.json();
+            const label = field === 'username' ? '사용자명' : '이메일';
+            statusElement.textContent = data[field]
+                ? `✅ 사용 가능한 ${label}입니다`
+                : `❌ 이미 사용 중인 ${label}입니다`;
+        } catch (error) {
+            // 확인 실패는 회원가입을 막지 않으므로 표시만 지웁니다
+            statusElement.textContent = '';
+        }
+    }, AVAILABILITY_DEBOUNCE_MS);
+}
+
 // ====== 로그인 함수 ======
 
 /**
@@ -231,13 +303,7 @@ async function loadUserInfo() {
         const response = await authenticatedFetch(`${API_BASE_URL}/me`);
         
         if (response.ok) {
-            const user = await response.json();
-            
-            // 환영 메시지 업데이트
-            const welcomeMessage = document.getElementById('welcomeMessage');
-            if (welcomeMessage) {
-                welcomeMessage.textContent = `환영합니다, ${user.username}님!`;
-            }
+            showWelcomeMessage(await response.json());
         } else if (response.status === 401) {
             // 토큰이 만료되었거나 유효하지 않음
             logout();
@@ -248,6 +314,19 @@ async function loadUserInfo() {
     }
 }
 
+/**
+ * 사용자 정보로 환영 메시지를 표시합니다
+ * 
+ * Args:
+ *     user: /me 응답의 사용자 정보
+ */
+function showWelcomeMessage(user) {
+    const welcomeMessage = document.getElementById('welcomeMessage');
+    if (welcomeMessage) {
+        welcomeMessage.textContent = `환영합니다, ${user.username}님!`;
+    }
+}
+
 // ====== 페이지 보호 함수 ======
 
 /**
@@ -324,12 +403,20 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // 현재 페이지에 따라 적절한 초기화 실행
     if (currentPage === 'main.html') {
-        // 메인 페이지: 로그인 확인 후 사용자 정보 로드
-        if (requireLogin()) {
-            loadUserInfo();
-        }
+        // 메인 페이지: 로그인 확인
+        // 사용자 정보는 script.js의 loadMainPage()가 할일 목록과 한 번에 불러옴
+        requireLogin();
     } else if (currentPage === 'login.html' || currentPage === 'signup.html') {
         // 인증 페이지: 이미 로그인한 사용자는 메인 페이지로 리다이렉트
         redirectIfLoggedIn();
     }
+    
+    // 회원가입 페이지: 입력하는 동안 사용자명/이메일 중복 여부 표시
+    if (currentPage === 'signup.html') {
+        ['username', 'email'].forEach(field => {
+            document.getElementById(field).addEventListener('input', event => {
+                checkAvailability(field, event.target.value.trim());
+            });
+        });
+    }
 });
\ No newline at end of file
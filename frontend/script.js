@@ -7,6 +7,7 @@
  * 2. JWT 토큰을 사용하여 API 요청을 인증합니다
  * 3. 할일 목록을 동적으로 표시하고 관리합니다
  * 4. 검색 및 필터링 기능을 제공합니다
+ * 5. 드래그 앤 드롭으로 할일 순서를 바꿀 수 있게 합니다
  */
 
 // API 기본 URL 설정
@@ -16,16 +17,53 @@ const API_BASE_URL = 'http://localhost:8000';
 // 전역 변수로 할일 목록 저장 (검색 기능을 위해)
 let allTodos = [];
 
+// 드래그 중인 할일 ID (드래그하지 않을 때는 null)
+let draggedTodoId = null;
+
 // DOM이 완전히 로드된 후 실행
 // 페이지가 로드되면 자동으로 할일 목록을 불러옴
 document.addEventListener('DOMContentLoaded', function() {
     // 메인 페이지에서만 할일 목록 로드
     const currentPage = window.location.pathname.split('/').pop();
-    if (currentPage === 'main.html') {
-        loadTodos();
+    if (currentPage === 'main.html' && isLoggedIn()) {
+        loadMainPage();
     }
 });
 
+/**
+ * 메인 페이지에 필요한 사용자 정보와 할일 목록을 한 번의 요청으로 불러오는 함수
+ * /batch로 묶어서 보내므로 네트워크 왕복이 한 번만 생깁니다
+ */
+async function loadMainPage() {
+    try {
+        showLoading();
+        
+        const results = await batchFetch([
+            { method: 'GET', path: '/me' },
+            { method: 'GET', path: '/todos/' }
+        ]);
+        
+        // 토큰이 만료되었거나 유효하지 않음
+        if (results === null) {
+            logout();
+            return;
+        }
+        
+        const [userResult, todosResult] = results;
+        if (userResult.status === 200) {
+            showWelcomeMessage(userResult.body);
+        }
+        if (todosResult.status !== 200) {
+            throw new Error('할일 목록을 불러오는데 실패했습니다');
+        }
+        
+        allTodos = todosResult.body;
+        displayTodos(allTodos);
+    } catch (error) {
+        showError(error.message);
+    }
+}
+
 /**
  * 서버에서 할일 목록을 불러오는 함수
  * async/await를 사용하여 비동기 처리
@@ -82,14 +120,23 @@ function displayTodos(todos) {
         // 생성일자 포맷팅
         const createdDate = new Date(todo.created_at).toLocaleDateString('ko-KR');
         
+        // 마감 일시 포맷팅 (마감이 없으면 표시하지 않음)
+        const dueText = todo.due_at
+            ? ` · 마감: ${new Date(todo.due_at).toLocaleString('ko-KR')}`
+            : '';
+        
         return `
-            <div class="todo-item priority-${todo.priority} ${todo.completed ? 'completed' : ''}">
+            <div class="todo-item priority-${todo.priority} ${todo.completed ? 'completed' : ''}"
+                 data-id="${todo.id}" draggable="true"
+                 ondragstart="onTodoDragStart(event, ${todo.id})"
+                 ondragover="event.preventDefault()"
+                 ondrop="onTodoDrop(event, ${todo.id})">
                 <div>
                     <span class="priority-badge ${priorityClass}">${priorityText}</span>
                     <h3>${todo.title}</h3>
                 </div>
                 <p>${todo.description || '설명 없음'}</p>
-                <div class="created-date">생성일: ${createdDate}</div>
+                <div class="created-date">생성일: ${createdDate}${dueText}</div>
                 <div class="todo-actions">
                     <button class="complete-btn" onclick="toggleTodo(${todo.id}, ${!todo.completed})">
                         ${todo.completed ? '미완료로 변경' : '완료'}
@@ -112,6 +159,8 @@ async function addTodo() {
     const title = document.getElementById('todoTitle').value.trim();
     const description = document.getElementById('todoDescription').value.trim();
     const priority = parseInt(document.getElementById('todoPriority').value);
+    // datetime-local 값은 시간대가 없는 한국 시간으로 서버에 전달됨 (비어 있으면 마감 없음)
+    const dueAt = document.getElementById('todoDueAt').value || null;
     
     // 제목이 비어있는지 확인
     if (!title) {
@@ -126,7 +175,8 @@ async function addTodo() {
             body: JSON.stringify({
                 title: title,
                 description: description,
-                priority: priority
+                priority: priority,
+                due_at: dueAt
             })
         });
         
@@ -139,6 +189,7 @@ async function addTodo() {
         document.getElementById('todoTitle').value = '';
         document.getElementById('todoDescription').value = '';
         document.getElementById('todoPriority').value = '2'; // 기본값으로 재설정
+        document.getElementById('todoDueAt').value = '';
         
         // 할일 목록 새로고침
         loadTodos();
@@ -156,7 +207,8 @@ async function addTodo() {
 async function toggleTodo(todoId, completed) {
     try {
         // PUT 요청으로 할일 상태 업데이트 (인증된 요청)
-        const response = await authenticatedFetch(`${API_BASE_URL}/todos/${todoId}`, {
+        // coalesce=true: 연속 클릭 시 서버가 여러 수정을 모아 한 번에 커밋
+        const response = await authenticatedFetch(`${API_BASE_URL}/todos/${todoId}?coalesce=true`, {
             method: 'PUT',
             body: JSON.stringify({
                 completed: completed // 완료 상태만 업데이트
@@ -203,6 +255,69 @@ async function deleteTodo(todoId) {
     }
 }
 
+/**
+ * 할일을 끌기 시작할 때 호출되는 함수
+ * @param {DragEvent} event - 드래그 이벤트
+ * @param {number} todoId - 끌고 있는 할일 ID
+ */
+function onTodoDragStart(event, todoId) {
+    draggedTodoId = todoId;
+    event.dataTransfer.effectAllowed = 'move';
+}
+
+/**
+ * 끌던 할일을 다른 할일 위에 놓았을 때 호출되는 함수
+ * 놓은 할일의 위쪽 절반이면 그 앞에, 아래쪽 절반이면 그 뒤에 끼워 넣습니다
+ * @param {DragEvent} event - 드롭 이벤트
+ * @param {number} targetId - 놓은 위치의 할일 ID
+ */
+function onTodoDrop(event, targetId) {
+    event.preventDefault();
+    const todoId = draggedTodoId;
+    draggedTodoId = null;
+    if (todoId === null || todoId === targetId) {
+        return;
+    }
+    
+    // 화면에 보이는 순서에서 옮길 할일을 빼고, 놓은 위치의 앞/뒤 할일을 찾음
+    const ids = Array.from(document.querySelectorAll('#todos .todo-item'))
+        .map(element => Number(element.dataset.id))
+        .filter(id => id !== todoId);
+    const rect = event.currentTarget.getBoundingClientRect();
+    const index = ids.indexOf(targetId) + (event.clientY > rect.top + rect.height / 2 ? 1 : 0);
+    
+    moveTodo(todoId, index > 0 ? ids[index - 1] : null, index < ids.length ? ids[index] : null);
+}
+
+/**
+ * 할일을 두 할일 사이로 옮기는 함수
+ * 서버는 옮긴 할일 하나의 순서만 바꿉니다
+ * @param {number} todoId - 옮길 할일 ID
+ * @param {number|null} prevId - 옮긴 뒤 바로 앞에 올 할일 ID (맨 앞이면 null)
+ * @param {number|null} nextId - 옮긴 뒤 바로 뒤에 올 할일 ID (맨 뒤면 null)
+ */
+async function moveTodo(todoId, prevId, nextId) {
+    try {
+        const response = await authenticatedFetch(`${API_BASE_URL}/todos/${todoId}/move`, {
+            method: 'POST',
+            body: JSON.stringify({
+                prev_id: prevId,
+                next_id: nextId
+            })
+        });
+        
+        if (!response.ok) {
+            throw new Error('할일 순서 변경에 실패했습니다');
+        }
+        
+        // 성공 시 목록 새로고침
+        loadTodos();
+        
+    } catch (error) {
+        showError(error.message);
+    }
+}
+
 /**
  * 로딩 상태를 표시하는 함수
  */
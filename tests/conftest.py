@@ -0,0 +1,68 @@
+"""
+테스트 공통 설정
+
+초보자를 위한 설명:
+- 앱 모듈은 불러오는 순간 환경변수를 읽으므로, 아래 환경변수를 app을 import하기 전에 설정합니다
+- 테스트는 임시 폴더의 SQLite 파일을 쓰므로 개발용 todos.db를 건드리지 않습니다
+- bcrypt 라운드를 4로 낮추어 회원가입/로그인 테스트가 빠르게 끝나게 합니다
+- 실행 방법: 프로젝트 폴더에서 python -m pytest -q
+"""
+
+import os
+import sys
+import tempfile
+
+_TEST_DIR = tempfile.mkdtemp(prefix="todo-tests-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DIR}/test.db"
+os.environ["SECRET_KEY"] = "test-secret-key"
+os.environ["BCRYPT_MIN_ROUNDS"] = "4"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["ARCHIVE_ENABLED"] = "false"
+os.environ["REMINDERS_ENABLED"] = "false"
+os.environ["ASSET_BUILD_DIR"] = f"{_TEST_DIR}/static_build"
+os.environ.pop("METRICS_TOKEN", None)
+os.environ.pop("TRUSTED_PROXIES", None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import models
+from app.cache import LRUCacheBackend, todo_cache
+from app.database import SessionLocal, engine
+from app.main import app
+from app.rate_limit import InMemoryThrottleStore, login_throttle
+
+@pytest.fixture
+def client(monkeypatch):
+    """빈 데이터베이스로 서버를 시작한 테스트 클라이언트"""
+    models.Base.metadata.drop_all(bind=engine)
+    # 이전 테스트의 사용자 ID가 다시 쓰이므로 캐시와 로그인 제한 상태도 비웁니다
+    monkeypatch.setattr(todo_cache, "backend", LRUCacheBackend())
+    monkeypatch.setattr(login_throttle, "store", InMemoryThrottleStore())
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def db(client):
+    """테스트에서 직접 데이터를 확인/준비할 때 쓰는 세션"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture
+def signup(client):
+    """회원가입 후 로그인하여 Authorization 헤더를 돌려주는 함수"""
+    def _signup(username: str = "alice", password: str = "password123") -> dict:
+        response = client.post("/signup", json={
+            "username": username, "email": f"{username}@example.com", "password": password
+        })
+        assert response.status_code == 200, response.text
+        response = client.post("/login", json={"username": username, "password": password})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return _signup
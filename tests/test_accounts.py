@@ -0,0 +1,74 @@
+"""
+계정 비활성화/삭제와 삭제된 계정의 토큰 거절 테스트
+"""
+
+from datetime import timedelta
+
+from app import models
+from app.accounts import account_purge_worker, purge_account
+from app.auth import create_access_token
+
+def _login(client, username, password="password123"):
+    return client.post("/login", json={"username": username, "password": password})
+
+def test_deactivated_account_cannot_log_in_or_use_tokens(client, signup):
+    headers = signup("alice")
+    response = client.post("/me/deactivate", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+    assert _login(client, "alice").status_code == 401
+    assert client.get("/todos/", headers=headers).status_code == 400
+
+def test_delete_me_is_accepted_and_purged_in_background(client, db, signup):
+    headers = signup("alice")
+    for i in range(3):
+        client.post("/todos/", json={"title": f"t{i}"}, headers=headers)
+
+    assert client.delete("/me", headers=headers).status_code == 202
+    assert _login(client, "alice").status_code == 401
+
+    account_purge_worker.run_once()  # 백그라운드 작업이 이미 끝냈어도 결과는 같음
+    db.expire_all()
+    assert db.query(models.User).count() == 0
+    assert db.query(models.Todo).count() == 0
+
+def test_purge_deletes_rows_in_batches(db):
+    db.add(models.User(id=1, username="alice", email="alice@example.com", hashed_password="x",
+                       is_active=False, deleted_at=models.get_kst_now()))
+    db.add_all(models.Todo(title=f"t{i}", owner_id=1, rank=f"r{i:02d}") for i in range(25))
+    db.add_all(models.ArchivedTodo(title=f"a{i}", owner_id=1, original_id=100 + i) for i in range(5))
+    db.commit()
+
+    assert purge_account(db, 1, batch_size=10) == 30
+    assert db.query(models.User).count() == 0
+
+def test_purge_keeps_accounts_without_a_deletion_request(db):
+    db.add(models.User(id=1, username="alice", email="alice@example.com", hashed_password="x"))
+    db.commit()
+    purge_account(db, 1)
+    assert db.query(models.User).count() == 1
+
+def test_token_of_purged_account_is_rejected_for_a_reused_id(client, db, signup):
+    old_headers = signup("alice")
+    old_id = client.get("/me", headers=old_headers).json()["id"]
+    client.delete("/me", headers=old_headers)
+    account_purge_worker.run_once()
+
+    new_headers = signup("bob")
+    new_user = db.query(models.User).filter_by(username="bob").one()
+    assert new_user.id == old_id  # SQLite는 가장 큰 ID가 삭제되면 그 ID를 다시 씀
+    # 예전 토큰은 새 계정보다 먼저 발급되었음 (같은 초 안에 끝나는 테스트라 가입 시각을 뒤로 옮김)
+    created_at = new_user.created_at
+    new_user.created_at = created_at + timedelta(seconds=2)
+    db.commit()
+    assert client.get("/me", headers=old_headers).status_code == 401
+
+    new_user.created_at = created_at
+    db.commit()
+    assert client.get("/me", headers=new_headers).json()["username"] == "bob"
+
+def test_token_with_username_subject_is_rejected(client, signup):
+    signup("alice")
+    legacy = create_access_token({"sub": "alice"})
+    assert client.get("/me", headers={"Authorization": f"Bearer {legacy}"}).status_code == 401
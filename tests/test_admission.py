@@ -0,0 +1,107 @@
+"""
+요청 수용 제어와 통계 엔드포인트 접근 제한 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app import admission, auth
+from app.admission import ADMISSION_SCOPE_KEY, ConcurrencyLimiter, classify_request, release_request_slot
+
+def _request(host: str, headers: dict = None) -> Request:
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "client": (host, 1234), "headers": raw_headers})
+
+def test_limiter_queues_then_rejects_when_queue_full_or_timed_out():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", limit=1, max_queue=1, queue_timeout=0.05)
+        assert await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+        assert not await limiter.acquire()  # 대기열(1)이 가득 참
+        assert not await waiter  # 자리가 나지 않아 시간 초과
+        return limiter.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["rejected_queue_full"] == 1
+    assert stats["rejected_timeout"] == 1
+    assert stats["in_flight"] == 1
+    assert stats["queued"] == 0
+
+def test_queued_request_is_admitted_when_slot_is_released():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", limit=1, max_queue=5, queue_timeout=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release()
+        return await waiter, limiter.stats()
+
+    admitted, stats = asyncio.run(scenario())
+    assert admitted
+    assert stats["admitted"] == 2
+    assert stats["in_flight"] == 1
+
+def test_release_request_slot_releases_only_once():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", limit=1, max_queue=0, queue_timeout=0.01)
+        await limiter.acquire()
+        scope = {ADMISSION_SCOPE_KEY: limiter}
+        release_request_slot(scope)
+        release_request_slot(scope)
+        return limiter.in_flight, await limiter.acquire()
+
+    assert asyncio.run(scenario()) == (0, True)
+
+@pytest.mark.parametrize("method, path, expected", [
+    ("POST", "/login", "auth"),
+    ("POST", "/signup", "auth"),
+    ("GET", "/todos/", "read"),
+    ("HEAD", "/todos/1", "read"),
+    ("PUT", "/todos/1", "write"),
+    ("POST", "/batch", "write"),
+    ("OPTIONS", "/todos/", None),
+    ("GET", "/docs", None),
+    ("GET", "/metrics/admission", None),
+    ("GET", "/app/index.html", None),
+])
+def test_classify_request(method, path, expected):
+    assert classify_request(method, path) == expected
+
+def test_overloaded_route_class_gets_503_with_retry_after(client, signup, monkeypatch):
+    headers = signup("alice")
+    full = ConcurrencyLimiter("read", limit=1, max_queue=0, queue_timeout=3)
+    asyncio.run(full.acquire())
+    monkeypatch.setitem(admission.limiters, "read", full)
+
+    response = client.get("/todos/", headers=headers)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    # 다른 종류의 요청은 영향을 받지 않습니다
+    assert client.post("/todos/", json={"title": "write"}, headers=headers).status_code == 200
+
+def test_metrics_reject_remote_clients_without_token(client):
+    # TestClient의 접속 주소는 "testclient"로 localhost가 아닙니다
+    for path in ("/metrics/admission", "/metrics/cache", "/metrics/writes", "/metrics/db-pool", "/metrics/reminders"):
+        assert client.get(path).status_code == 403
+
+def test_metrics_allow_direct_local_requests_only():
+    auth.require_metrics_access(_request("127.0.0.1"))
+    auth.require_metrics_access(_request("::1"))
+    for request in (_request("10.0.0.5"), _request("127.0.0.1", {"X-Forwarded-For": "203.0.113.9"})):
+        with pytest.raises(HTTPException) as error:
+            auth.require_metrics_access(request)
+        assert error.value.status_code == 403
+
+def test_metrics_token_is_required_when_configured(client, monkeypatch):
+    monkeypatch.setattr(auth, "METRICS_TOKEN", "s3cret")
+    assert client.get("/metrics/admission", headers={"X-Metrics-Token": "s3cret"}).status_code == 200
+    assert client.get("/metrics/admission", headers={"X-Metrics-Token": "wrong"}).status_code == 403
+    # 토큰을 설정하면 localhost에서도 토큰이 필요합니다
+    with pytest.raises(HTTPException):
+        auth.require_metrics_access(_request("127.0.0.1"))
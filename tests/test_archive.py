@@ -0,0 +1,105 @@
+"""
+완료된 할일 보관 작업과 실행권(lease) 테스트
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import event
+
+from app import leases, models
+from app.archive import archive_completed_todos
+from app.database import engine
+from app.leases import release_lease, try_acquire_lease
+
+def _now():
+    return models.get_kst_now().replace(tzinfo=None)
+
+def _add_user_with_todos(db, todos):
+    db.add(models.User(id=1, username="alice", email="alice@example.com", hashed_password="x"))
+    for i, (title, completed, completed_at) in enumerate(todos):
+        db.add(models.Todo(
+            title=title, owner_id=1, completed=completed, completed_at=completed_at, rank=f"r{i}"
+        ))
+    db.commit()
+
+def _titles(db, model):
+    db.expire_all()
+    return sorted(row.title for row in db.query(model))
+
+def test_only_old_completed_todos_are_archived_in_batches(db):
+    old = _now() - timedelta(days=40)
+    _add_user_with_todos(db, [
+        *[(f"old{i}", True, old) for i in range(5)],
+        ("open", False, None),
+        # 한국 시간으로 저장되므로 시간대 차이(9시간)보다 가까운 기준 직전 할일도 남아야 합니다
+        ("almost", True, _now() - timedelta(days=30) + timedelta(hours=1)),
+    ])
+
+    assert archive_completed_todos(db, older_than=timedelta(days=30), batch_size=2) == 5
+    assert _titles(db, models.Todo) == ["almost", "open"]
+    archived = db.query(models.ArchivedTodo).all()
+    assert sorted(a.title for a in archived) == [f"old{i}" for i in range(5)]
+    assert all(a.original_id is not None for a in archived)
+
+def test_todo_uncompleted_while_moving_is_not_archived(db):
+    old = _now() - timedelta(days=40)
+    _add_user_with_todos(db, [("keep", True, old), ("move", True, old)])
+
+    # 보관할 ID를 고른 직후, 복사하기 전에 사용자가 "keep"의 완료를 취소한 상황
+    def uncomplete_before_copy(conn, cursor, statement, params, context, executemany):
+        if statement.startswith("INSERT INTO archived_todos"):
+            cursor.connection.execute("UPDATE todos SET completed = 0, completed_at = NULL WHERE title = 'keep'")
+
+    event.listen(engine, "before_cursor_execute", uncomplete_before_copy)
+    try:
+        assert archive_completed_todos(db, older_than=timedelta(days=30)) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", uncomplete_before_copy)
+
+    assert _titles(db, models.Todo) == ["keep"]
+    assert _titles(db, models.ArchivedTodo) == ["move"]
+
+def test_unarchive_restores_todo_with_new_id_at_end_of_list(client, db, signup):
+    headers = signup("alice")
+    first = client.post("/todos/", json={"title": "first"}, headers=headers).json()
+    client.put(f"/todos/{first['id']}", json={"completed": True}, headers=headers)
+    client.post("/todos/", json={"title": "second"}, headers=headers)
+    assert archive_completed_todos(db, older_than=timedelta(seconds=-1)) == 1
+
+    archived = client.get("/todos/archived", headers=headers).json()
+    assert [(a["title"], a["original_id"]) for a in archived] == [("first", first["id"])]
+
+    restored = client.post(f"/todos/archived/{archived[0]['id']}/unarchive", headers=headers)
+    assert restored.status_code == 200
+    assert [t["title"] for t in client.get("/todos/", headers=headers).json()] == ["second", "first"]
+    assert client.get("/todos/archived", headers=headers).json() == []
+    # 되돌린 할일은 완료 일시가 지금으로 바뀌어 바로 다시 보관되지 않습니다
+    assert archive_completed_todos(db, older_than=timedelta(days=30)) == 0
+
+def test_unarchive_other_users_todo_is_404(client, db, signup):
+    alice = signup("alice")
+    todo = client.post("/todos/", json={"title": "mine"}, headers=alice).json()
+    client.put(f"/todos/{todo['id']}", json={"completed": True}, headers=alice)
+    archive_completed_todos(db, older_than=timedelta(seconds=-1))
+    archived_id = client.get("/todos/archived", headers=alice).json()[0]["id"]
+
+    bob = signup("bob")
+    assert client.post(f"/todos/archived/{archived_id}/unarchive", headers=bob).status_code == 404
+
+def test_only_one_worker_holds_a_lease(client, monkeypatch):
+    def as_worker(holder):
+        monkeypatch.setattr(leases, "LEASE_HOLDER", holder)
+
+    as_worker("worker-a")
+    assert try_acquire_lease("job", 60)
+    assert try_acquire_lease("job", 60)  # 가진 워커는 연장할 수 있음
+    assert try_acquire_lease("expired-job", -1)
+
+    as_worker("worker-b")
+    assert not try_acquire_lease("job", 60)
+    assert try_acquire_lease("expired-job", 60)  # 만료된 실행권은 이어받음
+
+    as_worker("worker-a")
+    release_lease("job")
+    as_worker("worker-b")
+    assert try_acquire_lease("job", 60)
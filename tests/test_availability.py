@@ -0,0 +1,72 @@
+"""
+블룸 필터와 사용자명/이메일 사용 가능 여부 확인 테스트
+"""
+
+from app import availability
+from app.admission import classify_request
+from app.availability import BloomFilter, UserAvailabilityIndex, check_availability, normalize_email
+
+class NoQuerySession:
+    """DB를 조회하면 실패하는 가짜 세션 (필터만으로 답해야 하는 경우 확인용)"""
+
+    def query(self, *args, **kwargs):
+        raise AssertionError("필터가 '없음'이라고 답한 값은 DB를 조회하지 않아야 합니다")
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    added = [f"user{i}" for i in range(1000)]
+    for item in added:
+        bloom.add(item)
+
+    assert all(item in bloom for item in added)
+    false_positives = sum(f"other{i}" in bloom for i in range(10000))
+    assert false_positives < 300  # 1% 목표, 여유를 두고 3% 미만
+
+def test_index_answers_maybe_until_built(db):
+    index = UserAvailabilityIndex()
+    assert index.username_may_exist("nobody")
+
+    index.build(db)
+    assert not index.username_may_exist("nobody")
+    index.add("alice", "alice@example.com")
+    assert index.username_may_exist("alice")
+    assert index.email_may_exist("alice@example.com")
+
+def test_absent_values_are_answered_without_db(db, monkeypatch):
+    index = UserAvailabilityIndex()
+    index.build(db)
+    monkeypatch.setattr(availability, "user_index", index)
+
+    result = check_availability(NoQuerySession(), username="newbie", email="newbie@example.com")
+    assert result == {"username": True, "email": True}
+
+def test_invalid_email_is_unavailable_without_db(db, monkeypatch):
+    index = UserAvailabilityIndex()
+    index.build(db)
+    monkeypatch.setattr(availability, "user_index", index)
+
+    assert check_availability(NoQuerySession(), email="not-an-email") == {"username": None, "email": False}
+
+def test_email_is_normalised_like_signup():
+    assert normalize_email("Alice@EXAMPLE.com") == "Alice@example.com"
+    assert normalize_email("bad@") is None
+
+def test_available_endpoint_reports_taken_values(client):
+    client.post("/signup", json={"username": "alice", "email": "Alice@Example.com", "password": "pw123456"})
+
+    taken = client.get("/users/available", params={"username": "alice", "email": "Alice@EXAMPLE.COM"})
+    assert taken.json() == {"username": False, "email": False}
+    free = client.get("/users/available", params={"username": "bob", "email": "bob@example.com"})
+    assert free.json() == {"username": True, "email": True}
+
+def test_signup_rejects_duplicate_username_and_email(client):
+    payload = {"username": "alice", "email": "alice@example.com", "password": "pw123456"}
+    assert client.post("/signup", json=payload).status_code == 200
+
+    duplicate_name = client.post("/signup", json={**payload, "email": "other@example.com"})
+    assert duplicate_name.status_code == 400
+    duplicate_email = client.post("/signup", json={**payload, "username": "other"})
+    assert duplicate_email.status_code == 400
+
+def test_available_endpoint_is_admitted_as_auth_traffic():
+    assert classify_request("GET", "/users/available") == "auth"
@@ -0,0 +1,127 @@
+"""
+묶음 요청(/batch) 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app import admission, crud
+from app.admission import ConcurrencyLimiter, limiters
+from app.batch import _is_allowed
+from app.crud import BATCH_MAX_OPERATIONS
+from app.ordering import rank_rebalancer
+
+@pytest.mark.parametrize("path, allowed", [
+    ("/me", True),
+    ("/me/deactivate", True),
+    ("/todos/", True),
+    ("/todos/3/move", True),
+    ("/users/available", True),
+    ("/mega", False),
+    ("/metrics/admission", False),
+    ("/login", False),
+    ("/batch", False),
+    ("/app/index.html", False),
+])
+def test_batch_path_allow_list(path, allowed):
+    assert _is_allowed(path) is allowed
+
+def _batch(client, headers, operations, atomic=False):
+    response = client.post("/batch", json={"operations": operations, "atomic": atomic}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def _titles(client, headers):
+    return [t["title"] for t in client.get("/todos/", headers=headers).json()]
+
+def test_batch_runs_operations_in_order(client, signup):
+    headers = signup("alice")
+    result = _batch(client, headers, [
+        {"method": "GET", "path": "/me"},
+        {"method": "POST", "path": "/todos/", "body": {"title": "from batch"}},
+        {"method": "GET", "path": "/todos/?limit=10"},
+        {"method": "GET", "path": "/metrics/admission"},
+        {"method": "GET", "path": "/todos/999"},
+    ])
+
+    assert [r["status"] for r in result["results"]] == [200, 200, 200, 400, 404]
+    assert result["results"][0]["body"]["username"] == "alice"
+    assert [t["title"] for t in result["results"][2]["body"]] == ["from batch"]
+    assert result["committed"] is True
+    assert all(limiter.in_flight == 0 for limiter in limiters.values())
+
+def test_atomic_batch_rolls_back_everything_on_failure(client, signup, monkeypatch):
+    requested = []
+    monkeypatch.setattr(rank_rebalancer, "request", requested.append)
+    monkeypatch.setattr(crud, "RANK_MAX_LENGTH", 0)
+    headers = signup("alice")
+
+    result = _batch(client, headers, [
+        {"method": "POST", "path": "/todos/", "body": {"title": "rolled back"}},
+        {"method": "PUT", "path": "/todos/999", "body": {"title": "missing"}},
+        {"method": "POST", "path": "/todos/", "body": {"title": "never run"}},
+    ], atomic=True)
+
+    assert result["committed"] is False
+    assert [r["status"] for r in result["results"]] == [200, 404]
+    assert _titles(client, headers) == []
+    assert requested == []  # 취소된 묶음의 저장 후 작업은 실행되지 않음
+
+def test_atomic_batch_commits_and_runs_deferred_work(client, signup, monkeypatch):
+    requested = []
+    monkeypatch.setattr(rank_rebalancer, "request", requested.append)
+    monkeypatch.setattr(crud, "RANK_MAX_LENGTH", 0)
+    headers = signup("alice")
+
+    result = _batch(client, headers, [
+        {"method": "POST", "path": "/todos/", "body": {"title": "one"}},
+        {"method": "POST", "path": "/todos/", "body": {"title": "two"}},
+    ], atomic=True)
+
+    assert result["committed"] is True
+    assert _titles(client, headers) == ["one", "two"]
+    assert len(requested) == 2
+    assert all(limiter.in_flight == 0 for limiter in limiters.values())
+
+def test_atomic_batch_can_modify_the_current_user(client, signup):
+    headers = signup("alice")
+    result = _batch(client, headers, [{"method": "POST", "path": "/me/deactivate"}], atomic=True)
+
+    assert result["committed"] is True
+    assert result["results"][0]["body"]["is_active"] is False
+    assert client.get("/me", headers=headers).status_code == 400  # 비활성 사용자
+
+def test_atomic_batch_is_rejected_when_no_slot_is_free(client, signup, monkeypatch):
+    headers = signup("alice")
+    full = ConcurrencyLimiter("write", limit=1, max_queue=0, queue_timeout=1)
+    asyncio.run(full.acquire())
+    monkeypatch.setitem(admission.limiters, "write", full)
+
+    response = client.post("/batch", json={
+        "operations": [{"method": "POST", "path": "/todos/", "body": {"title": "x"}}], "atomic": True
+    }, headers=headers)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert _titles(client, headers) == []
+
+def test_batch_releases_its_own_slot_before_sub_requests(client, signup, monkeypatch):
+    headers = signup("alice")
+    # 쓰기 자리가 하나뿐이어도 /batch가 자기 자리를 먼저 반환하므로 하위 쓰기 요청이 실행됩니다
+    single = ConcurrencyLimiter("write", limit=1, max_queue=0, queue_timeout=1)
+    monkeypatch.setitem(admission.limiters, "write", single)
+
+    result = _batch(client, headers, [
+        {"method": "GET", "path": "/todos/"},
+        {"method": "POST", "path": "/todos/", "body": {"title": "x"}},
+        {"method": "PUT", "path": "/todos/1", "body": {"completed": True}},
+    ])
+    assert [r["status"] for r in result["results"]] == [200, 200, 200]
+    assert single.admitted == 3  # /batch 자신 + 쓰기 하위 요청 2개
+    assert single.in_flight == 0
+
+def test_batch_size_is_limited(client, signup):
+    headers = signup("alice")
+    operations = [{"method": "GET", "path": "/me"}] * (BATCH_MAX_OPERATIONS + 1)
+    response = client.post("/batch", json={"operations": operations}, headers=headers)
+    assert response.status_code == 422
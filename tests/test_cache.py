@@ -0,0 +1,91 @@
+"""
+할일 조회 캐시(LRU, 소유자별 버전 무효화, 동시 조회 합치기) 테스트
+"""
+
+import threading
+import time
+
+from app import cache
+from app.cache import MISSING, LRUCacheBackend, NullCacheBackend, TodoCache, create_todo_cache, todo_cache
+
+def test_lru_evicts_least_recently_used():
+    backend = LRUCacheBackend(max_entries=2, ttl=60)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")  # a를 최근 사용으로
+    backend.set("c", 3)
+
+    assert backend.get("b") is MISSING
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+    assert backend.evictions == 1
+
+def test_lru_entries_expire_after_ttl():
+    backend = LRUCacheBackend(max_entries=10, ttl=0.01)
+    backend.set("a", 1)
+    time.sleep(0.02)
+    assert backend.get("a") is MISSING
+
+def test_invalidate_owner_only_drops_that_owners_entries():
+    owner_cache = TodoCache(LRUCacheBackend(max_entries=100, ttl=60))
+    loads = []
+
+    def loader(value):
+        def load():
+            loads.append(value)
+            return value
+        return load
+
+    assert owner_cache.get_or_load(1, ("list",), loader("a1")) == "a1"
+    assert owner_cache.get_or_load(1, ("list",), loader("a2")) == "a1"
+    owner_cache.get_or_load(2, ("list",), loader("b1"))
+
+    owner_cache.invalidate_owner(1)
+    assert owner_cache.get_or_load(1, ("list",), loader("a3")) == "a3"
+    assert owner_cache.get_or_load(2, ("list",), loader("b2")) == "b1"
+    assert loads == ["a1", "b1", "a3"]
+
+def test_concurrent_misses_run_loader_once():
+    owner_cache = TodoCache(LRUCacheBackend(max_entries=100, ttl=60))
+    calls = []
+    started = threading.Event()
+
+    def slow_loader():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return ["todo"]
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(owner_cache.get_or_load(1, ("list",), slow_loader)))
+    leader.start()
+    started.wait(1)
+    follower = threading.Thread(target=lambda: results.append(owner_cache.get_or_load(1, ("list",), slow_loader)))
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert results == [["todo"], ["todo"]]
+    assert len(calls) == 1
+
+def test_cache_is_disabled_for_multiple_workers_without_shared_store(monkeypatch):
+    monkeypatch.setattr(cache, "TODO_CACHE_REDIS_URL", None)
+    monkeypatch.setattr(cache, "WEB_CONCURRENCY", 4)
+    disabled = create_todo_cache()
+    assert isinstance(disabled.backend, NullCacheBackend)
+    assert disabled.stats()["enabled"] is False
+
+    monkeypatch.setattr(cache, "WEB_CONCURRENCY", 1)
+    assert isinstance(create_todo_cache().backend, LRUCacheBackend)
+
+def test_todo_list_is_served_from_cache_until_a_write(client, signup):
+    headers = signup("alice")
+    client.post("/todos/", json={"title": "first"}, headers=headers)
+
+    client.get("/todos/", headers=headers)
+    hits = todo_cache.hits
+    assert len(client.get("/todos/", headers=headers).json()) == 1
+    assert todo_cache.hits == hits + 1
+
+    client.post("/todos/", json={"title": "second"}, headers=headers)
+    assert [t["title"] for t in client.get("/todos/", headers=headers).json()] == ["first", "second"]
@@ -0,0 +1,92 @@
+"""
+DB 커넥션 조기 반환, 점유 시간 통계, 세션 도우미 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_serializer
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, inspect, text
+
+from app import models
+from app.database import (
+    EarlyReleaseRoute, PoolHoldStats, SessionLocal, add_missing_columns, after_commit, engine, get_db
+)
+
+def test_pool_hold_stats_records_checkout_durations():
+    stats = PoolHoldStats(samples=10)
+    for _ in range(3):
+        record = SimpleNamespace(info={})
+        stats.on_checkout(None, record, None)
+        stats.on_checkin(None, record)
+    stats.on_checkin(None, SimpleNamespace(info={}))  # 기록 없이 반환된 커넥션은 무시
+
+    result = stats.stats()
+    assert result["checkouts"] == 3
+    assert 0 <= result["p50_hold_ms"] <= result["p99_hold_ms"] <= result["max_hold_ms"]
+
+def test_connection_is_returned_before_response_serialization(client):
+    checked_out_while_serializing = []
+
+    class Payload(BaseModel):
+        count: int
+
+        @field_serializer("count")
+        def record_pool(self, value):
+            checked_out_while_serializing.append(engine.pool.checkedout())
+            return value
+
+    test_app = FastAPI()
+    test_app.router.route_class = EarlyReleaseRoute
+
+    @test_app.get("/count", response_model=Payload)
+    def count(db=Depends(get_db)):
+        return {"count": db.query(models.User).count()}
+
+    with TestClient(test_app) as test_client:
+        assert test_client.get("/count").json() == {"count": 0}
+    assert checked_out_while_serializing == [0]
+
+def test_read_only_session_rejects_writes(db):
+    session = SessionLocal()
+    session.info["read_only"] = True
+    session.add(models.User(username="alice", email="alice@example.com", hashed_password="x"))
+    with pytest.raises(RuntimeError):
+        session.flush()
+    session.close()
+
+def test_after_commit_runs_now_or_when_the_batch_commits():
+    calls = []
+    session = SimpleNamespace(info={})
+    after_commit(session, calls.append, "now")
+    assert calls == ["now"]
+
+    session.info["after_commit"] = []
+    after_commit(session, calls.append, "later")
+    assert calls == ["now"]
+    for callback, args in session.info["after_commit"]:
+        callback(*args)
+    assert calls == ["now", "later"]
+
+def test_add_missing_columns_upgrades_existing_tables(tmp_path):
+    old_engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with old_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR)"))
+        conn.execute(text("INSERT INTO items (name) VALUES ('kept')"))
+
+    metadata = MetaData()
+    Table(
+        "items", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("rank", String, index=True),
+    )
+    add_missing_columns(old_engine, metadata)
+
+    inspector = inspect(old_engine)
+    assert "rank" in {column["name"] for column in inspector.get_columns("items")}
+    assert "ix_items_rank" in {index["name"] for index in inspector.get_indexes("items")}
+    with old_engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM items")).scalar() == "kept"
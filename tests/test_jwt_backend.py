@@ -0,0 +1,88 @@
+"""
+JWT 백엔드(비밀키별 재사용, 설정 확인, 지연 불러오기) 테스트
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app import jwt_backend
+from app.jwt_backend import (
+    JWTConfigError, PyJWTBackend, TokenError, check_jwt_settings, get_jwt_backend, register_jwt_backend
+)
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+def test_backend_is_reused_per_secret():
+    first = get_jwt_backend("secret-a")
+    assert get_jwt_backend("secret-a") is first
+    other = get_jwt_backend("secret-b")
+    assert other is not first
+
+    token = first.encode({"sub": "1"})
+    assert first.decode(token)["sub"] == "1"
+    with pytest.raises(TokenError):
+        other.decode(token)  # 다른 비밀키로 서명된 토큰은 거절
+
+def test_broken_token_raises_token_error():
+    with pytest.raises(TokenError):
+        get_jwt_backend("secret-a").decode("not-a-token")
+
+def test_public_key_algorithm_without_keys_fails_at_startup_check():
+    with pytest.raises(JWTConfigError, match="JWT_PRIVATE_KEY, JWT_PUBLIC_KEY"):
+        check_jwt_settings(algorithm="RS256", private_key=None, public_key=None)
+    with pytest.raises(JWTConfigError, match="JWT_PUBLIC_KEY"):
+        check_jwt_settings(algorithm="RS256", private_key="pem", public_key=None)
+    check_jwt_settings(algorithm="HS256", private_key=None, public_key=None)
+
+def test_unknown_backend_fails_at_startup_check():
+    with pytest.raises(JWTConfigError, match="pyjwt"):
+        check_jwt_settings(backend="missing")
+
+def test_registered_backend_is_used(monkeypatch):
+    class ReversingBackend:
+        def __init__(self, secret):
+            self.secret = secret
+
+        def encode(self, claims):
+            return claims["sub"][::-1]
+
+        def decode(self, token):
+            return {"sub": token[::-1]}
+
+    monkeypatch.setattr(jwt_backend, "_BACKENDS", dict(jwt_backend._BACKENDS))  # 등록이 다른 테스트에 남지 않게
+    monkeypatch.setattr(jwt_backend, "_backends", {})
+    monkeypatch.setattr(jwt_backend, "JWT_BACKEND", "reversing")
+    register_jwt_backend("reversing", ReversingBackend)
+    check_jwt_settings(backend="reversing")
+
+    backend = get_jwt_backend("secret")
+    assert isinstance(backend, ReversingBackend)
+    assert backend.decode(backend.encode({"sub": "42"})) == {"sub": "42"}
+
+def test_rs256_round_trip_and_missing_public_key():
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+    backend = PyJWTBackend("unused", algorithm="RS256", private_key=private_pem, public_key=public_pem)
+    assert backend.decode(backend.encode({"sub": "1"}))["sub"] == "1"
+    with pytest.raises(JWTConfigError):
+        PyJWTBackend("unused", algorithm="RS256", private_key=private_pem, public_key=None)
+
+def test_jwt_library_is_not_imported_at_startup():
+    code = "import sys, app.main; print('jwt' in sys.modules, 'jose' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False False"
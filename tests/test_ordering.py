@@ -0,0 +1,167 @@
+"""
+할일 순서 키(생성, 충돌 재시도, 재배치) 테스트
+"""
+
+import random
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app import crud, models
+from app.ordering import (
+    RankConflictError, commit_rank_change, evenly_spaced_keys, key_between, prepare_unique_rank_index,
+    rank_rebalancer, rebalance_owner, update_rank
+)
+
+def _append_keys(count: int):
+    keys = [key_between(None, None)]
+    for _ in range(count - 1):
+        keys.append(key_between(keys[-1], None))
+    return keys
+
+def test_appended_keys_grow_logarithmically():
+    keys = _append_keys(10_000)
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(keys)
+    assert max(len(key) for key in keys[:500]) <= 4
+    assert max(len(key) for key in keys) <= 8
+
+def test_append_carries_and_widens_when_all_digits_are_z():
+    assert key_between("y", None) == "z"
+    assert key_between("z", None) == "z1"
+    assert key_between("a9", None) == "aa"
+    assert key_between("zz", None) == "zz01"
+
+def test_random_insertions_keep_strict_order():
+    rng = random.Random(36)
+    keys = [key_between(None, None)]
+    for _ in range(2000):
+        i = rng.randint(0, len(keys))
+        before = keys[i - 1] if i > 0 else None
+        after = keys[i] if i < len(keys) else None
+        key = key_between(before, after)
+        assert (before is None or before < key) and (after is None or key < after)
+        assert not key.endswith("0")
+        keys.insert(i, key)
+    assert keys == sorted(keys)
+
+def test_key_between_rejects_out_of_order_neighbours():
+    with pytest.raises(ValueError):
+        key_between("b", "a")
+    with pytest.raises(ValueError):
+        key_between("a", "a")
+
+def test_evenly_spaced_keys_are_short_sorted_and_unique():
+    keys = evenly_spaced_keys(1000)
+    assert len(keys) == 1000
+    assert keys == sorted(set(keys))
+    assert max(len(key) for key in keys) <= 3
+    assert not any(key.endswith("0") for key in keys)
+
+@pytest.fixture
+def owner(db):
+    db.add(models.User(id=1, username="alice", email="alice@example.com", hashed_password="x"))
+    db.commit()
+    return 1
+
+def _add_todos(db, ranks, priority=2):
+    todos = [models.Todo(title=f"t{i}", owner_id=1, rank=rank, priority=priority) for i, rank in enumerate(ranks)]
+    db.add_all(todos)
+    db.commit()
+    return todos
+
+def _ranked_titles(db):
+    db.expire_all()
+    return [t.title for t in db.query(models.Todo).order_by(models.Todo.rank)]
+
+def test_update_rank_detects_a_concurrent_change(db, owner):
+    todo, = _add_todos(db, ["m"])
+    with pytest.raises(RankConflictError):
+        update_rank(db, todo.id, "stale", "n")
+    db.rollback()
+    update_rank(db, todo.id, "m", "n")
+    db.commit()
+    assert _ranked_titles(db) == ["t0"]
+
+def test_commit_rank_change_retries_after_duplicate_key(db, owner):
+    first, second = _add_todos(db, ["a", "b"])
+    attempts = []
+
+    def change():
+        attempts.append(1)
+        # 첫 시도는 동시에 추가된 할일과 같은 키를 받은 상황 → 고유 인덱스 위반
+        update_rank(db, second.id, "b", "a" if len(attempts) == 1 else "c")
+        return second
+
+    assert commit_rank_change(db, change) is second
+    assert len(attempts) == 2
+    db.expire_all()
+    assert db.get(models.Todo, second.id).rank == "c"
+
+def test_commit_rank_change_does_not_retry_inside_atomic_batch(db, owner):
+    todo, = _add_todos(db, ["a"])
+    db.info["atomic"] = True
+    attempts = []
+
+    def change():
+        attempts.append(1)
+        update_rank(db, todo.id, "stale", "b")
+        return todo
+
+    with pytest.raises(RankConflictError):
+        commit_rank_change(db, change)
+    assert len(attempts) == 1
+
+def test_rebalance_keeps_order_and_ranks_legacy_todos_last(db, owner):
+    _add_todos(db, ["a", "a" + "i" * 20, "b"])
+    legacy = _add_todos(db, [None, None], priority=1)
+    legacy[0].title, legacy[1].title = "legacy0", "legacy1"
+    db.commit()
+
+    rebalance_owner(db, 1)
+    db.expire_all()
+    todos = db.query(models.Todo).order_by(models.Todo.rank).all()
+    assert [t.title for t in todos][:3] == ["t0", "t1", "t2"]
+    assert {t.title for t in todos[3:]} == {"legacy0", "legacy1"}
+    assert all(t.rank is not None and len(t.rank) <= 2 for t in todos)
+
+def test_prepare_unique_rank_index_clears_duplicate_keys(tmp_path):
+    old_engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with old_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE todos (id INTEGER PRIMARY KEY, owner_id INTEGER, rank VARCHAR)"))
+        conn.execute(text("CREATE INDEX ix_todos_owner_id_rank ON todos (owner_id, rank)"))
+        conn.execute(text("INSERT INTO todos (owner_id, rank) VALUES (1, 'i'), (1, 'i'), (2, 'i'), (1, 'j')"))
+
+    prepare_unique_rank_index(old_engine)
+
+    with old_engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, rank FROM todos ORDER BY id")).all()
+    assert [rank for _, rank in rows] == ["i", None, "i", "j"]
+    assert "ix_todos_owner_id_rank" not in {index["name"] for index in inspect(old_engine).get_indexes("todos")}
+
+def test_move_endpoint_reorders_and_rejects_bad_neighbours(client, signup):
+    headers = signup("alice")
+    a, b, c = (client.post("/todos/", json={"title": title}, headers=headers).json()["id"] for title in "abc")
+
+    def titles():
+        return [t["title"] for t in client.get("/todos/", headers=headers).json()]
+
+    assert client.post(f"/todos/{c}/move", json={"prev_id": a, "next_id": b}, headers=headers).status_code == 200
+    assert titles() == ["a", "c", "b"]
+    client.post(f"/todos/{a}/move", json={"prev_id": b}, headers=headers)
+    assert titles() == ["c", "b", "a"]
+    client.post(f"/todos/{a}/move", json={"next_id": c}, headers=headers)
+    assert titles() == ["a", "c", "b"]
+
+    assert client.post(f"/todos/{a}/move", json={"prev_id": b, "next_id": c}, headers=headers).status_code == 409
+    assert client.post(f"/todos/{a}/move", json={"prev_id": a}, headers=headers).status_code == 409
+    assert client.post("/todos/999/move", json={"prev_id": a}, headers=headers).status_code == 404
+
+def test_long_keys_request_a_rebalance(client, signup, monkeypatch):
+    requested = []
+    monkeypatch.setattr(rank_rebalancer, "request", requested.append)
+    monkeypatch.setattr(crud, "RANK_MAX_LENGTH", 0)
+    headers = signup("alice")
+    client.post("/todos/", json={"title": "a"}, headers=headers)
+    owner_id = client.get("/me", headers=headers).json()["id"]
+    assert requested == [owner_id]
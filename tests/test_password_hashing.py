@@ -0,0 +1,56 @@
+"""
+bcrypt 라운드 보정과 로그인 후 재해시 테스트
+"""
+
+from app import auth, bcrypt_calibration, models
+
+def test_clamp_rounds_keeps_rounds_within_floor_and_ceiling():
+    assert bcrypt_calibration.clamp_rounds(4, min_rounds=10, max_rounds=14) == 10
+    assert bcrypt_calibration.clamp_rounds(20, min_rounds=10, max_rounds=14) == 14
+    assert bcrypt_calibration.clamp_rounds(12, min_rounds=10, max_rounds=14) == 12
+
+def test_calibrate_picks_highest_rounds_within_target(monkeypatch):
+    # 하한선에서 10ms -> 라운드가 1 오를 때마다 2배 (20, 40, 80, 160, 320ms)
+    monkeypatch.setattr(bcrypt_calibration, "measure_verify_seconds", lambda rounds, samples=3: 0.010)
+    assert bcrypt_calibration.calibrate_rounds(target_ms=250, min_rounds=10, max_rounds=16) == 14
+    assert bcrypt_calibration.calibrate_rounds(target_ms=250, min_rounds=10, max_rounds=12) == 12
+    # 하한선조차 목표보다 느려도 하한선 아래로는 내려가지 않습니다
+    assert bcrypt_calibration.calibrate_rounds(target_ms=1, min_rounds=10, max_rounds=16) == 10
+
+def test_fixed_rounds_are_clamped(monkeypatch):
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", "1")
+    monkeypatch.setattr(auth, "_pwd_context", None)
+    context = auth.get_password_context()
+    assert context.handler("bcrypt").default_rounds == bcrypt_calibration.BCRYPT_MIN_ROUNDS
+
+def test_requests_use_floor_rounds_until_calibration_finishes(monkeypatch):
+    monkeypatch.setattr(auth, "BCRYPT_ROUNDS", None)
+    monkeypatch.setattr(auth, "_pwd_context", None)
+    monkeypatch.setattr(auth, "_floor_pwd_context", None)
+
+    def fail_calibration(*args, **kwargs):
+        raise AssertionError("요청 처리 중에 CPU 측정을 하면 안 됩니다")
+
+    monkeypatch.setattr(bcrypt_calibration, "calibrate_rounds", fail_calibration)
+    floor = auth.get_password_context()
+    assert floor.handler("bcrypt").default_rounds == bcrypt_calibration.BCRYPT_MIN_ROUNDS
+    assert auth._pwd_context is None
+
+    monkeypatch.setattr(bcrypt_calibration, "calibrate_rounds", lambda: 5)
+    assert auth.configure_password_hashing() == 5
+    # 하한선으로 만든 해시는 보정된 라운드보다 약하므로 다시 해시 대상입니다
+    assert auth.get_password_context().needs_update(floor.hash("password123"))
+
+def test_login_rehashes_weak_hash_in_background(client, db, signup, monkeypatch):
+    signup("alice")
+    old_hash = db.query(models.User).filter_by(username="alice").one().hashed_password
+    assert old_hash.startswith("$2b$04$")
+
+    monkeypatch.setattr(auth, "_pwd_context", auth._build_password_context(5))
+    response = client.post("/login", json={"username": "alice", "password": "password123"})
+    assert response.status_code == 200
+
+    db.expire_all()
+    new_hash = db.query(models.User).filter_by(username="alice").one().hashed_password
+    assert new_hash.startswith("$2b$05$")
+    assert auth.verify_password("password123", new_hash)
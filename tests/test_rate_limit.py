@@ -0,0 +1,109 @@
+"""
+로그인 시도 제한(토큰 버킷 + 지수 백오프) 테스트
+"""
+
+import ipaddress
+
+import pytest
+from starlette.requests import Request
+
+from app import rate_limit
+from app.rate_limit import InMemoryThrottleStore, LoginThrottle, get_client_ip
+
+class FakeClock:
+    """time.time()을 대신하여 테스트가 시간을 직접 움직일 수 있게 합니다"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "time", fake)
+    return fake
+
+@pytest.fixture
+def throttle(monkeypatch, clock):
+    monkeypatch.setattr(rate_limit, "LOGIN_USER_CAPACITY", 3.0)
+    monkeypatch.setattr(rate_limit, "LOGIN_USER_REFILL_PER_MIN", 60.0)  # 1초에 1개
+    monkeypatch.setattr(rate_limit, "LOGIN_FREE_FAILURES", 2)
+    monkeypatch.setattr(rate_limit, "LOGIN_BACKOFF_BASE_SEC", 1.0)
+    monkeypatch.setattr(rate_limit, "LOGIN_BACKOFF_MAX_SEC", 8.0)
+    return LoginThrottle(InMemoryThrottleStore())
+
+def _request(host: str, forwarded: str = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (host, 1234), "headers": headers})
+
+def test_bucket_allows_capacity_then_refills(throttle, clock):
+    keys = ["user:alice"]
+    assert [throttle.check(keys) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert throttle.check(keys) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert throttle.check(keys) == 0.0
+    assert throttle.check(keys) > 0
+
+def test_rejected_attempt_does_not_spend_other_buckets(throttle):
+    for _ in range(3):
+        throttle.check(["user:alice"])
+    assert throttle.check(["user:alice", "ip:10.0.0.1"]) > 0
+    # 거절된 시도는 IP 버킷의 토큰을 쓰지 않았으므로 다른 사용자명은 그대로 3번 시도할 수 있습니다
+    assert [throttle.check(["user:bob", "ip:10.0.0.1"]) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+def test_failures_back_off_exponentially_up_to_max(throttle, clock):
+    keys = ["user:alice"]
+    throttle.record_failure(keys)
+    throttle.record_failure(keys)
+    clock.now += 10  # 버킷을 다시 채움
+    assert throttle.check(keys) == 0.0  # 허용 실패 횟수(2회)까지는 차단하지 않음
+
+    waits = []
+    for _ in range(5):
+        throttle.record_failure(keys)
+        waits.append(throttle.check(keys))
+        clock.now += waits[-1]
+    assert waits == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+def test_success_resets_user_backoff_but_not_ip(throttle, clock):
+    keys = ["user:alice", "ip:10.0.0.1"]
+    for _ in range(3):
+        throttle.record_failure(keys)
+    throttle.record_success(keys)
+
+    assert throttle.check(["user:alice"]) == 0.0
+    assert throttle.check(["ip:10.0.0.1"]) == pytest.approx(1.0)
+
+def test_in_memory_store_evicts_oldest_entry():
+    store = InMemoryThrottleStore(max_entries=2)
+    store.save("a", {"n": 1}, ttl=60)
+    store.save("b", {"n": 2}, ttl=60)
+    store.save("a", {"n": 3}, ttl=60)  # 다시 저장하면 가장 최근 항목이 됨
+    store.save("c", {"n": 4}, ttl=60)
+    assert store.load("b") is None
+    assert store.load("a") == {"n": 3}
+    assert store.load("c") == {"n": 4}
+
+def test_client_ip_ignores_forwarded_header_from_untrusted_peer(monkeypatch):
+    monkeypatch.setattr(rate_limit, "TRUSTED_PROXIES", [])
+    assert get_client_ip(_request("203.0.113.5", "1.2.3.4")) == "203.0.113.5"
+
+def test_client_ip_reads_forwarded_header_from_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(rate_limit, "TRUSTED_PROXIES", [
+        ipaddress.ip_network("127.0.0.1/32"), ipaddress.ip_network("10.0.0.0/8")
+    ])
+    # 위조한 왼쪽 값(6.6.6.6)은 무시하고 신뢰하는 프록시가 아닌 가장 오른쪽 주소를 씁니다
+    assert get_client_ip(_request("127.0.0.1", "6.6.6.6, 198.51.100.7, 10.0.0.2")) == "198.51.100.7"
+    assert get_client_ip(_request("127.0.0.1")) == "127.0.0.1"
+
+def test_login_returns_429_with_retry_after_when_throttled(client, signup, monkeypatch):
+    monkeypatch.setattr(rate_limit, "LOGIN_USER_CAPACITY", 2.0)
+    signup("alice")  # 로그인 1회 사용
+    client.post("/login", json={"username": "alice", "password": "wrong"})
+
+    response = client.post("/login", json={"username": "alice", "password": "password123"})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
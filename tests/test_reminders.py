@@ -0,0 +1,126 @@
+"""
+마감 알림 스케줄러(구간 조회, 페이지 이어 읽기, 다시 읽기) 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import leases, models
+from app.reminders import InMemoryReminderSink, ReminderScheduler
+
+@pytest.fixture
+def start(db):
+    """할일 주인이 될 사용자를 만들고, 테스트의 시작 시각(시간대 없는 한국 시간)을 돌려줍니다"""
+    db.add(models.User(id=1, username="alice", email="alice@example.com", hashed_password="x"))
+    db.commit()
+    return models.get_kst_now().replace(tzinfo=None, microsecond=0)
+
+def _scheduler(now: datetime, **options) -> ReminderScheduler:
+    """scheduler.clock을 바꿔 시간을 움직이는 스케줄러 (기본: 60초 구간, 다시 읽기 없음)"""
+    options.setdefault("window", timedelta(seconds=60))
+    options.setdefault("rescan", 10 ** 9)
+    scheduler = ReminderScheduler(InMemoryReminderSink(), **options)
+    scheduler.clock = now
+    scheduler._now = lambda: scheduler.clock
+    return scheduler
+
+def _add_todo(db, title: str, due_at: datetime, rank: str) -> models.Todo:
+    todo = models.Todo(title=title, owner_id=1, due_at=due_at, rank=rank)
+    db.add(todo)
+    db.commit()
+    return todo
+
+def _sent_titles(scheduler):
+    return [event["title"] for event in scheduler.sink.events]
+
+def test_due_todos_are_sent_once_and_past_due_before_start_is_skipped(db, start):
+    _add_todo(db, "overdue", start - timedelta(minutes=1), "a")
+    _add_todo(db, "soon", start + timedelta(seconds=10), "b")
+    _add_todo(db, "later", start + timedelta(minutes=5), "c")
+    scheduler = _scheduler(start)
+
+    assert scheduler.tick(db) == 0
+    scheduler.clock = start + timedelta(seconds=11)
+    assert scheduler.tick(db) == 1
+    assert scheduler.tick(db) == 0
+    scheduler.clock = start + timedelta(minutes=5)
+    assert scheduler.tick(db) == 1
+    assert _sent_titles(scheduler) == ["soon", "later"]
+
+def test_more_due_todos_than_batch_size_are_all_sent_in_one_tick(db, start):
+    due = start + timedelta(seconds=10)
+    for i in range(35):
+        db.add(models.Todo(title=f"t{i:02d}", owner_id=1, due_at=due, rank=f"r{i:02d}"))
+    db.commit()
+    scheduler = _scheduler(start, batch_size=10)
+
+    scheduler.tick(db)
+    assert scheduler.stats()["heap_size"] == 10  # 구간 전체가 아니라 한 페이지씩만 올림
+    scheduler.clock = due
+    assert scheduler.tick(db) == 35
+    assert sorted(_sent_titles(scheduler)) == [f"t{i:02d}" for i in range(35)]
+    assert scheduler.tick(db) == 0
+
+def test_completed_or_rescheduled_todos_are_not_sent_at_old_time(db, start):
+    done = _add_todo(db, "done", start + timedelta(seconds=10), "a")
+    moved = _add_todo(db, "moved", start + timedelta(seconds=10), "b")
+    scheduler = _scheduler(start)
+    scheduler.tick(db)
+
+    done.completed = True
+    moved.due_at = start + timedelta(seconds=30)
+    db.commit()
+    scheduler.notify(moved.id, 1, moved.title, moved.due_at, completed=False)
+
+    scheduler.clock = start + timedelta(seconds=11)
+    assert scheduler.tick(db) == 0
+    scheduler.clock = start + timedelta(seconds=31)
+    assert scheduler.tick(db) == 1
+    assert _sent_titles(scheduler) == ["moved"]
+
+def test_rescan_picks_up_todos_added_by_other_workers(db, start):
+    scheduler = _scheduler(start, rescan=0)
+    scheduler.tick(db)
+
+    # 다른 워커가 만든 할일이라 이 워커의 notify()는 호출되지 않음
+    _add_todo(db, "from-other-worker", start + timedelta(seconds=10), "a")
+    scheduler.clock = start + timedelta(seconds=11)
+    assert scheduler.tick(db) == 1
+    assert scheduler.tick(db) == 0
+
+def test_without_rescan_only_notified_todos_are_sent(db, start):
+    scheduler = _scheduler(start)
+    scheduler.tick(db)
+
+    _add_todo(db, "not-notified", start + timedelta(seconds=10), "a")
+    notified = _add_todo(db, "notified", start + timedelta(seconds=10), "b")
+    scheduler.notify(notified.id, 1, notified.title, notified.due_at, completed=False)
+    scheduler.clock = start + timedelta(seconds=11)
+    assert scheduler.tick(db) == 1
+    assert _sent_titles(scheduler) == ["notified"]
+
+def test_due_at_can_be_filtered_and_cleared(client, signup):
+    headers = signup("alice")
+    due = client.post("/todos/", json={"title": "due", "due_at": "2030-01-01T09:00:00+09:00"}, headers=headers).json()
+    client.post("/todos/", json={"title": "no-due"}, headers=headers)
+
+    due_soon = client.get("/todos/", params={"due_before": "2030-01-02T00:00:00+09:00"}, headers=headers).json()
+    assert [t["title"] for t in due_soon] == ["due"]
+
+    cleared = client.put(f"/todos/{due['id']}", json={"due_at": None}, headers=headers).json()
+    assert cleared["due_at"] is None
+
+def test_only_one_worker_sends_reminders(db, start, monkeypatch):
+    first, second = _scheduler(start), _scheduler(start)
+    monkeypatch.setattr(leases, "LEASE_HOLDER", "worker-a")
+    first._hold_lease(float("-inf"))
+    monkeypatch.setattr(leases, "LEASE_HOLDER", "worker-b")
+    second._hold_lease(float("-inf"))
+    assert (first.is_leader, second.is_leader) == (True, False)
+
+    monkeypatch.setattr(leases, "LEASE_HOLDER", "worker-a")
+    first.stop()  # 멈추면 실행권을 바로 내려놓음
+    monkeypatch.setattr(leases, "LEASE_HOLDER", "worker-b")
+    second._hold_lease(float("-inf"))
+    assert second.is_leader
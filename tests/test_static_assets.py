@@ -0,0 +1,102 @@
+"""
+프론트엔드 정적 파일 빌드와 압축 방식 선택 테스트
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from app.static_assets import (
+    IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, BuiltAsset, _choose_encoding, build_assets
+)
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+def _asset(*encodings) -> BuiltAsset:
+    asset = BuiltAsset(Path("style.css"), "text/css", '"abc"', immutable=True)
+    asset.variants = {encoding: Path(f"style.css.{encoding}") for encoding in encodings}
+    return asset
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("gzip;q=0.5, br;q=0.2", "gzip"),
+    ("*", "br"),
+    ("*;q=0", None),
+    ("br;q=0, *", "gzip"),
+    ("gzip;q=0, br;q=0", None),
+    ("identity", None),
+    ("gzip;q=abc", None),
+    ("", None),
+])
+def test_choose_encoding_honours_q_values(accept_encoding, expected):
+    assert _choose_encoding(_asset("br", "gzip"), accept_encoding) == expected
+
+def test_choose_encoding_skips_missing_variants():
+    assert _choose_encoding(_asset("gzip"), "br") is None
+    assert _choose_encoding(_asset("gzip"), "br, gzip;q=0.1") == "gzip"
+
+def _write_frontend(source_dir: Path, css: str):
+    source_dir.mkdir(exist_ok=True)
+    (source_dir / "style.css").write_text(css)
+    (source_dir / "index.html").write_text('<link href="style.css"><a href="login.html">login</a>')
+
+def test_build_fingerprints_files_and_rewrites_html(tmp_path):
+    _write_frontend(tmp_path / "src", "body { color: red; }\n" * 50)
+    assets = build_assets(tmp_path / "src", tmp_path / "build")
+
+    css_name = next(name for name in assets if name.endswith(".css"))
+    assert css_name != "style.css" and assets[css_name].immutable
+    assert "gzip" in assets[css_name].variants
+    html = assets["index.html"].path.read_text()
+    assert f'href="{css_name}"' in html
+    assert 'href="login.html"' in html
+    assert not assets["index.html"].immutable
+
+def test_rebuild_keeps_recent_builds_and_removes_stale_ones(tmp_path):
+    source, build = tmp_path / "src", tmp_path / "build"
+    _write_frontend(source, "a {}")
+    first_dir = build_assets(source, build)["index.html"].path.parent
+    assert build_assets(source, build)["index.html"].path.parent == first_dir  # 같은 내용은 같은 폴더
+
+    _write_frontend(source, "b {}")
+    second_dir = build_assets(source, build)["index.html"].path.parent
+    assert second_dir != first_dir
+    assert first_dir.is_dir()  # 예전 워커가 아직 쓰고 있을 수 있으므로 바로 지우지 않음
+
+    old = time.time() - 2 * 3600
+    os.utime(first_dir, (old, old))
+    (build / ".tmp-123-deadbeef").mkdir()
+    os.utime(build / ".tmp-123-deadbeef", (old, old))
+    _write_frontend(source, "c {}")
+    third_dir = build_assets(source, build)["index.html"].path.parent
+
+    assert sorted(p.name for p in build.iterdir()) == sorted([second_dir.name, third_dir.name])
+
+def test_frontend_is_served_with_cache_headers(client):
+    index = client.get("/app/", headers={"Accept-Encoding": "gzip"})
+    assert index.status_code == 200
+    assert index.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+    assert index.headers["Content-Encoding"] == "gzip"
+    assert index.headers["Vary"] == "Accept-Encoding"
+
+    not_modified = client.get("/app/", headers={"Accept-Encoding": "gzip", "If-None-Match": index.headers["ETag"]})
+    assert not_modified.status_code == 304
+
+    css_name = index.text.split('href="')[1].split('"')[0]
+    css = client.get(f"/app/{css_name}", headers={"Accept-Encoding": "identity"})
+    assert css.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+    assert "Content-Encoding" not in css.headers
+    assert client.get("/app/missing.js").status_code == 404
+
+def test_brotli_is_not_imported_at_startup():
+    code = "import sys, app.main; print('brotli' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
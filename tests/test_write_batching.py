@@ -0,0 +1,69 @@
+"""
+할일 수정 묶음 커밋(group commit) 테스트
+"""
+
+import threading
+import time
+
+from app.crud import TodoUpdate
+from app.database import SessionLocal
+from app.write_batching import WriteCoalescer, is_coalescible
+
+def test_only_idempotent_fields_are_coalescible():
+    assert is_coalescible(TodoUpdate(completed=True))
+    assert is_coalescible(TodoUpdate(title="new", priority=1))
+    assert not is_coalescible(TodoUpdate())
+    assert not is_coalescible(TodoUpdate(description="memo"))
+    assert not is_coalescible(TodoUpdate(due_at=None))  # 마감 지우기는 따로 처리
+
+def test_concurrent_updates_share_one_commit(client, signup):
+    headers = signup("alice")
+    ids = [client.post("/todos/", json={"title": f"t{i}"}, headers=headers).json()["id"] for i in range(3)]
+    owner_id = client.get("/me", headers=headers).json()["id"]
+
+    coalescer = WriteCoalescer(window_ms=100)
+    results = {}
+
+    def submit(todo_id, update):
+        results[todo_id] = coalescer.submit(SessionLocal(), owner_id, todo_id, update)
+
+    threads = [
+        threading.Thread(target=submit, args=(ids[0], TodoUpdate(completed=True))),
+        threading.Thread(target=submit, args=(ids[1], TodoUpdate(priority=1))),
+        threading.Thread(target=submit, args=(ids[2], TodoUpdate(title="renamed"))),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert coalescer.stats() == {"requests": 3, "commits": 1, "requests_per_commit": 3.0}
+    assert results[ids[0]].completed is True
+    assert results[ids[1]].priority == 1
+    assert results[ids[2]].title == "renamed"
+    todos = {t["id"]: t for t in client.get("/todos/", headers=headers).json()}
+    assert (todos[ids[0]]["completed"], todos[ids[1]]["priority"], todos[ids[2]]["title"]) == (True, 1, "renamed")
+
+def test_updates_to_same_todo_merge_with_later_values_winning(client, signup):
+    headers = signup("alice")
+    todo_id = client.post("/todos/", json={"title": "t"}, headers=headers).json()["id"]
+    owner_id = client.get("/me", headers=headers).json()["id"]
+
+    coalescer = WriteCoalescer(window_ms=100)
+    results = []
+    first = threading.Thread(target=lambda: results.append(
+        coalescer.submit(SessionLocal(), owner_id, todo_id, TodoUpdate(completed=True, priority=3))
+    ))
+    first.start()
+    while coalescer.stats()["requests"] < 1:  # 첫 요청이 묶음에 들어갈 때까지 기다림
+        time.sleep(0.001)
+    results.append(coalescer.submit(SessionLocal(), owner_id, todo_id, TodoUpdate(priority=1)))
+    first.join()
+
+    assert coalescer.stats()["commits"] == 1
+    assert [(r.completed, r.priority) for r in results] == [(True, 1), (True, 1)]
+
+def test_coalesced_update_of_unknown_todo_is_404(client, signup):
+    headers = signup("alice")
+    response = client.put("/todos/999?coalesce=true", json={"completed": True}, headers=headers)
+    assert response.status_code == 404